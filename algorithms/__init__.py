@@ -2,6 +2,18 @@ from .a_star import AStarPathfinder
 from .dijkstra import DijkstraPathfinder
 from .greedy import GreedyPathfinder
 from .uniform_cost import UniformCostPathfinder
+from .jump_point import JumpPointPathfinder
+from .bidirectional import BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder
+from .hierarchical import HierarchicalPathfinder
+from .d_star_lite import DStarLitePathfinder
+from .wavefront import WavefrontPathfinder
+from .ara_star import ARAStarPathfinder
+from .ida_star import IDAStarPathfinder
+from .fringe_search import FringeSearchPathfinder
+from .sma_star import SMAStarPathfinder
+from .dial import DialPathfinder, DialAStarPathfinder
+from .bfs import BFSPathfinder
+from .auto import AutoPathfinder, elegir_motor
 from .pathfinder_base import PathfinderBase
 
-__all__ = ['AStarPathfinder', 'DijkstraPathfinder', 'GreedyPathfinder', 'UniformCostPathfinder', 'PathfinderBase']
\ No newline at end of file
+__all__ = ['AStarPathfinder', 'DijkstraPathfinder', 'GreedyPathfinder', 'UniformCostPathfinder', 'JumpPointPathfinder', 'BidirectionalAStarPathfinder', 'BidirectionalDijkstraPathfinder', 'HierarchicalPathfinder', 'DStarLitePathfinder', 'WavefrontPathfinder', 'ARAStarPathfinder', 'IDAStarPathfinder', 'FringeSearchPathfinder', 'SMAStarPathfinder', 'DialPathfinder', 'DialAStarPathfinder', 'BFSPathfinder', 'AutoPathfinder', 'elegir_motor', 'PathfinderBase']
\ No newline at end of file
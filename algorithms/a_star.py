@@ -1,46 +1,22 @@
 import pygame # Lo necesitamos para dibujar los textos
 import config
 from algorithms.pathfinder_base import PathfinderBase
-
-class Nodo:
-    """Una clase para representar un nodo en la búsqueda A*."""
-    def __init__(self, padre=None, posicion=None):
-        self.padre = padre      # Nodo desde el cual llegamos (para reconstruir camino)
-        self.posicion = posicion # Coordenadas (x, y) del nodo en la grilla
-
-        # Costos fundamentales de A*:
-        self.g = 0  # Costo real desde el inicio hasta este nodo
-        self.h = 0  # Heurística: estimación del costo desde este nodo al objetivo
-        self.f = 0  # Costo total estimado (f = g + h) - usado para seleccionar nodos
-
-    def __eq__(self, otro):
-        """Dos nodos son iguales si tienen la misma posición."""
-        return self.posicion == otro.posicion
-    
-    # Propiedades para compatibilidad con código existente
-    @property
-    def parent(self):
-        return self.padre
-    
-    @parent.setter
-    def parent(self, valor):
-        self.padre = valor
-    
-    @property
-    def position(self):
-        return self.posicion
-    
-    @position.setter
-    def position(self, valor):
-        self.posicion = valor
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
 
 class AStarPathfinder(PathfinderBase):
-    """Implementa el algoritmo de búsqueda de caminos A*."""
+    """
+    Implementa el algoritmo de búsqueda de caminos A*.
+    `heuristica` elige otra estimación (por ejemplo 'chebyshev' o 'alt'); ver PathfinderBase.
+    """
 
-    def __init__(self, cuadricula, permitir_diagonal=False):
+    def __init__(self, cuadricula, permitir_diagonal=False, heuristica=None):
         super().__init__(cuadricula, permitir_diagonal)
-        self.lista_abierta = []
+        self.heuristica = heuristica
+        self.lista_abierta = ColaPrioridad()
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()  # Índice de la lista cerrada para consultas O(1)
         self.nodo_inicio = None
         self.nodo_final = None
         self.camino = None
@@ -49,11 +25,11 @@ class AStarPathfinder(PathfinderBase):
     # Propiedades para compatibilidad con código existente
     @property
     def open_list(self):
-        return self.lista_abierta
+        return self.lista_abierta.elementos()
     
     @open_list.setter
     def open_list(self, valor):
-        self.lista_abierta = valor
+        self.lista_abierta = self._construir_frontera(valor)
     
     @property
     def closed_list(self):
@@ -62,6 +38,7 @@ class AStarPathfinder(PathfinderBase):
     @closed_list.setter
     def closed_list(self, valor):
         self.lista_cerrada = valor
+        self.posiciones_cerradas = {nodo.posicion for nodo in valor}
     
     @property
     def path(self):
@@ -96,11 +73,16 @@ class AStarPathfinder(PathfinderBase):
         # Crear nodos de inicio y objetivo
         self.nodo_inicio = Nodo(None, pos_inicio)
         self.nodo_final = Nodo(None, pos_final)
+        # Heurística precalculada hacia el objetivo (no cambia durante la búsqueda)
+        self.preparar_heuristica(pos_final)
         
         # Lista abierta: nodos por evaluar (empezamos con el nodo inicial)
-        self.lista_abierta = [self.nodo_inicio]
+        self.lista_abierta = self._construir_frontera([self.nodo_inicio])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
         # Lista cerrada: nodos ya evaluados (inicialmente vacía)
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()
         self.camino = None
         self.terminado = False
         self.iteraciones = 0  # Contador de iteraciones
@@ -113,24 +95,23 @@ class AStarPathfinder(PathfinderBase):
 
         self.iteraciones += 1  # Incrementar contador de iteraciones
 
-        # PASO 1: Encontrar el nodo con el menor costo f en la lista abierta
-        # Este es el nodo más prometedor para expandir
-        nodo_actual = self.lista_abierta[0]
-        indice_actual = 0
-        for indice, elemento in enumerate(self.lista_abierta):
-            if elemento.f < nodo_actual.f:
-                nodo_actual = elemento
-                indice_actual = indice
+        # PASO 1: Extraer el nodo con el menor costo f de la lista abierta
+        # Este es el nodo más prometedor para expandir (el montículo lo entrega en O(log n))
+        nodo_actual = self.lista_abierta.extraer()
 
-        # PASO 2: Mover el nodo actual de lista abierta a lista cerrada
+        # PASO 2: Mover el nodo actual a lista cerrada
         # Esto indica que ya lo hemos evaluado completamente
-        self.lista_abierta.pop(indice_actual)
         self.lista_cerrada.append(nodo_actual)
+        self.posiciones_cerradas.add(nodo_actual.posicion)
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(EXTRAER, nodo_actual))
 
         # PASO 3: Verificar si hemos llegado al objetivo
         if nodo_actual == self.nodo_final:
             self.camino = self._reconstruir_camino(nodo_actual)
             self.terminado = True
+            if self.oyente is not None:
+                self.oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
             return True
 
         # PASO 4: Expandir vecinos del nodo actual
@@ -141,31 +122,31 @@ class AStarPathfinder(PathfinderBase):
         """Procesa los vecinos del nodo actual usando la funcionalidad de la clase base."""
         # Obtener vecinos válidos y sus costos de movimiento desde la clase base
         vecinos_con_costos = self.get_neighbors_and_costs(nodo_actual.posicion)
-        vecinos = []
-        
-        # Crear nodos vecinos con la información de costo
-        for pos_vecino, costo_movimiento in vecinos_con_costos:
-            vecino = Nodo(nodo_actual, pos_vecino)
-            vecino.costo_movimiento = costo_movimiento
-            vecinos.append(vecino)
+        oyente = self.oyente
 
-        # Evaluar cada vecino
-        for vecino in vecinos:
+        # Evaluar cada vecino (solo se crea un Nodo si realmente entra a la lista abierta)
+        for pos_vecino, costo_movimiento in vecinos_con_costos:
             # Ignorar vecinos que ya fueron completamente evaluados
-            if vecino in self.lista_cerrada:
+            if pos_vecino in self.posiciones_cerradas:
                 continue
 
-            # Calcular costos del vecino
-            vecino.g = nodo_actual.g + vecino.costo_movimiento  # Costo real acumulado
-            vecino.h = self.calcular_heuristica(vecino.posicion, self.nodo_final.posicion)  # Estimación al objetivo
-            vecino.f = vecino.g + vecino.h  # Costo total estimado (f = g + h)
+            # Costo real acumulado a través del nodo actual
+            g = nodo_actual.g + costo_movimiento
 
             # Si ya existe un camino mejor a este vecino en lista abierta, ignorarlo
-            if any(nodo_abierto for nodo_abierto in self.lista_abierta if vecino == nodo_abierto and vecino.g >= nodo_abierto.g):
+            # (la lista abierta está indexada por posición, así que la consulta es O(1))
+            nodo_abierto = self.lista_abierta.obtener(pos_vecino)
+            if nodo_abierto is not None and g >= nodo_abierto.g:
                 continue
+
+            # Calcular costos del vecino: estimación al objetivo y costo total (f = g + h)
+            h = self.estimar(pos_vecino)
+            vecino = Nodo(nodo_actual, pos_vecino, g, h, g + h)
             
-            # Agregar vecino a la lista abierta para evaluación futura
-            self.lista_abierta.append(vecino)
+            # Agregar vecino a la lista abierta (reemplaza una entrada peor de la misma posición)
+            self.lista_abierta.insertar(pos_vecino, vecino, self._prioridad(vecino))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if nodo_abierto is None else ACTUALIZAR, vecino))
 
     def encontrar_camino(self, pos_inicio, pos_final):
         """Ejecuta el algoritmo completo de una vez."""
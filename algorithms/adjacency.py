@@ -0,0 +1,86 @@
+from array import array
+
+import config
+from algorithms.pathfinder_base import MOVIMIENTOS_BASICOS, MOVIMIENTOS_DIAGONALES, COSTO_DIAGONAL
+
+
+class TablaAdyacencia:
+    """
+    Tabla de adyacencia precalculada de una cuadrícula en formato CSR.
+
+    Los vecinos de la celda con identificador i (i = y * columnas + x) están en
+    vecinos[desplazamientos[i]:desplazamientos[i + 1]], con sus costos en la misma
+    franja de costos. Se construye una vez por versión de la cuadrícula y modo de
+    movimiento; la cuadrícula la descarta cuando se modifica.
+    """
+    def __init__(self, grilla, permitir_diagonal):
+        self.columnas = grilla.columnas
+        self.filas = grilla.filas
+        self.permitir_diagonal = permitir_diagonal
+        self.version = grilla.version
+
+        # Posición (x, y) de cada identificador, para no crear tuplas en cada consulta
+        self.posiciones = [(i % self.columnas, i // self.columnas) for i in range(self.columnas * self.filas)]
+
+        movimientos = [(dx, dy, 1.0) for dx, dy in MOVIMIENTOS_BASICOS]
+        if permitir_diagonal:
+            movimientos += [(dx, dy, COSTO_DIAGONAL) for dx, dy in MOVIMIENTOS_DIAGONALES]
+
+        celdas = grilla.celdas
+        obstaculo = config.STATE_OBSTACLE
+        columnas, filas = self.columnas, self.filas
+        desplazamientos = array('i', [0])
+        vecinos = array('i')
+        costos = array('d')
+        for y in range(filas):
+            for x in range(columnas):
+                for dx, dy, costo in movimientos:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < columnas and 0 <= ny < filas:
+                        indice_vecino = ny * columnas + nx
+                        if celdas[indice_vecino] != obstaculo:
+                            vecinos.append(indice_vecino)
+                            costos.append(costo)
+                desplazamientos.append(len(vecinos))
+
+        self.desplazamientos = desplazamientos
+        self.vecinos = vecinos
+        self.costos = costos
+        self._celdas = bytes(celdas)  # Estados de esta versión (para los costos de terreno)
+        self._costos_enteros = {}     # escala -> array de costos en punto fijo
+        # Tuplas ((x, y), costo) ya armadas por celda, creadas la primera vez que se consultan
+        self._por_celda = [None] * (columnas * filas)
+
+    def costos_enteros(self, escala=config.FIXED_POINT_SCALE):
+        """
+        Costos de la tabla en punto fijo, alineados con `vecinos`: round(costo · escala) por el
+        factor de terreno de la celda destino (config.TERRAIN_COSTS). Se calculan la primera vez
+        que se piden para cada escala; la tabla se descarta al modificar la cuadrícula.
+        """
+        enteros = self._costos_enteros.get(escala)
+        if enteros is None:
+            terrenos = config.TERRAIN_COSTS
+            celdas = self._celdas
+            enteros = array('q', (round(costo * escala * terrenos.get(celdas[vecino], 1))
+                                  for vecino, costo in zip(self.vecinos, self.costos)))
+            self._costos_enteros[escala] = enteros
+        return enteros
+
+    def vecinos_por_indice(self, indice):
+        """Retorna una lista de tuplas (indice_vecino, costo) de la celda indicada."""
+        inicio, fin = self.desplazamientos[indice], self.desplazamientos[indice + 1]
+        return list(zip(self.vecinos[inicio:fin], self.costos[inicio:fin]))
+
+    def vecinos_y_costos(self, posicion):
+        """
+        Retorna una tupla de pares ((x, y), costo) de la posición indicada.
+        El resultado se guarda por celda, así que las consultas repetidas no generan nada nuevo.
+        """
+        indice = posicion[1] * self.columnas + posicion[0]
+        resultado = self._por_celda[indice]
+        if resultado is None:
+            inicio, fin = self.desplazamientos[indice], self.desplazamientos[indice + 1]
+            posiciones = self.posiciones
+            resultado = tuple((posiciones[v], c) for v, c in zip(self.vecinos[inicio:fin], self.costos[inicio:fin]))
+            self._por_celda[indice] = resultado
+        return resultado
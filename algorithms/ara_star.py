@@ -0,0 +1,227 @@
+import time
+
+import config
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+INFINITO = float('inf')
+
+
+def empalmar_camino(camino_actual, indice, camino_nuevo):
+    """
+    Cambia el resto de un camino que un agente ya está recorriendo por el tramo de
+    `camino_nuevo` que sale de su posición actual (camino_actual[indice - 1]).
+    Conserva lo ya recorrido, así que el índice del agente sigue siendo válido.
+    Retorna None si la posición actual no está en el camino nuevo.
+    """
+    actual = camino_actual[indice - 1]
+    if actual not in camino_nuevo:
+        return None
+    return camino_actual[:indice] + camino_nuevo[camino_nuevo.index(actual) + 1:]
+
+
+class ARAStarPathfinder(PathfinderBase):
+    """
+    Implementa ARA* (A* anytime con peso decreciente).
+
+    Primero busca con la heurística inflada por `peso_inicial`, lo que encuentra
+    rápido un camino de costo a lo sumo peso veces el óptimo. Luego baja el peso de
+    a `decremento` y vuelve a buscar reutilizando todo lo ya calculado: solo se
+    reabren las celdas cuyo g mejoró después de cerrarse (las inconsistentes). Con
+    peso 1 el camino es óptimo.
+
+    - mejorar(presupuesto) avanza hasta agotar el tiempo dado (por ejemplo, un frame).
+    - cota es la garantía actual: el camino cuesta a lo sumo cota veces el óptimo.
+    - encontrar_camino corre hasta el camino óptimo, como los demás algoritmos.
+    """
+
+    def __init__(self, grid, allow_diagonal=False, peso_inicial=config.ARA_INITIAL_WEIGHT,
+                 decremento=config.ARA_WEIGHT_STEP):
+        super().__init__(grid, allow_diagonal)
+        self.peso_inicial = peso_inicial
+        self.decremento = decremento
+        self.peso = peso_inicial
+        self.g = {}
+        self.padres = {}            # Posición -> posición anterior en el mejor camino conocido
+        self.lista_abierta = ColaPrioridad()
+        self.cerradas = set()       # Celdas cerradas en la fase actual
+        self.inconsistentes = {}    # Celdas que mejoraron ya cerradas: se reabren en la próxima fase
+        self.lista_cerrada = []     # Todas las expansiones de la búsqueda (todas las fases)
+        self.posicion_fin = None
+        self.camino = None
+        self.costo_camino = INFINITO
+        self.cota = INFINITO
+        self.soluciones = 0         # Cantidad de caminos encontrados (cada uno mejor que el anterior)
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.lista_abierta.elementos() + list(self.inconsistentes.values())
+
+    @property
+    def closed_list(self):
+        return self.lista_cerrada
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    @property
+    def suboptimality_bound(self):
+        return self.cota
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara una búsqueda nueva con el peso inicial."""
+        self.preparar_heuristica(pos_final)
+        self.peso = self.peso_inicial
+        self.posicion_fin = pos_final
+        self.g = {pos_inicio: 0}
+        self.padres = {pos_inicio: None}
+        h = self.estimar(pos_inicio)
+        self.lista_abierta = self._construir_frontera([Nodo(None, pos_inicio, 0, h, self.peso * h)])
+        if self.oyente is not None:
+            self.oyente(EventoBusqueda(INSERTAR, pos_inicio, 0, None))
+        self.cerradas = set()
+        self.inconsistentes = {}
+        self.lista_cerrada = []
+        self.camino = None
+        self.costo_camino = INFINITO
+        self.cota = INFINITO
+        self.soluciones = 0
+        self.terminado = False
+        self.iteraciones = 0
+
+    def paso(self):
+        """Ejecuta una iteración: expande una celda o, si la fase terminó, baja el peso."""
+        if self.terminado:
+            return False
+
+        costo_fin = self.g.get(self.posicion_fin, INFINITO)
+        if not self.lista_abierta or costo_fin <= self.lista_abierta.ver_minimo()[0]:
+            return self._terminar_fase()
+
+        self.iteraciones += 1
+
+        # PASO 1: Cerrar la celda con menor f = g + peso * h
+        nodo_actual = self.lista_abierta.extraer()
+        posicion = nodo_actual.posicion
+        self.cerradas.add(posicion)
+        self.lista_cerrada.append(nodo_actual)
+        oyente = self.oyente
+        if oyente is not None:
+            oyente(evento_de_nodo(EXTRAER, nodo_actual))
+
+        # PASO 2: Relajar los vecinos; los ya cerrados en esta fase esperan a la siguiente
+        g_actual = self.g[posicion]
+        for pos_vecino, costo_movimiento in self.get_neighbors_and_costs(posicion):
+            g = g_actual + costo_movimiento
+            g_previo = self.g.get(pos_vecino, INFINITO)
+            if g >= g_previo:
+                continue
+            self.g[pos_vecino] = g
+            self.padres[pos_vecino] = posicion
+            h = self.estimar(pos_vecino)
+            vecino = Nodo(nodo_actual, pos_vecino, g, h, g + self.peso * h)
+            if pos_vecino in self.cerradas:
+                self.inconsistentes[pos_vecino] = vecino
+            else:
+                self.lista_abierta.insertar(pos_vecino, vecino, self._prioridad(vecino))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if g_previo == INFINITO else ACTUALIZAR, vecino))
+        return True
+
+    def _terminar_fase(self):
+        """Guarda el camino de la fase, actualiza la cota y prepara la siguiente con menos peso."""
+        costo_fin = self.g.get(self.posicion_fin, INFINITO)
+        if costo_fin == INFINITO:
+            self.terminado = True  # No hay camino
+            return False
+
+        if costo_fin < self.costo_camino:
+            self.costo_camino = costo_fin
+            self.camino = self._reconstruir_camino()
+            self.soluciones += 1
+            if self.oyente is not None:
+                self.oyente(EventoBusqueda(OBJETIVO, self.posicion_fin, costo_fin, None))
+
+        # Cota: el costo óptimo es al menos el menor g + h de las celdas por revisar
+        pendientes = self.open_list
+        minimo = min((nodo.g + nodo.h for nodo in pendientes), default=costo_fin)
+        if costo_fin == 0 or minimo >= costo_fin:
+            self.cota = 1.0
+        else:
+            self.cota = max(1.0, min(self.peso, costo_fin / minimo if minimo > 0 else self.peso))
+        if self.cota <= 1.0 or self.peso <= 1.0:
+            self.cota = 1.0
+            self.terminado = True
+            return True
+
+        # Nueva fase: menos peso, reabrir las inconsistentes y reordenar la lista abierta
+        self.peso = max(1.0, self.peso - self.decremento)
+        for nodo in pendientes:
+            nodo.f = nodo.g + self.peso * nodo.h
+        self.lista_abierta = self._construir_frontera(pendientes)
+        self.inconsistentes = {}
+        self.cerradas = set()
+        return True
+
+    def mejorar(self, presupuesto):
+        """
+        Sigue buscando durante a lo sumo `presupuesto` segundos (o hasta terminar).
+        Retorna True si en ese tiempo encontró un camino mejor que el que tenía.
+        """
+        limite = time.perf_counter() + presupuesto
+        soluciones = self.soluciones
+        while time.perf_counter() < limite and self.paso():
+            pass
+        return self.soluciones > soluciones
+
+    def buscar_primera_solucion(self, pos_inicio, pos_final):
+        """Empieza una búsqueda y avanza solo hasta el primer camino (el de peso inicial)."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.soluciones == 0 and self.paso():
+            pass
+        return self.camino
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo hasta el camino óptimo."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
+
+    def _reconstruir_camino(self):
+        """Sigue los padres desde el objetivo hasta el inicio."""
+        camino = []
+        actual = self.posicion_fin
+        while actual is not None:
+            camino.append(actual)
+            actual = self.padres[actual]
+        return camino[::-1]
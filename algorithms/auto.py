@@ -0,0 +1,129 @@
+import config
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.a_star import AStarPathfinder
+from algorithms.bfs import BFSPathfinder
+from algorithms.dial import DialAStarPathfinder
+
+
+def elegir_motor(grilla, permitir_diagonal):
+    """
+    Elige el motor óptimo más rápido para la cuadrícula según sus propiedades: costos de
+    terreno, movimiento diagonal, celdas libres y proporción de obstáculos.
+    Retorna (clase, nombre, motivo); el nombre es el que muestran las escenas.
+
+    Los umbrales salen de config (medidos con utils/benchmark.py --auto). JPS y las búsquedas
+    bidireccionales no figuran porque en esas mediciones nunca fueron las más rápidas.
+    """
+    celdas = grilla.celdas
+    total = len(celdas)
+    obstaculos = celdas.count(config.STATE_OBSTACLE)
+    libres = total - obstaculos
+    densidad = obstaculos / total if total else 0.0
+
+    terrenos = config.TERRAIN_COSTS
+    if any(terrenos.get(estado, 1) != 1 for estado in set(celdas) if estado != config.STATE_OBSTACLE):
+        # Los motores de montículo y BFS ignoran el terreno: solo los de costos enteros dan el óptimo
+        return DialAStarPathfinder, "A* Dial", "terreno con costos distintos"
+    if not permitir_diagonal:
+        if densidad < config.AUTO_DIAL_MIN_DENSITY:
+            # Casi sin obstáculos la heurística guía sola a A*: BFS recorrería todo el mapa
+            return AStarPathfinder, "A*", f"4-conexa casi sin obstáculos ({densidad:.0%})"
+        if libres <= config.AUTO_BFS_MAX_FREE_CELLS:
+            return BFSPathfinder, "BFS", f"4-conexa, costo uniforme, {libres} celdas libres"
+        return DialAStarPathfinder, "A* Dial", f"4-conexa grande, {densidad:.0%} de obstáculos"
+    if densidad >= config.AUTO_DIAL_MIN_DENSITY_DIAGONAL:
+        return DialAStarPathfinder, "A* Dial", f"diagonal y muy cerrada ({densidad:.0%} de obstáculos)"
+    return AStarPathfinder, "A*", f"diagonal, {densidad:.0%} de obstáculos"
+
+
+class AutoPathfinder(PathfinderBase):
+    """
+    Delega cada búsqueda en el motor que elige elegir_motor para la cuadrícula actual.
+
+    La elección se repite solo cuando la cuadrícula cambia (versión) y queda registrada en
+    nombre_motor y motivo. Las listas, el camino y las iteraciones son los del motor elegido.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.motor = None          # Instancia del motor elegido
+        self.nombre_motor = None   # Nombre del motor elegido (como en las escenas)
+        self.motivo = None         # Por qué se eligió
+        self._version_elegida = None
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.motor.open_list if self.motor is not None else []
+
+    @property
+    def closed_list(self):
+        return self.motor.closed_list if self.motor is not None else []
+
+    @property
+    def path(self):
+        return self.motor.path if self.motor is not None else None
+
+    @property
+    def is_finished(self):
+        return self.motor is not None and self.motor.is_finished
+
+    @property
+    def chosen_engine(self):
+        return self.nombre_motor
+
+    @property
+    def reason(self):
+        return self.motivo
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def elegir(self):
+        """Elige el motor para la cuadrícula actual (si cambió desde la última vez) y lo retorna."""
+        if self.motor is None or self._version_elegida != self.grid.version:
+            clase, self.nombre_motor, self.motivo = elegir_motor(self.grid, self.allow_diagonal)
+            if type(self.motor) is not clase:
+                self.motor = clase(self.grid, self.allow_diagonal)
+            self._version_elegida = self.grid.version
+        return self.motor
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Elige el motor y prepara su búsqueda."""
+        motor = self.elegir()
+        motor.oyente = self.oyente
+        motor.initialize_search(pos_inicio, pos_final)
+        self.iteraciones = motor.iterations
+
+    def paso(self):
+        """Ejecuta una iteración del motor elegido."""
+        motor = self.motor
+        if motor is None:
+            return False  # No hay búsqueda iniciada
+        motor.oyente = self.oyente  # iterar_eventos cambia el oyente durante la búsqueda
+        avanzo = motor.step()
+        self.iteraciones = motor.iterations
+        return avanzo
+
+    def capturar_estado(self):
+        return self.motor.capturar_estado() if self.motor is not None else None
+
+    def restaurar_estado(self, estado):
+        if self.motor is not None:
+            self.motor.restaurar_estado(estado)
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.path
@@ -0,0 +1,193 @@
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+
+# Estado de cada proceso de trabajo: se fija una sola vez al crearlo (ver _iniciar_trabajador)
+_grilla_trabajador = None
+_clase_trabajador = None
+_diagonal_trabajador = False
+_generacion_trabajador = None  # Generación vigente de BuscadorParalelo (compartida entre procesos)
+
+
+class ResultadoConsulta:
+    """Camino de una consulta (inicio, fin) del lote y estadísticas de la búsqueda que lo produjo."""
+    __slots__ = ('indice', 'inicio', 'fin', 'camino', 'iteraciones', 'nodos_expandidos', 'tiempo_ms')
+
+    def __init__(self, indice, inicio, fin, camino, iteraciones, nodos_expandidos, tiempo_ms):
+        self.indice = indice              # Posición de la consulta en la lista original
+        self.inicio = inicio
+        self.fin = fin
+        self.camino = camino              # Lista de posiciones, o None si no hay camino
+        self.iteraciones = iteraciones
+        self.nodos_expandidos = nodos_expandidos
+        self.tiempo_ms = tiempo_ms        # Tiempo de la búsqueda dentro del proceso de trabajo
+
+
+def _iniciar_trabajador(grilla, clase_algoritmo, permitir_diagonal):
+    """Guarda la cuadrícula en el proceso: viaja una vez por proceso y no una vez por consulta."""
+    global _grilla_trabajador, _clase_trabajador, _diagonal_trabajador
+    _grilla_trabajador = grilla
+    _clase_trabajador = clase_algoritmo
+    _diagonal_trabajador = permitir_diagonal
+
+
+def _resolver_lote(consultas):
+    """
+    Resuelve en el proceso de trabajo una lista de (índice, inicio, fin). Las tablas derivadas de la
+    cuadrícula (adyacencia, campos de distancia, puntos de referencia) quedan cacheadas en el proceso
+    y se reutilizan en las consultas siguientes.
+    """
+    resultados = []
+    for indice, inicio, fin in consultas:
+        buscador = _clase_trabajador(_grilla_trabajador, _diagonal_trabajador)
+        comienzo = time.perf_counter()
+        camino = buscador.find_path(inicio, fin)
+        transcurrido = (time.perf_counter() - comienzo) * 1000
+        resultados.append(ResultadoConsulta(indice, inicio, fin, list(camino) if camino else None,
+                                            buscador.iterations, len(buscador.closed_list), transcurrido))
+    return resultados
+
+
+def _iniciar_cancelable(generacion):
+    global _generacion_trabajador
+    _generacion_trabajador = generacion
+
+
+def _preparar():
+    """Tarea vacía: obliga a crear el proceso antes de que llegue la primera búsqueda."""
+    return os.getpid()
+
+
+def _resolver_cancelable(grilla, clase_algoritmo, permitir_diagonal, inicio, fin, generacion, pasos_por_control):
+    """
+    Ejecuta la búsqueda por tramos de `pasos_por_control` pasos y la abandona (retorna None)
+    si entre tramos la generación compartida dejó de ser la de esta tarea.
+    """
+    buscador = clase_algoritmo(grilla, permitir_diagonal)
+    comienzo = time.perf_counter()
+    buscador.initialize_search(inicio, fin)
+    while buscador.run_steps(pasos_por_control) == pasos_por_control:
+        if _generacion_trabajador.value != generacion:
+            return None
+    transcurrido = (time.perf_counter() - comienzo) * 1000
+    camino = buscador.path
+    return ResultadoConsulta(0, inicio, fin, list(camino) if camino else None,
+                             buscador.iterations, len(buscador.closed_list), transcurrido)
+
+
+class BuscadorParalelo:
+    """
+    Ejecuta búsquedas sueltas en procesos de trabajo para no congelar el frame mientras corren.
+
+    `enviar` retorna un Future cuyo resultado es un ResultadoConsulta, o None si la búsqueda se
+    canceló. `cancelar` anula todas las búsquedas enviadas hasta el momento: las que no empezaron
+    no se ejecutan y las que están corriendo se abandonan en el siguiente control. Los procesos
+    siguen vivos para las búsquedas siguientes hasta llamar a `cerrar`.
+    """
+
+    def __init__(self, procesos=2, pasos_por_control=config.PARALLEL_CANCEL_CHECK_STEPS):
+        contexto = multiprocessing.get_context('spawn')
+        self.procesos = procesos
+        self.pasos_por_control = pasos_por_control
+        self.generacion = contexto.Value('i', 0)
+        self.futuros = []
+        self.ejecutor = ProcessPoolExecutor(
+            max_workers=procesos,
+            mp_context=contexto,
+            initializer=_iniciar_cancelable,
+            initargs=(self.generacion,),
+        )
+
+    def preparar(self):
+        """Arranca los procesos de antemano (crearlos tarda más que una búsqueda en un mapa chico)."""
+        for _ in range(self.procesos):
+            self.ejecutor.submit(_preparar)
+
+    def enviar(self, grilla, clase_algoritmo, permitir_diagonal, inicio, fin):
+        """Envía la búsqueda de inicio a fin con clase_algoritmo(grilla, permitir_diagonal)."""
+        futuro = self.ejecutor.submit(_resolver_cancelable, grilla, clase_algoritmo, permitir_diagonal,
+                                      inicio, fin, self.generacion.value, self.pasos_por_control)
+        self.futuros = [pendiente for pendiente in self.futuros if not pendiente.done()]
+        self.futuros.append(futuro)
+        return futuro
+
+    def cancelar(self):
+        with self.generacion.get_lock():
+            self.generacion.value += 1
+        for futuro in self.futuros:
+            futuro.cancel()
+        self.futuros = []
+
+    def cerrar(self):
+        self.cancelar()
+        self.ejecutor.shutdown(wait=True, cancel_futures=True)
+
+
+class ConsultorLotes:
+    """
+    Reparte consultas de camino sobre una cuadrícula entre varios procesos.
+
+    Cada proceso recibe la cuadrícula, el algoritmo y el modo de movimiento al arrancar, así que las
+    tareas solo llevan los pares (inicio, fin). Las consultas se agrupan en tareas de `tamano_lote`
+    para no pagar la comunicación entre procesos por cada una. Los procesos se crean con 'spawn'
+    (no heredan el estado de pygame del proceso principal) y se reutilizan entre llamadas a
+    `consultar` mientras el consultor siga abierto.
+
+    `clase_algoritmo` se construye como clase_algoritmo(grilla, permitir_diagonal) y tiene que poder
+    enviarse a otro proceso (una clase o función definida a nivel de módulo).
+    """
+
+    def __init__(self, grilla, clase_algoritmo, permitir_diagonal=False,
+                 procesos=config.BATCH_WORKERS, tamano_lote=config.BATCH_CHUNK_SIZE):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tamano_lote = max(1, tamano_lote)
+        self.ejecutor = ProcessPoolExecutor(
+            max_workers=self.procesos,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_iniciar_trabajador,
+            initargs=(grilla, clase_algoritmo, permitir_diagonal),
+        )
+
+    def consultar(self, pares):
+        """
+        Generador de ResultadoConsulta, uno por cada (inicio, fin) de `pares`, en el orden en que
+        terminan (no en el de la lista; `indice` indica a qué consulta corresponde). Si se deja de
+        iterar antes de terminar, las tareas que todavía no empezaron se cancelan.
+        """
+        consultas = [(indice, tuple(inicio), tuple(fin)) for indice, (inicio, fin) in enumerate(pares)]
+        if not consultas:
+            return
+        # Con pocas consultas se achican las tareas para que todos los procesos reciban trabajo
+        tamano = min(self.tamano_lote, math.ceil(len(consultas) / self.procesos))
+        futuros = [self.ejecutor.submit(_resolver_lote, consultas[i:i + tamano])
+                   for i in range(0, len(consultas), tamano)]
+        try:
+            for futuro in as_completed(futuros):
+                yield from futuro.result()
+        finally:
+            for futuro in futuros:
+                futuro.cancel()
+
+    def cerrar(self):
+        """Termina los procesos de trabajo (descarta las tareas que no empezaron)."""
+        self.ejecutor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+def consultar_en_lote(grilla, pares, clase_algoritmo, permitir_diagonal=False,
+                      procesos=config.BATCH_WORKERS, tamano_lote=config.BATCH_CHUNK_SIZE):
+    """
+    Resuelve todas las consultas (inicio, fin) de `pares` con un ConsultorLotes de un solo uso y
+    entrega cada ResultadoConsulta apenas está listo.
+    """
+    with ConsultorLotes(grilla, clase_algoritmo, permitir_diagonal, procesos, tamano_lote) as consultor:
+        yield from consultor.consultar(pares)
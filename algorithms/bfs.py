@@ -0,0 +1,141 @@
+from collections import deque
+
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, EXTRAER, INSERTAR, OBJETIVO
+
+
+class BFSPathfinder(PathfinderBase):
+    """
+    Búsqueda en anchura con una deque sobre la tabla de adyacencia.
+
+    Minimiza la cantidad de movimientos, no el costo: solo da el camino óptimo cuando todos los
+    movimientos cuestan lo mismo (sin diagonales y sin factores de terreno, ver
+    config.TERRAIN_COSTS). En ese caso encuentra caminos del mismo costo que Dijkstra sin
+    cola de prioridad ni comparaciones: cada celda entra una sola vez y nunca se actualiza.
+    Como con diagonales no da el óptimo, no se ofrece como algoritmo suelto en las escenas:
+    solo lo elige AutoPathfinder, y únicamente sin diagonales.
+
+    La lista abierta y la cerrada son de solo lectura: se arman con Nodo al pedirlas.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.tabla = None             # Tabla de adyacencia de la búsqueda actual
+        self.cola = deque()           # Índices descubiertos que falta expandir, en orden
+        self.pasos = {}               # Índice de celda -> movimientos desde el inicio
+        self.padres = {}              # Índice de celda -> índice del padre
+        self.cerradas = []            # Índices expandidos, en orden
+        self.indice_fin = None
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        posicion = self.grid.posicion
+        return [Nodo(None, posicion(indice), self.pasos[indice]) for indice in self.cola]
+
+    @property
+    def closed_list(self):
+        posicion = self.grid.posicion
+        return [Nodo(None, posicion(indice), self.pasos[indice]) for indice in self.cerradas]
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.tabla = self.grid.obtener_adyacencia(self.allow_diagonal)
+        self.indice_fin = self.grid.indice(pos_final)
+        indice_inicio = self.grid.indice(pos_inicio)
+        self.cola = deque([indice_inicio])
+        self.pasos = {indice_inicio: 0}
+        self.padres = {indice_inicio: None}
+        self.cerradas = []
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+        if self.oyente is not None:
+            self.oyente(EventoBusqueda(INSERTAR, pos_inicio, 0.0, None))
+
+    def paso(self):
+        """Ejecuta una iteración: expande la celda más antigua de la cola y descubre sus vecinos."""
+        if self.terminado or not self.cola:
+            return False  # Terminó o no hay camino
+
+        indice = self.cola.popleft()
+        self.iteraciones += 1
+        self.cerradas.append(indice)
+        g = self.pasos[indice]
+        oyente = self.oyente
+        posicion = self.grid.posicion
+        if oyente is not None:
+            padre = self.padres[indice]
+            oyente(EventoBusqueda(EXTRAER, posicion(indice), float(g),
+                                  posicion(padre) if padre is not None else None))
+
+        if indice == self.indice_fin:
+            self.camino = self._reconstruir_camino()
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, posicion(indice), float(g), None))
+            return True
+
+        tabla = self.tabla
+        vecinos = tabla.vecinos
+        pasos = self.pasos
+        padres = self.padres
+        cola = self.cola
+        for k in range(tabla.desplazamientos[indice], tabla.desplazamientos[indice + 1]):
+            vecino = vecinos[k]
+            if vecino in pasos:
+                continue  # Ya descubierto: en anchura nunca mejora
+            pasos[vecino] = g + 1
+            padres[vecino] = indice
+            cola.append(vecino)
+            if oyente is not None:
+                oyente(EventoBusqueda(INSERTAR, posicion(vecino), float(g + 1), posicion(indice)))
+        return True
+
+    def _reconstruir_camino(self):
+        """Sigue los padres desde el objetivo hasta el inicio."""
+        posicion = self.grid.posicion
+        camino = []
+        actual = self.indice_fin
+        while actual is not None:
+            camino.append(posicion(actual))
+            actual = self.padres[actual]
+        return camino[::-1]
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
@@ -0,0 +1,243 @@
+import config
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+
+class BidirectionalPathfinder(PathfinderBase):
+    """
+    Base de las búsquedas bidireccionales: una búsqueda avanza desde el inicio
+    (ida) y otra desde el objetivo (vuelta) hasta que se encuentran.
+
+    Cada paso expande un nodo del lado con la frontera más pequeña. Cuando una
+    arista conecta un nodo de un lado con uno ya alcanzado por el otro, se anota
+    el costo del camino completo (mu). La búsqueda termina cuando el criterio de
+    parada de la subclase garantiza que ningún camino puede ser mejor que mu.
+
+    Los movimientos de la cuadrícula son simétricos, así que la búsqueda de vuelta
+    usa los mismos vecinos y costos que la de ida. En sus eventos, g se mide desde el objetivo.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.frontera_ida = ColaPrioridad()
+        self.frontera_vuelta = ColaPrioridad()
+        self.cerrados_ida = {}     # posición -> nodo cerrado por la búsqueda de ida
+        self.cerrados_vuelta = {}  # posición -> nodo cerrado por la búsqueda de vuelta
+        self.lista_cerrada = []    # Ambos lados, en orden de expansión (para las escenas)
+        self.mejor_costo = float('inf')  # mu: costo del mejor camino encontrado
+        self.encuentro = None      # (nodo_ida, nodo_vuelta) que forman ese camino
+        self.nodo_inicio = None
+        self.nodo_fin = None
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.frontera_ida.elementos() + self.frontera_vuelta.elementos()
+
+    @open_list.setter
+    def open_list(self, valor):
+        # Cada nodo pertenece al lado cuya raíz (inicio u objetivo) alcanza siguiendo a sus padres
+        self.frontera_ida = self._construir_frontera([nodo for nodo in valor if self._es_de_ida(nodo)])
+        self.frontera_vuelta = self._construir_frontera([nodo for nodo in valor if not self._es_de_ida(nodo)])
+        self._recalcular_encuentro()
+
+    @property
+    def closed_list(self):
+        return self.lista_cerrada
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self.lista_cerrada = valor
+        self.cerrados_ida = {nodo.posicion: nodo for nodo in valor if self._es_de_ida(nodo)}
+        self.cerrados_vuelta = {nodo.posicion: nodo for nodo in valor if not self._es_de_ida(nodo)}
+        self._recalcular_encuentro()
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Prepara ambas búsquedas (desde el inicio y desde el objetivo)."""
+        self.nodo_inicio = self._crear_nodo(None, start_pos, 0, end_pos)
+        self.nodo_fin = self._crear_nodo(None, end_pos, 0, start_pos)
+        self.cerrados_ida = {}
+        self.cerrados_vuelta = {}
+        self.lista_cerrada = []
+        self.mejor_costo = float('inf')
+        self.encuentro = None
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+
+        # Un extremo sobre un obstáculo no se puede sembrar como raíz de una frontera: no hay camino
+        if (self.grid.obtener_estado(start_pos) == config.STATE_OBSTACLE
+                or self.grid.obtener_estado(end_pos) == config.STATE_OBSTACLE):
+            self.frontera_ida = ColaPrioridad()
+            self.frontera_vuelta = ColaPrioridad()
+            self.terminado = True
+            return
+
+        self.frontera_ida = self._construir_frontera([self.nodo_inicio])
+        self.frontera_vuelta = self._construir_frontera([self.nodo_fin])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_fin))
+        if start_pos == end_pos:
+            self.mejor_costo = 0
+            self.encuentro = (self.nodo_inicio, self.nodo_fin)
+
+    def step(self):
+        """Ejecuta una iteración: comprueba el criterio de parada o expande un nodo de un lado."""
+        if self.terminado:
+            return False
+        if not self.frontera_ida or not self.frontera_vuelta:
+            # Un lado agotó todo lo alcanzable: el mejor encuentro (si existe) es el óptimo
+            if self.encuentro is None:
+                return False
+            self._finalizar()
+            return True
+
+        self.iteraciones += 1
+
+        # PASO 1: Criterio de parada - ningún camino restante puede mejorar mu
+        prioridad_ida, _ = self.frontera_ida.ver_minimo()
+        prioridad_vuelta, _ = self.frontera_vuelta.ver_minimo()
+        if self.encuentro is not None and self._puede_terminar(prioridad_ida, prioridad_vuelta):
+            self._finalizar()
+            return True
+
+        # PASO 2: Expandir el lado con la frontera más pequeña
+        if len(self.frontera_ida) <= len(self.frontera_vuelta):
+            self._expandir(self.frontera_ida, self.cerrados_ida, self.frontera_vuelta, self.cerrados_vuelta,
+                           self.nodo_fin.posicion, True)
+        else:
+            self._expandir(self.frontera_vuelta, self.cerrados_vuelta, self.frontera_ida, self.cerrados_ida,
+                           self.nodo_inicio.posicion, False)
+        return True
+
+    def find_path(self, start_pos, end_pos):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.initialize_search(start_pos, end_pos)
+        while self.step():
+            pass
+        return self.camino
+
+    def _puede_terminar(self, prioridad_ida, prioridad_vuelta):
+        """Criterio de parada según las prioridades mínimas de cada frontera."""
+        raise NotImplementedError
+
+    def _crear_nodo(self, padre, posicion, g, destino):
+        """Crea el nodo de una búsqueda que se dirige a `destino`."""
+        raise NotImplementedError
+
+    def _expandir(self, frontera, cerrados, frontera_otra, cerrados_otra, destino, es_ida):
+        """Expande el mejor nodo de un lado y anota los encuentros con el otro."""
+        nodo_actual = frontera.extraer()
+        cerrados[nodo_actual.posicion] = nodo_actual
+        self.lista_cerrada.append(nodo_actual)
+        oyente = self.oyente
+        if oyente is not None:
+            oyente(evento_de_nodo(EXTRAER, nodo_actual))
+
+        for posicion_vecino, costo_movimiento in self.get_neighbors_and_costs(nodo_actual.posicion):
+            if posicion_vecino in cerrados:
+                continue
+            g = nodo_actual.g + costo_movimiento
+
+            # ¿El otro lado ya alcanzó este vecino? Entonces hay un camino completo
+            nodo_otro = cerrados_otra.get(posicion_vecino) or frontera_otra.obtener(posicion_vecino)
+            if nodo_otro is not None and g + nodo_otro.g < self.mejor_costo:
+                self.mejor_costo = g + nodo_otro.g
+                self.encuentro = (nodo_actual, nodo_otro) if es_ida else (nodo_otro, nodo_actual)
+
+            nodo_abierto = frontera.obtener(posicion_vecino)
+            if nodo_abierto is not None and g >= nodo_abierto.g:
+                continue
+            vecino = self._crear_nodo(nodo_actual, posicion_vecino, g, destino)
+            frontera.insertar(posicion_vecino, vecino, self._prioridad(vecino))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if nodo_abierto is None else ACTUALIZAR, vecino))
+
+    def _finalizar(self):
+        """Une las dos mitades del camino en el punto de encuentro."""
+        nodo_ida, nodo_vuelta = self.encuentro
+        camino = []
+        actual = nodo_ida
+        while actual is not None:
+            camino.append(actual.posicion)
+            actual = actual.padre
+        camino.reverse()
+
+        actual = nodo_vuelta
+        if actual.posicion == camino[-1]:
+            actual = actual.padre  # El encuentro fue en un mismo nodo: no repetirlo
+        while actual is not None:
+            camino.append(actual.posicion)
+            actual = actual.padre
+
+        self.camino = camino
+        self.terminado = True
+        if self.oyente is not None:
+            self.oyente(EventoBusqueda(OBJETIVO, self.nodo_fin.posicion, self.mejor_costo, None))
+
+    def _es_de_ida(self, nodo):
+        """True si el nodo pertenece a la búsqueda que parte del inicio."""
+        while nodo.padre is not None:
+            nodo = nodo.padre
+        return nodo.posicion == self.nodo_inicio.posicion
+
+    def _recalcular_encuentro(self):
+        """Recalcula mu a partir de las posiciones alcanzadas por ambos lados (tras restaurar listas)."""
+        self.mejor_costo = float('inf')
+        self.encuentro = None
+        alcanzados_vuelta = {nodo.posicion: nodo for nodo in self.frontera_vuelta}
+        alcanzados_vuelta.update(self.cerrados_vuelta)
+        alcanzados_ida = {nodo.posicion: nodo for nodo in self.frontera_ida}
+        alcanzados_ida.update(self.cerrados_ida)
+        for posicion, nodo_ida in alcanzados_ida.items():
+            nodo_vuelta = alcanzados_vuelta.get(posicion)
+            if nodo_vuelta is not None and nodo_ida.g + nodo_vuelta.g < self.mejor_costo:
+                self.mejor_costo = nodo_ida.g + nodo_vuelta.g
+                self.encuentro = (nodo_ida, nodo_vuelta)
+
+
+class BidirectionalDijkstraPathfinder(BidirectionalPathfinder):
+    """Dijkstra bidireccional: ambas fronteras se ordenan por g."""
+
+    def _crear_nodo(self, padre, posicion, g, destino):
+        return Nodo(padre, posicion, g, 0, g)
+
+    def _puede_terminar(self, prioridad_ida, prioridad_vuelta):
+        # Cualquier camino no descubierto cuesta al menos g_min(ida) + g_min(vuelta)
+        return prioridad_ida + prioridad_vuelta >= self.mejor_costo
+
+
+class BidirectionalAStarPathfinder(BidirectionalPathfinder):
+    """
+    A* bidireccional: la ida usa h(n, objetivo) y la vuelta h(n, inicio).
+    Termina cuando el menor f de alguna de las dos fronteras alcanza mu, ya que con
+    una heurística admisible ningún camino que pase por esa frontera puede ser mejor.
+    """
+
+    def _crear_nodo(self, padre, posicion, g, destino):
+        h = self.calcular_heuristica(posicion, destino)
+        return Nodo(padre, posicion, g, h, g + h)
+
+    def _puede_terminar(self, prioridad_ida, prioridad_vuelta):
+        return max(prioridad_ida, prioridad_vuelta) >= self.mejor_costo
@@ -0,0 +1,406 @@
+import heapq
+import itertools
+import time
+from collections import deque
+
+import config
+
+INFINITO = float('inf')
+
+
+class TablaReservas:
+    """
+    Tabla de reservas espacio-temporal compartida por los agentes.
+
+    Guarda qué agente ocupa cada celda en cada instante y qué movimientos hace
+    (origen, destino, instante de salida), para detectar tanto dos agentes en la misma
+    celda como dos agentes que se cruzan intercambiando lugares.
+    """
+
+    def __init__(self):
+        self.celdas = {}       # (posición, t) -> agente
+        self.movimientos = {}  # (origen, destino, t) -> agente que sale de origen en t
+        self.claves = {}       # agente -> (claves de celdas, claves de movimientos) para liberarlas juntas
+
+    def __len__(self):
+        return len(self.celdas)
+
+    def reservar_camino(self, agente, camino, t_inicio):
+        """Reserva camino[k] en el instante t_inicio + k y los movimientos entre esas celdas."""
+        claves_celdas, claves_movimientos = self.claves.setdefault(agente, ([], []))
+        anterior = None
+        for k, posicion in enumerate(camino):
+            clave = (posicion, t_inicio + k)
+            self.celdas[clave] = agente
+            claves_celdas.append(clave)
+            if anterior is not None:
+                movimiento = (anterior, posicion, t_inicio + k - 1)
+                self.movimientos[movimiento] = agente
+                claves_movimientos.append(movimiento)
+            anterior = posicion
+
+    def liberar(self, agente):
+        """Quita todas las reservas del agente."""
+        claves = self.claves.pop(agente, None)
+        if claves is None:
+            return
+        claves_celdas, claves_movimientos = claves
+        for clave in claves_celdas:
+            if self.celdas.get(clave) == agente:
+                del self.celdas[clave]
+        for clave in claves_movimientos:
+            if self.movimientos.get(clave) == agente:
+                del self.movimientos[clave]
+
+    def ocupante(self, posicion, t):
+        """Agente que reservó la celda en el instante t (None si está libre)."""
+        return self.celdas.get((posicion, t))
+
+    def libre(self, agente, origen, destino, t):
+        """True si `agente` puede ir de origen (en t) a destino (en t + 1) sin chocar ni cruzarse con otro."""
+        ocupante = self.celdas.get((destino, t + 1))
+        if ocupante is not None and ocupante != agente:
+            return False
+        cruce = self.movimientos.get((destino, origen, t))
+        return cruce is None or cruce == agente
+
+
+class PlanificadorCooperativo:
+    """
+    Planifica caminos sin choques para varios agentes en una misma cuadrícula
+    (WHCA*: A* cooperativo con ventana y tabla de reservas).
+
+    Cada agente busca con A* en espacio-tiempo (celda, instante), pudiendo esperar en
+    su lugar, y evita las celdas y movimientos que los demás ya reservaron. Solo se
+    planifica una ventana de `ventana` pasos: en el borde de la ventana la búsqueda
+    termina y el resto se estima con la distancia exacta del campo de distancias de la
+    cuadrícula. Ese campo es la heurística y, como la tabla de adyacencia, la cuadrícula
+    lo guarda y lo comparten todos los agentes con el mismo objetivo.
+
+    Al final de su ventana cada agente queda reservado en la última celda hasta después
+    de la ventana siguiente, de modo que al replanificar siempre puede repetir lo que le
+    quedaba del plan anterior y la búsqueda nunca se queda sin salida.
+
+    Cada agente vuelve a planificar cuando recorrió la mitad de su ventana; los turnos
+    están escalonados, así que en cada paso replanifica solo una parte de los agentes y
+    el tiempo por paso se mantiene parejo aunque haya decenas. Además cada búsqueda
+    expande como mucho `limite_expansiones` estados: en una zona muy congestionada se
+    queda con el mejor plan parcial (el que más se acerca al objetivo) y lo completa
+    al replanificar.
+
+    También se pueden reservar caminos fijos de agentes que no controla el planificador
+    (por ejemplo, la IA principal de la carrera): los demás los esquivan. Al llegar a su
+    objetivo un agente sale del mapa y deja de ocupar celdas, así varios pueden compartir
+    el mismo destino (la meta de una carrera).
+    """
+
+    def __init__(self, grid, allow_diagonal=False, ventana=config.COOPERATIVE_WINDOW,
+                 limite_expansiones=config.COOPERATIVE_EXPANSION_LIMIT):
+        self.grid = grid
+        self.allow_diagonal = allow_diagonal
+        self.ventana = max(2, ventana)
+        self.limite_expansiones = limite_expansiones
+        self.reservas = TablaReservas()
+        self.agentes = []          # Agentes (Agent) que mueve el planificador
+        self.objetivos = []
+        self.planes = []           # Por agente: posiciones a partir del instante inicio_planes[i]
+        self.inicio_planes = []
+        self.proximo_replan = []   # Instante en que cada agente vuelve a planificar
+        self.llegados = set()      # Índices de los agentes que ya llegaron a su objetivo
+        self.fijos = {}            # Clave -> camino fijo reservado desde el instante 0
+        self.tiempo = 0
+        # Estadísticas
+        self.expansiones = 0
+        self.replanificaciones = 0
+        self.esperas_forzadas = 0  # Movimientos cancelados al ejecutarse porque chocaban
+        self.busquedas_cortadas = 0  # Búsquedas que llegaron al límite de expansiones
+        self.ultimo_ms = 0.0
+        self.maximo_ms = 0.0
+
+    def agregar_agente(self, agente, objetivo):
+        """
+        Agrega un agente en su posición actual. Hasta que planifica (ver planificar_nuevos)
+        su celda queda reservada, así los demás no planifican pasar por encima de él.
+        """
+        indice = len(self.agentes)
+        self.agentes.append(agente)
+        self.objetivos.append(objetivo)
+        self.planes.append(None)
+        self.inicio_planes.append(self.tiempo)
+        self.proximo_replan.append(self.tiempo)
+        self._reservar(indice, [agente.posicion])
+        return indice
+
+    def planificar_nuevos(self):
+        """
+        Planifica la primera ventana de los agentes agregados desde el último paso. avanzar
+        la llama sola; llamarla antes (al preparar la carrera) evita cargar ese primer paso.
+        """
+        mitad = self.ventana // 2
+        for indice in self.activos():
+            if self.planes[indice] is None:
+                self._planificar(indice)
+                # Escalonar los turnos: cada agente replanifica en un paso distinto dentro de media ventana
+                self.proximo_replan[indice] = self.tiempo + 1 + indice % mitad
+
+    def fijar_camino(self, clave, camino):
+        """
+        Reserva el camino de un agente externo (camino[k] es su celda en el instante k).
+        Los agentes cuyas reservas chocan con él vuelven a planificar en el próximo paso.
+        """
+        self.reservas.liberar(clave)
+        self.fijos[clave] = list(camino) if camino else []
+        afectados = set()
+        for k, posicion in enumerate(self.fijos[clave]):
+            ocupante = self.reservas.ocupante(posicion, k)
+            if ocupante is not None:
+                afectados.add(ocupante)
+        for indice in afectados:
+            if isinstance(indice, int):
+                self.proximo_replan[indice] = self.tiempo
+        # Al llegar sale del mapa: solo se reserva hasta la llegada
+        self.reservas.reservar_camino(clave, self.fijos[clave], 0)
+
+    def posicion_fija(self, clave, t):
+        """Celda del agente externo en el instante t (None si ya llegó)."""
+        camino = self.fijos.get(clave)
+        if not camino or t >= len(camino):
+            return None
+        return camino[t]
+
+    def activos(self):
+        """Índices de los agentes que todavía no llegaron."""
+        return [indice for indice in range(len(self.agentes)) if indice not in self.llegados]
+
+    def avanzar(self):
+        """
+        Avanza un instante: replanifica a los agentes cuyo turno llegó y mueve a todos un
+        paso. Retorna la lista de agentes que llegaron a su objetivo en este paso.
+        """
+        inicio = time.perf_counter()
+        mitad = self.ventana // 2
+        activos = self.activos()
+
+        # PASO 1: Planificar a los agentes nuevos y replanificar a quienes les toca (o se quedaron sin plan)
+        self.planificar_nuevos()
+        for indice in activos:
+            restante = len(self.planes[indice]) - (self.tiempo - self.inicio_planes[indice])
+            if self.tiempo >= self.proximo_replan[indice] or restante < 2:
+                self._planificar(indice)
+                self.proximo_replan[indice] = self.tiempo + mitad
+
+        # PASO 2: Siguiente celda de cada agente según su plan (si el plan se termina, espera)
+        actuales = {indice: self.agentes[indice].posicion for indice in activos}
+        siguientes = {}
+        for indice in activos:
+            plan = self.planes[indice]
+            k = self.tiempo - self.inicio_planes[indice] + 1
+            siguientes[indice] = plan[k] if k < len(plan) else actuales[indice]
+
+        # PASO 3: Cancelar los movimientos que chocarían (solo pasa si una búsqueda no encontró salida)
+        self._resolver_choques(activos, actuales, siguientes)
+
+        # PASO 4: Mover
+        llegados = []
+        for indice in activos:
+            agente = self.agentes[indice]
+            destino = siguientes[indice]
+            if destino != agente.posicion:
+                agente.posicion = destino
+                agente.pasos += 1
+                agente.camino.append(destino)
+            if destino == self.objetivos[indice]:
+                self.llegados.add(indice)
+                self.reservas.liberar(indice)
+                llegados.append(agente)
+        self.tiempo += 1
+
+        self.ultimo_ms = (time.perf_counter() - inicio) * 1000
+        self.maximo_ms = max(self.maximo_ms, self.ultimo_ms)
+        return llegados
+
+    def _resolver_choques(self, activos, actuales, siguientes):
+        """
+        Hace esperar a los agentes cuyo movimiento terminaría en una celda ocupada o en un
+        cruce. Los caminos fijos tienen prioridad: como no pueden esperar, quien iba a quedar
+        en una celda a la que llega uno de ellos se corre a un vecino libre. Los agentes
+        afectados replanifican en el paso siguiente.
+        """
+        proximo = self.tiempo + 1
+        fijos_ahora = {}
+        fijos_despues = {}
+        for clave in self.fijos:
+            ahora = self.posicion_fija(clave, self.tiempo)
+            despues = self.posicion_fija(clave, proximo)
+            if despues is not None:
+                fijos_despues[despues] = ahora
+            if ahora is not None:
+                fijos_ahora[ahora] = despues
+
+        def esperar(indice):
+            siguientes[indice] = actuales[indice]
+            self.esperas_forzadas += 1
+            self.proximo_replan[indice] = proximo
+
+        cambio = True
+        while cambio:
+            cambio = False
+            en_celda = {actuales[indice]: indice for indice in activos}
+            usadas = {}
+            for indice in activos:
+                destino = siguientes[indice]
+                se_mueve = destino != actuales[indice]
+                # Contra caminos fijos: no entrar donde estará ni cruzarse con él
+                if destino in fijos_despues or (se_mueve and fijos_ahora.get(destino, False) == actuales[indice]):
+                    if se_mueve:
+                        esperar(indice)
+                        cambio = True
+                    continue
+                # Dos agentes intercambiando lugares
+                otro = en_celda.get(destino)
+                if se_mueve and otro is not None and otro != indice and siguientes[otro] == actuales[indice]:
+                    esperar(indice)
+                    cambio = True
+                    continue
+                # Dos agentes hacia la misma celda: espera el que se mueve
+                otro = usadas.get(destino)
+                if otro is None:
+                    usadas[destino] = indice
+                elif se_mueve:
+                    esperar(indice)
+                    cambio = True
+                elif siguientes[otro] != actuales[otro]:
+                    esperar(otro)
+                    usadas[destino] = indice
+                    cambio = True
+
+        # Quien igual quedó en una celda a la que llega un camino fijo se corre a un vecino libre
+        if fijos_despues:
+            adyacencia = self.grid.obtener_adyacencia(self.allow_diagonal)
+            ocupadas = set(siguientes.values())
+            for indice in activos:
+                if siguientes[indice] not in fijos_despues:
+                    continue
+                for vecino, _ in adyacencia.vecinos_y_costos(actuales[indice]):
+                    if (vecino not in ocupadas and vecino not in fijos_despues
+                            and fijos_ahora.get(vecino, False) != actuales[indice]):
+                        siguientes[indice] = vecino
+                        ocupadas.add(vecino)
+                        self.esperas_forzadas += 1
+                        self.proximo_replan[indice] = proximo
+                        break
+
+    def _planificar(self, indice):
+        """Busca la ventana del agente respetando las reservas de los demás y la reserva."""
+        agente = self.agentes[indice]
+        self.reservas.liberar(indice)
+        plan = self._buscar(indice, agente.posicion, self.objetivos[indice])
+        if plan is None:
+            plan = [agente.posicion]  # Encerrado por las reservas: espera y vuelve a intentar
+        self.planes[indice] = plan
+        self.inicio_planes[indice] = self.tiempo
+        self._reservar(indice, plan)
+        self.replanificaciones += 1
+
+    def _reservar(self, indice, plan):
+        """
+        Reserva el plan desde el instante actual. Si no termina en el objetivo, el agente
+        queda reservado en la última celda hasta después de su próxima ventana: así nadie
+        la ocupa y, al replanificar, repetir el resto del plan anterior siempre es posible.
+        """
+        self.reservas.reservar_camino(indice, plan, self.tiempo)
+        if plan[-1] != self.objetivos[indice]:
+            fin = self.tiempo + len(plan)
+            hasta = self.tiempo + self.ventana + self.ventana // 2 + 1
+            if hasta > fin:
+                self.reservas.reservar_camino(indice, [plan[-1]] * (hasta - fin), fin)
+
+    def _buscar(self, indice, inicio, objetivo):
+        """
+        A* en espacio-tiempo desde `inicio` en el instante actual. Termina al llegar al
+        objetivo o al borde de la ventana; retorna las celdas instante por instante, o None.
+        Si se agota el límite de expansiones retorna el camino al estado expandido más
+        cercano al objetivo (el más adelantado si empatan).
+        """
+        campo = self.grid.obtener_campo_distancias(objetivo, self.allow_diagonal)
+        adyacencia = self.grid.obtener_adyacencia(self.allow_diagonal)
+        reservas = self.reservas
+        t_inicio = self.tiempo
+        ventana = self.ventana
+
+        h = campo.distancia(inicio)
+        if h == INFINITO:
+            return None
+        orden = itertools.count()
+        estado_inicial = (inicio, 0)
+        mejor_g = {estado_inicial: 0.0}
+        padres = {estado_inicial: None}
+        abiertos = [(h, 0.0, next(orden), inicio, 0)]
+        mejor_parcial = (h, 0, estado_inicial)
+        expandidos = 0
+        while abiertos:
+            _, g_negativo, _, posicion, k = heapq.heappop(abiertos)
+            g = -g_negativo
+            if g > mejor_g[(posicion, k)]:
+                continue  # Entrada vieja
+            self.expansiones += 1
+            expandidos += 1
+
+            if posicion == objetivo or k == ventana:
+                return self._reconstruir_plan(padres, (posicion, k))
+            h = campo.distancia(posicion)
+            if (h, -k) < mejor_parcial[:2]:
+                mejor_parcial = (h, -k, (posicion, k))
+            if expandidos >= self.limite_expansiones:
+                self.busquedas_cortadas += 1
+                return self._reconstruir_plan(padres, mejor_parcial[2])
+
+            t = t_inicio + k
+            # Moverse a un vecino o esperar en el lugar (esperar cuesta un paso de tiempo)
+            for destino, costo in itertools.chain(adyacencia.vecinos_y_costos(posicion), ((posicion, 1.0),)):
+                if not reservas.libre(indice, posicion, destino, t):
+                    continue
+                estado = (destino, k + 1)
+                nuevo_g = g + costo
+                if nuevo_g < mejor_g.get(estado, INFINITO):
+                    h = campo.distancia(destino)
+                    if h == INFINITO:
+                        continue
+                    mejor_g[estado] = nuevo_g
+                    padres[estado] = (posicion, k)
+                    # A igual f se prefiere el mayor g (el que más avanzó)
+                    heapq.heappush(abiertos, (nuevo_g + h, -nuevo_g, next(orden), destino, k + 1))
+        return None
+
+    @staticmethod
+    def _reconstruir_plan(padres, estado):
+        """Celdas desde el estado inicial hasta `estado`, instante por instante."""
+        camino = []
+        while estado is not None:
+            camino.append(estado[0])
+            estado = padres[estado]
+        return camino[::-1]
+
+
+def celdas_de_salida(grilla, inicio, cantidad, permitir_diagonal=False, evitar=()):
+    """
+    Las `cantidad` celdas libres más cercanas a `inicio` (por BFS, sin contar el inicio
+    ni las de `evitar`), para ubicar a varios agentes que parten del mismo lugar.
+    """
+    adyacencia = grilla.obtener_adyacencia(permitir_diagonal)
+    evitar = set(evitar)
+    vistas = {inicio}
+    cola = deque([inicio])
+    celdas = []
+    while cola and len(celdas) < cantidad:
+        posicion = cola.popleft()
+        for vecino, _ in adyacencia.vecinos_y_costos(posicion):
+            if vecino in vistas:
+                continue
+            vistas.add(vecino)
+            cola.append(vecino)
+            if vecino not in evitar and vecino != grilla.end_pos:
+                celdas.append(vecino)
+                if len(celdas) == cantidad:
+                    break
+    return celdas
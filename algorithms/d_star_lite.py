@@ -0,0 +1,287 @@
+import config
+from algorithms.pathfinder_base import PathfinderBase, MOVIMIENTOS_BASICOS, MOVIMIENTOS_DIAGONALES, COSTO_DIAGONAL
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+INFINITO = float('inf')
+# Tolerancia al comparar claves: sumas de costos diagonales por caminos distintos difieren en redondeo
+EPSILON = 1e-9
+
+
+class DStarLitePathfinder(PathfinderBase):
+    """
+    Implementa D* Lite: búsqueda incremental que conserva su estado entre llamadas.
+
+    Busca desde el objetivo hacia el inicio guardando, por celda, g (distancia al
+    objetivo ya confirmada) y rhs (la mejor distancia según sus vecinos). Las celdas
+    con g != rhs son inconsistentes y esperan en la lista abierta. Cuando la
+    cuadrícula cambia, solo se corrigen las celdas alrededor de los cambios y el
+    trabajo se propaga hasta donde haga falta; cuando el inicio avanza, km compensa
+    la heurística de las claves ya encoladas.
+
+    - inicializar_busqueda siempre empieza de cero (para ver la búsqueda paso a paso).
+    - encontrar_camino reutiliza el estado si el objetivo no cambió y repara el camino.
+    - replanificar mueve el inicio (por ejemplo, a la posición actual del agente) y repara.
+
+    En la lista abierta, g de cada nodo es min(g, rhs) y f la primera componente de
+    su clave. La lista cerrada contiene las celdas expandidas en la última reparación.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.movimientos = [(dx, dy, 1.0) for dx, dy in MOVIMIENTOS_BASICOS]
+        if allow_diagonal:
+            self.movimientos += [(dx, dy, COSTO_DIAGONAL) for dx, dy in MOVIMIENTOS_DIAGONALES]
+        self.g = {}
+        self.rhs = {}
+        self.km = 0
+        self.version = None        # Versión de la cuadrícula con la que está al día el estado
+        self.posicion_inicio = None
+        self.posicion_fin = None
+        self.ultimo_inicio = None  # Inicio usado la última vez que se actualizó km
+        self.lista_abierta = ColaPrioridad()
+        self.lista_cerrada = []
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.lista_abierta.elementos()
+
+    @open_list.setter
+    def open_list(self, valor):
+        self._restaurar(valor, self.lista_cerrada)
+
+    @property
+    def closed_list(self):
+        return self.lista_cerrada
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self._restaurar(self.lista_abierta.elementos(), valor)
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Descarta el estado anterior y prepara una búsqueda desde cero."""
+        self.g = {}
+        self.rhs = {pos_final: 0}
+        self.km = 0
+        self.version = self.grid.version
+        self.posicion_inicio = pos_inicio
+        self.posicion_fin = pos_final
+        self.ultimo_inicio = pos_inicio
+        self.lista_abierta = ColaPrioridad()
+        self._actualizar_vertice(pos_final)
+        self._preparar_reparacion()
+
+    def replanificar(self, pos_inicio):
+        """
+        Mueve el inicio a `pos_inicio`, incorpora los cambios de la cuadrícula y repara el camino.
+        Requiere una búsqueda previa (si no la hay, o cambió todo el mapa, empieza de cero).
+        """
+        if not self._puede_reutilizar():
+            return self.encontrar_camino(pos_inicio, self.posicion_fin)
+
+        # km acumula cuánto bajó la heurística de las claves encoladas al mover el inicio
+        if pos_inicio != self.ultimo_inicio:
+            self.km += self.calcular_heuristica(self.ultimo_inicio, pos_inicio)
+            self.ultimo_inicio = pos_inicio
+        inicio_anterior = self.posicion_inicio
+        self.posicion_inicio = pos_inicio
+        # El inicio es la única celda desde la que se puede salir aunque sea un obstáculo
+        self._actualizar_vertice(inicio_anterior)
+        self._actualizar_vertice(pos_inicio)
+
+        for posicion in self.grid.cambios_desde(self.version):
+            self._actualizar_vertice(posicion)
+            for vecino in self._vecinos(posicion):
+                self._actualizar_vertice(vecino)
+        self.version = self.grid.version
+
+        self._preparar_reparacion()
+        while self.paso():
+            pass
+        return self.camino
+
+    def paso(self):
+        """Ejecuta una iteración: procesa la celda inconsistente con menor clave."""
+        if self.terminado:
+            return False
+
+        inicio = self.posicion_inicio
+        if not self.lista_abierta or (_clave_no_menor(self.lista_abierta.ver_minimo()[0], self._clave(inicio))
+                                      and self.rhs.get(inicio, INFINITO) == self.g.get(inicio, INFINITO)):
+            # El inicio ya es consistente y nada en la lista abierta puede mejorarlo
+            if self.g.get(inicio, INFINITO) == INFINITO:
+                return False  # No hay camino
+            camino = self._extraer_camino()
+            if camino is not None or not self.lista_abierta:
+                self.camino = camino
+                self.terminado = True
+                if camino is None:
+                    return False
+                if self.oyente is not None:
+                    self.oyente(EventoBusqueda(OBJETIVO, self.posicion_fin, self.g[inicio], None))
+                return True
+            # Alguna celda del camino sigue inconsistente: se continúa expandiendo
+
+        self.iteraciones += 1
+        clave_vieja, nodo = self.lista_abierta.ver_minimo()
+        posicion = nodo.posicion
+        clave_nueva = self._clave(posicion)
+
+        if clave_vieja < clave_nueva:
+            # La clave quedó desactualizada por un movimiento del inicio: reencolar
+            self._actualizar_vertice(posicion)
+        elif self.g.get(posicion, INFINITO) > self.rhs.get(posicion, INFINITO):
+            # Sobreconsistente: se confirma su distancia y se propaga a los vecinos
+            self.g[posicion] = self.rhs[posicion]
+            self.lista_abierta.eliminar(posicion)
+            self.lista_cerrada.append(self._crear_nodo(posicion))
+            if self.oyente is not None:
+                self.oyente(evento_de_nodo(EXTRAER, self.lista_cerrada[-1]))
+            for vecino in self._vecinos(posicion):
+                self._actualizar_vertice(vecino)
+        else:
+            # Subconsistente (su distancia empeoró): se invalida y se recalcula junto a sus vecinos
+            self.g[posicion] = INFINITO
+            self.lista_cerrada.append(self._crear_nodo(posicion))
+            if self.oyente is not None:
+                self.oyente(evento_de_nodo(EXTRAER, self.lista_cerrada[-1]))
+            self._actualizar_vertice(posicion)
+            for vecino in self._vecinos(posicion):
+                self._actualizar_vertice(vecino)
+        return True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo, reutilizando el estado si el objetivo no cambió."""
+        if pos_final == self.posicion_fin and self._puede_reutilizar():
+            return self.replanificar(pos_inicio)
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
+
+    def _puede_reutilizar(self):
+        """True si el estado guardado puede repararse con el registro de cambios de la cuadrícula."""
+        return self.version is not None and self.grid.cambios_desde(self.version) is not None
+
+    def _preparar_reparacion(self):
+        self.lista_cerrada = []
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+
+    def _clave(self, posicion):
+        """Clave de prioridad (k1, k2) de una celda."""
+        minimo = min(self.g.get(posicion, INFINITO), self.rhs.get(posicion, INFINITO))
+        return (minimo + self.calcular_heuristica(self.posicion_inicio, posicion) + self.km, minimo)
+
+    def _prioridad(self, nodo):
+        # Los nodos de la lista abierta guardan k1 en f y k2 en g
+        return (nodo.f, nodo.g)
+
+    def _crear_nodo(self, posicion):
+        """Nodo de visualización con g = min(g, rhs), h hacia el inicio y f = k1."""
+        minimo = min(self.g.get(posicion, INFINITO), self.rhs.get(posicion, INFINITO))
+        h = self.calcular_heuristica(self.posicion_inicio, posicion)
+        return Nodo(None, posicion, minimo, h, minimo + h + self.km)
+
+    def _libre(self, posicion):
+        x, y = posicion
+        grilla = self.grid
+        return (0 <= x < grilla.columnas and 0 <= y < grilla.filas
+                and grilla.celdas[y * grilla.columnas + x] != config.STATE_OBSTACLE)
+
+    def _vecinos(self, posicion):
+        """Celdas dentro de la cuadrícula alcanzables con un movimiento (libres o no)."""
+        x, y = posicion
+        columnas, filas = self.grid.columnas, self.grid.filas
+        return [(x + dx, y + dy) for dx, dy, _ in self.movimientos
+                if 0 <= x + dx < columnas and 0 <= y + dy < filas]
+
+    def _sucesores(self, posicion):
+        """Pares (vecino, costo) transitables desde una celda (solo se sale de un obstáculo si es el inicio)."""
+        if posicion != self.posicion_inicio and not self._libre(posicion):
+            return []
+        x, y = posicion
+        return [((x + dx, y + dy), costo) for dx, dy, costo in self.movimientos
+                if self._libre((x + dx, y + dy))]
+
+    def _actualizar_vertice(self, posicion):
+        """Recalcula rhs de una celda y la encola solo si quedó inconsistente."""
+        if posicion != self.posicion_fin:
+            g = self.g
+            self.rhs[posicion] = min((costo + g.get(vecino, INFINITO) for vecino, costo in self._sucesores(posicion)),
+                                     default=INFINITO)
+        if self.g.get(posicion, INFINITO) != self.rhs.get(posicion, INFINITO):
+            nodo = self._crear_nodo(posicion)
+            if self.oyente is not None:
+                self.oyente(evento_de_nodo(ACTUALIZAR if posicion in self.lista_abierta else INSERTAR, nodo))
+            self.lista_abierta.insertar(posicion, nodo, self._prioridad(nodo))
+        else:
+            self.lista_abierta.eliminar(posicion)
+
+    def _extraer_camino(self):
+        """Sigue, desde el inicio, al vecino que minimiza costo + g hasta llegar al objetivo."""
+        actual = self.posicion_inicio
+        camino = [actual]
+        while actual != self.posicion_fin:
+            actual = min(self._sucesores(actual), key=lambda par: par[1] + self.g.get(par[0], INFINITO))[0]
+            camino.append(actual)
+            if (actual in self.lista_abierta or self.g.get(actual, INFINITO) == INFINITO
+                    or len(camino) > self.grid.columnas * self.grid.filas):
+                return None  # Estado inconsistente: no se puede seguir un camino válido
+        return camino
+
+    def _restaurar(self, abiertos, cerrados):
+        """
+        Reconstruye g y rhs desde las listas (historial de TestingScene). Es exacto
+        dentro de una búsqueda sin cambios en la cuadrícula: las celdas cerradas son
+        consistentes y las abiertas solo tienen rhs.
+        """
+        self.g = {}
+        self.rhs = {self.posicion_fin: 0}
+        for nodo in abiertos:
+            self.rhs[nodo.posicion] = nodo.g
+        for nodo in cerrados:
+            self.g[nodo.posicion] = nodo.g
+            self.rhs[nodo.posicion] = nodo.g
+        self.lista_abierta = self._construir_frontera(abiertos)
+        self.lista_cerrada = cerrados
+
+
+def _clave_no_menor(clave, otra):
+    """clave >= otra en orden lexicográfico, con tolerancia EPSILON en cada componente."""
+    if abs(clave[0] - otra[0]) > EPSILON:
+        return clave[0] > otra[0]
+    return clave[1] >= otra[1] - EPSILON
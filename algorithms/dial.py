@@ -0,0 +1,247 @@
+import math
+
+import config
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+
+class DialPathfinder(PathfinderBase):
+    """
+    Dijkstra con cola de cubetas (algoritmo de Dial) y costos enteros en punto fijo.
+
+    Los costos de movimiento se pasan a enteros (un paso recto vale `escala`, uno diagonal
+    round(√2 · escala), ambos multiplicados por el factor de terreno de la celda destino, ver
+    config.TERRAIN_COSTS). Como ningún costo supera un máximo C conocido, la lista abierta es un
+    arreglo circular de C + 1 cubetas indexado por prioridad: insertar es agregar a una lista y
+    extraer es avanzar hasta la siguiente cubeta no vacía, sin comparaciones ni montículo. Las
+    cubetas ocupadas se marcan en un entero usado como mapa de bits, así el salto a la siguiente
+    es una operación de bits y no un recorrido de las vacías.
+
+    Dentro de una cubeta sale primero lo último que entró. Una celda que mejora su costo se
+    vuelve a insertar y la entrada vieja se descarta al salir (ya está cerrada).
+
+    La lista abierta y la cerrada son de solo lectura: se arman con Nodo al pedirlas.
+    """
+
+    # True si la prioridad suma una heurística entera (ver DialAStarPathfinder)
+    heuristica_entera = False
+
+    def __init__(self, grid, allow_diagonal=False, escala=config.FIXED_POINT_SCALE):
+        super().__init__(grid, allow_diagonal)
+        self.escala = escala
+        self.tabla = None             # Tabla de adyacencia de la búsqueda actual
+        self.costos_enteros = None    # Costos en punto fijo alineados con tabla.vecinos
+        self.cubetas = []
+        self.cubeta_actual = 0        # Cubeta que se está vaciando (posición en el arreglo circular)
+        self.ocupadas = 0             # Bit i encendido si la cubeta i tiene entradas (incluidas las obsoletas)
+        self.costos_g = {}            # Índice de celda -> mejor g entero conocido
+        self.padres = {}              # Índice de celda -> índice del padre
+        self.cerrado = bytearray()    # 1 si la celda ya tiene su costo definitivo
+        self.cerradas = []            # Índices cerrados, en orden
+        self.indice_fin = None
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        posicion = self.grid.posicion
+        escala = self.escala
+        nodos = []
+        for indice, g in self.costos_g.items():
+            if not self.cerrado[indice]:
+                h = self._estimar_entero(indice)
+                nodos.append(Nodo(None, posicion(indice), g / escala, h / escala, (g + h) / escala))
+        return nodos
+
+    @property
+    def closed_list(self):
+        posicion = self.grid.posicion
+        return [Nodo(None, posicion(indice), self.costos_g[indice] / self.escala) for indice in self.cerradas]
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    @property
+    def costo(self):
+        """Costo del camino encontrado en las unidades de los demás algoritmos (None si no hay)."""
+        if self.camino is None:
+            return None
+        return self.costos_g[self.indice_fin] / self.escala
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        tabla = self.grid.obtener_adyacencia(self.allow_diagonal)
+        self.tabla = tabla
+        self.costos_enteros = tabla.costos_enteros(self.escala)
+        self.columnas = self.grid.columnas
+        self.fin_x, self.fin_y = pos_final
+        self.indice_fin = self.grid.indice(pos_final)
+        self.recto = self.escala
+        self.diagonal = round(math.sqrt(2) * self.escala)
+
+        # Con costos de a lo sumo C, toda prioridad viva está en [p, p + C] (Dijkstra), siendo p la
+        # de la cubeta actual, o en [p, p + 2C] (A*: la heurística sube a lo sumo un costo base por paso)
+        maximo = max(self.costos_enteros, default=self.escala)
+        ancho = 2 * maximo if self.heuristica_entera else maximo
+        self.cubetas = [[] for _ in range(ancho + 1)]
+        self.costos_g = {}
+        self.padres = {}
+        self.cerrado = bytearray(self.grid.columnas * self.grid.filas)
+        self.cerradas = []
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+
+        indice_inicio = self.grid.indice(pos_inicio)
+        self.costos_g[indice_inicio] = 0
+        self.padres[indice_inicio] = None
+        self.cubeta_actual = self._estimar_entero(indice_inicio) % len(self.cubetas)
+        self.cubetas[self.cubeta_actual].append(indice_inicio)
+        self.ocupadas = 1 << self.cubeta_actual
+        if self.oyente is not None:
+            self.oyente(EventoBusqueda(INSERTAR, pos_inicio, 0.0, None))
+
+    def _estimar_entero(self, indice):
+        """Heurística en punto fijo hacia el objetivo (0 en Dijkstra)."""
+        return 0
+
+    def _extraer(self):
+        """Saca la celda abierta de menor prioridad (None si no queda ninguna)."""
+        cubetas = self.cubetas
+        cerrado = self.cerrado
+        while self.ocupadas:
+            # Siguiente cubeta ocupada desde la actual, dando la vuelta al arreglo si hace falta
+            resto = self.ocupadas >> self.cubeta_actual
+            if resto:
+                self.cubeta_actual += (resto & -resto).bit_length() - 1
+            else:
+                self.cubeta_actual = (self.ocupadas & -self.ocupadas).bit_length() - 1
+            cubeta = cubetas[self.cubeta_actual]
+            while cubeta:
+                indice = cubeta.pop()
+                if not cerrado[indice]:
+                    if not cubeta:
+                        self.ocupadas &= ~(1 << self.cubeta_actual)
+                    return indice
+            self.ocupadas &= ~(1 << self.cubeta_actual)
+        return None
+
+    def paso(self):
+        """Ejecuta una iteración: cierra la celda de menor prioridad y relaja sus vecinos."""
+        if self.terminado:
+            return False
+        indice = self._extraer()
+        if indice is None:
+            return False  # No hay camino
+
+        self.iteraciones += 1
+        self.cerrado[indice] = 1
+        self.cerradas.append(indice)
+        g = self.costos_g[indice]
+        oyente = self.oyente
+        posicion = self.grid.posicion
+        if oyente is not None:
+            padre = self.padres[indice]
+            oyente(EventoBusqueda(EXTRAER, posicion(indice), g / self.escala,
+                                  posicion(padre) if padre is not None else None))
+
+        if indice == self.indice_fin:
+            self.camino = self._reconstruir_camino()
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, posicion(indice), g / self.escala, None))
+            return True
+
+        tabla = self.tabla
+        vecinos = tabla.vecinos
+        costos = self.costos_enteros
+        costos_g = self.costos_g
+        padres = self.padres
+        cerrado = self.cerrado
+        cubetas = self.cubetas
+        cantidad = len(cubetas)
+        ocupadas = self.ocupadas
+        for k in range(tabla.desplazamientos[indice], tabla.desplazamientos[indice + 1]):
+            vecino = vecinos[k]
+            if cerrado[vecino]:
+                continue
+            nuevo = g + costos[k]
+            anterior = costos_g.get(vecino)
+            if anterior is not None and nuevo >= anterior:
+                continue
+            costos_g[vecino] = nuevo
+            padres[vecino] = indice
+            ranura = (nuevo + self._estimar_entero(vecino)) % cantidad
+            cubetas[ranura].append(vecino)
+            ocupadas |= 1 << ranura
+            if oyente is not None:
+                oyente(EventoBusqueda(INSERTAR if anterior is None else ACTUALIZAR, posicion(vecino),
+                                      nuevo / self.escala, posicion(indice)))
+        self.ocupadas = ocupadas
+        return True
+
+    def _reconstruir_camino(self):
+        """Sigue los padres desde el objetivo hasta el inicio."""
+        posicion = self.grid.posicion
+        camino = []
+        actual = self.indice_fin
+        while actual is not None:
+            camino.append(posicion(actual))
+            actual = self.padres[actual]
+        return camino[::-1]
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
+
+
+class DialAStarPathfinder(DialPathfinder):
+    """
+    A* sobre la cola de cubetas de Dial, con la heurística octil (o Manhattan sin diagonales)
+    en los mismos enteros que los costos.
+
+    La heurística usa los costos base, así que con factores de terreno >= 1 sigue siendo
+    admisible y consistente: f nunca baja al expandir y la cola de cubetas sigue sirviendo.
+    Para que las prioridades vivas quepan en la ventana circular hacen falta 2C + 1 cubetas.
+    """
+
+    heuristica_entera = True
+
+    def _estimar_entero(self, indice):
+        dx = abs(indice % self.columnas - self.fin_x)
+        dy = abs(indice // self.columnas - self.fin_y)
+        if self.allow_diagonal:
+            if dx < dy:
+                dx, dy = dy, dx
+            return self.recto * dx + (self.diagonal - self.recto) * dy
+        return self.recto * (dx + dy)
@@ -1,44 +1,16 @@
 import pygame
 import config
 from algorithms.pathfinder_base import PathfinderBase
-
-class Nodo:
-    """Una clase para representar un nodo en el algoritmo de Dijkstra."""
-    def __init__(self, padre=None, posicion=None):
-        self.padre = padre      # Nodo desde el cual llegamos (para reconstruir camino)
-        self.posicion = posicion # Coordenadas (x, y) del nodo en la grilla
-        
-        # Costos en Dijkstra:
-        self.g = 0  # Costo real acumulado desde el inicio (PRINCIPAL en Dijkstra)
-        self.h = 0  # No se usa heurística en Dijkstra (siempre 0)
-        self.f = 0  # En Dijkstra, f = g (solo costo real, sin estimación)
-        
-    def __eq__(self, otro):
-        """Dos nodos son iguales si tienen la misma posición."""
-        return self.posicion == otro.posicion
-    
-    # Propiedades para compatibilidad con código existente
-    @property
-    def parent(self):
-        return self.padre
-    
-    @parent.setter
-    def parent(self, valor):
-        self.padre = valor
-    
-    @property
-    def position(self):
-        return self.posicion
-    
-    @position.setter
-    def position(self, valor):
-        self.posicion = valor
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
 
 class DijkstraPathfinder(PathfinderBase):
     def __init__(self, grid, allow_diagonal=False):
         super().__init__(grid, allow_diagonal)
-        self.lista_abierta = []
+        self.lista_abierta = ColaPrioridad()
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()  # Índice de la lista cerrada para consultas O(1)
         self.nodo_inicio = None
         self.nodo_fin = None
         self.camino = None
@@ -47,11 +19,11 @@ class DijkstraPathfinder(PathfinderBase):
     # Propiedades para compatibilidad con código existente
     @property
     def open_list(self):
-        return self.lista_abierta
+        return self.lista_abierta.elementos()
     
     @open_list.setter
     def open_list(self, valor):
-        self.lista_abierta = valor
+        self.lista_abierta = self._construir_frontera(valor)
     
     @property
     def closed_list(self):
@@ -60,6 +32,7 @@ class DijkstraPathfinder(PathfinderBase):
     @closed_list.setter
     def closed_list(self, valor):
         self.lista_cerrada = valor
+        self.posiciones_cerradas = {nodo.posicion for nodo in valor}
     
     @property
     def start_node(self):
@@ -100,9 +73,12 @@ class DijkstraPathfinder(PathfinderBase):
         self.nodo_fin = Nodo(None, end_pos)
         
         # Lista abierta: nodos por evaluar (empezamos con el nodo inicial)
-        self.lista_abierta = [self.nodo_inicio]
+        self.lista_abierta = self._construir_frontera([self.nodo_inicio])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
         # Lista cerrada: nodos con distancia mínima ya calculada
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()
         self.camino = None
         self.terminado = False
         self.iteraciones = 0  # Reiniciar contador de iteraciones
@@ -115,25 +91,22 @@ class DijkstraPathfinder(PathfinderBase):
 
         self.iteraciones += 1  # Incrementar contador de iteraciones
 
-        # PASO 1: Encontrar el nodo con menor distancia acumulada (costo g)
-        # En Dijkstra seleccionamos siempre el nodo con menor costo real
-        nodo_actual = self.lista_abierta[0]
-        indice_actual = 0
-        for indice, elemento in enumerate(self.lista_abierta):
-            if elemento.f < nodo_actual.f:  # f = g en Dijkstra (sin heurística)
-                nodo_actual = elemento
-                indice_actual = indice
+        # PASO 1: Extraer el nodo con menor distancia acumulada (costo g)
+        # En Dijkstra seleccionamos siempre el nodo con menor costo real (f = g, sin heurística)
+        nodo_actual = self.lista_abierta.extraer()
 
         # PASO 2: Mover nodo a lista cerrada (distancia mínima confirmada)
-        self.lista_abierta.pop(indice_actual)
         self.lista_cerrada.append(nodo_actual)
+        self.posiciones_cerradas.add(nodo_actual.posicion)
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(EXTRAER, nodo_actual))
 
         # PASO 3: Verificar si hemos llegado al objetivo
         if nodo_actual == self.nodo_fin:
             self.camino = self._reconstruir_camino(nodo_actual)
             self.terminado = True
-            self.camino = self._reconstruir_camino(nodo_actual)
-            self.terminado = True
+            if self.oyente is not None:
+                self.oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
             return True
 
         # PASO 4: Expandir vecinos y actualizar distancias
@@ -144,31 +117,29 @@ class DijkstraPathfinder(PathfinderBase):
         """Procesa los vecinos del nodo actual - Algoritmo de relajación de Dijkstra."""
         # Obtener vecinos válidos y sus costos de movimiento
         vecinos_con_costos = self.get_neighbors_and_costs(nodo_actual.posicion)
-        vecinos = []
-        
-        # Crear nodos vecinos con información de costo
-        for posicion_vecino, costo_movimiento in vecinos_con_costos:
-            vecino = Nodo(nodo_actual, posicion_vecino)
-            vecino.move_cost = costo_movimiento
-            vecinos.append(vecino)
+        oyente = self.oyente
         
         # Evaluar cada vecino (proceso de relajación)
-        for vecino in vecinos:
+        for posicion_vecino, costo_movimiento in vecinos_con_costos:
             # Ignorar vecinos que ya tienen su distancia mínima calculada
-            if vecino in self.lista_cerrada:
+            if posicion_vecino in self.posiciones_cerradas:
                 continue
 
             # Calcular nueva distancia a través del nodo actual
-            vecino.g = nodo_actual.g + vecino.move_cost  # Distancia acumulada
-            vecino.h = 0  # Dijkstra NO usa heurística (búsqueda ciega)
-            vecino.f = vecino.g + vecino.h  # f = g en Dijkstra
+            g = nodo_actual.g + costo_movimiento  # Distancia acumulada
 
             # Si ya existe un camino más corto a este vecino, ignorarlo
-            if any(nodo_abierto for nodo_abierto in self.lista_abierta if vecino == nodo_abierto and vecino.g >= nodo_abierto.g):
+            # (la lista abierta está indexada por posición, así que la consulta es O(1))
+            nodo_abierto = self.lista_abierta.obtener(posicion_vecino)
+            if nodo_abierto is not None and g >= nodo_abierto.g:
                 continue
             
-            # Agregar vecino para evaluación futura
-            self.lista_abierta.append(vecino)
+            # Dijkstra NO usa heurística (búsqueda ciega): h = 0 y f = g
+            vecino = Nodo(nodo_actual, posicion_vecino, g, 0, g)
+            # Agregar vecino para evaluación futura (reemplaza una entrada peor de la misma posición)
+            self.lista_abierta.insertar(posicion_vecino, vecino, self._prioridad(vecino))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if nodo_abierto is None else ACTUALIZAR, vecino))
     
     # Propiedades de compatibilidad para métodos
     @property
@@ -0,0 +1,103 @@
+import heapq
+from array import array
+from collections import deque
+
+import config
+from algorithms.pathfinder_base import MOVIMIENTOS_BASICOS, MOVIMIENTOS_DIAGONALES, COSTO_DIAGONAL
+
+INFINITO = float('inf')
+
+
+class CampoDistancias:
+    """
+    Distancia exacta desde cada celda hasta un objetivo fijo.
+
+    Se calcula con una sola búsqueda inversa desde el objetivo: BFS si solo hay
+    movimientos rectos (todos cuestan 1) y Dijkstra si hay diagonales. Además de la
+    distancia guarda, por celda, el siguiente paso óptimo, así que cualquier agente
+    puede consultar cuánto le falta y hacia dónde moverse en O(1).
+
+    Sigue las reglas de movimiento de los algoritmos: solo se entra a celdas que no
+    son obstáculo, aunque se puede salir de cualquiera (por ejemplo, del inicio).
+    """
+
+    def __init__(self, grilla, objetivo, permitir_diagonal=False):
+        self.columnas = grilla.columnas
+        self.filas = grilla.filas
+        self.objetivo = objetivo
+        self.permitir_diagonal = permitir_diagonal
+        self.version = grilla.version
+
+        total = self.columnas * self.filas
+        self.distancias = array('d', [INFINITO]) * total
+        self.siguiente = array('i', [-1]) * total  # Índice de la celda a la que conviene moverse
+        if objetivo is not None and 0 <= objetivo[0] < self.columnas and 0 <= objetivo[1] < self.filas:
+            self._calcular(grilla.celdas)
+
+    def _calcular(self, celdas):
+        columnas, filas = self.columnas, self.filas
+        obstaculo = config.STATE_OBSTACLE
+        distancias, siguiente = self.distancias, self.siguiente
+        inicio = self.objetivo[1] * columnas + self.objetivo[0]
+        distancias[inicio] = 0.0
+        if celdas[inicio] == obstaculo:
+            return  # No se puede entrar al objetivo desde ninguna otra celda
+
+        if not self.permitir_diagonal:
+            # BFS: con costos unitarios el orden de llegada ya es el de distancia
+            cola = deque([inicio])
+            while cola:
+                indice = cola.popleft()
+                x, y = indice % columnas, indice // columnas
+                nueva = distancias[indice] + 1.0
+                for dx, dy in MOVIMIENTOS_BASICOS:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < columnas and 0 <= ny < filas:
+                        vecino = ny * columnas + nx
+                        if distancias[vecino] == INFINITO:
+                            distancias[vecino] = nueva
+                            siguiente[vecino] = indice
+                            # Un obstáculo recibe distancia (podría ser el inicio) pero no se atraviesa
+                            if celdas[vecino] != obstaculo:
+                                cola.append(vecino)
+            return
+
+        movimientos = [(dx, dy, 1.0) for dx, dy in MOVIMIENTOS_BASICOS]
+        movimientos += [(dx, dy, COSTO_DIAGONAL) for dx, dy in MOVIMIENTOS_DIAGONALES]
+        monticulo = [(0.0, inicio)]
+        while monticulo:
+            distancia, indice = heapq.heappop(monticulo)
+            if distancia > distancias[indice]:
+                continue
+            if indice != inicio and celdas[indice] == obstaculo:
+                continue
+            x, y = indice % columnas, indice // columnas
+            for dx, dy, costo in movimientos:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < columnas and 0 <= ny < filas:
+                    vecino = ny * columnas + nx
+                    nueva = distancia + costo
+                    if nueva < distancias[vecino]:
+                        distancias[vecino] = nueva
+                        siguiente[vecino] = indice
+                        heapq.heappush(monticulo, (nueva, vecino))
+
+    def distancia(self, posicion):
+        """Costo exacto del mejor camino desde la posición al objetivo (inf si no hay camino)."""
+        return self.distancias[posicion[1] * self.columnas + posicion[0]]
+
+    def siguiente_paso(self, posicion):
+        """Celda a la que moverse desde la posición para seguir un camino óptimo (None si no hay)."""
+        indice = self.siguiente[posicion[1] * self.columnas + posicion[0]]
+        if indice < 0:
+            return None
+        return (indice % self.columnas, indice // self.columnas)
+
+    def camino(self, posicion):
+        """Camino óptimo completo desde la posición hasta el objetivo, o None si no existe."""
+        if self.distancia(posicion) == INFINITO:
+            return None
+        camino = [posicion]
+        while camino[-1] != self.objetivo:
+            camino.append(self.siguiente_paso(camino[-1]))
+        return camino
@@ -0,0 +1,234 @@
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+INFINITO = float('inf')
+# Tolerancia al comparar f con el límite (las sumas de costos diagonales acumulan error de redondeo)
+TOLERANCIA = 1e-9
+
+
+class FringeSearchPathfinder(PathfinderBase):
+    """
+    Implementa Fringe Search (Björnsson et al., 2005).
+
+    Recorre la frontera como una lista enlazada, de principio a fin, con un límite de f
+    como el umbral de IDA*: los nodos con f mayor que el límite se saltean (quedan para
+    la pasada siguiente) y los demás se expanden, insertando sus hijos justo después de
+    ellos para visitarlos en la misma pasada. Al terminar la pasada el límite sube al
+    menor f salteado. El primer camino encontrado es óptimo, como en A*.
+
+    No usa cola de prioridad ni crea nodos por cada expansión: la frontera es un par de
+    diccionarios (anterior/siguiente) y de cada celda alcanzada solo se guardan g y la
+    celda anterior. A diferencia de IDA*, no repite el trabajo de las pasadas anteriores.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.posicion_inicio = None
+        self.posicion_fin = None
+        self.cache = {}          # Posición -> (g, posición anterior) de cada celda alcanzada
+        self.siguiente = {}      # Lista enlazada de la frontera: posición -> siguiente
+        self.anterior = {}       # posición -> anterior
+        self.primero = None
+        self.ultimo = None
+        self.cursor = None       # Próxima posición a visitar en la pasada actual (None: pasada terminada)
+        self.limite_f = INFINITO
+        self.f_minimo = INFINITO  # Menor f salteado en la pasada actual (límite de la siguiente)
+        self.pasadas = 0
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return [self._crear_nodo(posicion) for posicion in self._frontera()]
+
+    @open_list.setter
+    def open_list(self, valor):
+        self._restaurar(valor, self.closed_list)
+
+    @property
+    def closed_list(self):
+        return [self._crear_nodo(posicion) for posicion in self.cache if posicion not in self.siguiente]
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self._restaurar(self.open_list, valor)
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def capturar_estado(self):
+        return (self.cursor, self.limite_f, self.f_minimo, self.pasadas)
+
+    def restaurar_estado(self, estado):
+        self.cursor, self.limite_f, self.f_minimo, self.pasadas = estado
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.preparar_heuristica(pos_final)
+        self.posicion_inicio = pos_inicio
+        self.posicion_fin = pos_final
+        self.cache = {pos_inicio: (0, None)}
+        self.siguiente = {}
+        self.anterior = {}
+        self.primero = None
+        self.ultimo = None
+        self._insertar_despues(None, pos_inicio)
+        self.cursor = pos_inicio
+        self.limite_f = self.estimar(pos_inicio)
+        self.f_minimo = INFINITO
+        self.pasadas = 1
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+        if self.oyente is not None:
+            self.oyente(EventoBusqueda(INSERTAR, pos_inicio, 0, None))
+
+    def paso(self):
+        """Ejecuta una iteración: visita un nodo de la frontera o, si la pasada terminó, sube el límite."""
+        if self.terminado:
+            return False
+
+        if self.cursor is None:
+            if self.primero is None or self.f_minimo == INFINITO:
+                return False  # La frontera se vació: no hay camino
+            self.limite_f = self.f_minimo
+            self.f_minimo = INFINITO
+            self.cursor = self.primero
+            self.pasadas += 1
+            return True
+
+        self.iteraciones += 1
+
+        # PASO 1: Saltear el nodo si su f supera el límite (se revisa en la próxima pasada)
+        posicion = self.cursor
+        g, anterior = self.cache[posicion]
+        f = g + self.estimar(posicion)
+        if f > self.limite_f + TOLERANCIA:
+            if f < self.f_minimo:
+                self.f_minimo = f
+            self.cursor = self.siguiente[posicion]
+            return True
+
+        oyente = self.oyente
+        if oyente is not None:
+            oyente(EventoBusqueda(EXTRAER, posicion, g, anterior))
+
+        # PASO 2: Verificar si hemos llegado al objetivo
+        if posicion == self.posicion_fin:
+            self.camino = self._reconstruir_camino()
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, posicion, g, None))
+            return True
+
+        # PASO 3: Insertar los hijos que mejoran justo después del nodo (en orden, el primero queda al lado)
+        for pos_vecino, costo_movimiento in reversed(self.get_neighbors_and_costs(posicion)):
+            g_vecino = g + costo_movimiento
+            previo = self.cache.get(pos_vecino)
+            if previo is not None and g_vecino >= previo[0]:
+                continue
+            if pos_vecino in self.siguiente:
+                self._quitar(pos_vecino)
+            self._insertar_despues(posicion, pos_vecino)
+            self.cache[pos_vecino] = (g_vecino, posicion)
+            if oyente is not None:
+                oyente(EventoBusqueda(INSERTAR if previo is None else ACTUALIZAR, pos_vecino, g_vecino, posicion))
+
+        # PASO 4: Sacar el nodo de la frontera y seguir por el siguiente (el primer hijo, si hubo)
+        self.cursor = self.siguiente[posicion]
+        self._quitar(posicion)
+        return True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
+
+    def _frontera(self):
+        """Posiciones de la frontera en orden."""
+        posicion = self.primero
+        while posicion is not None:
+            yield posicion
+            posicion = self.siguiente[posicion]
+
+    def _insertar_despues(self, referencia, posicion):
+        """Inserta `posicion` después de `referencia` (al principio si referencia es None)."""
+        siguiente = self.primero if referencia is None else self.siguiente[referencia]
+        self.anterior[posicion] = referencia
+        self.siguiente[posicion] = siguiente
+        if referencia is None:
+            self.primero = posicion
+        else:
+            self.siguiente[referencia] = posicion
+        if siguiente is None:
+            self.ultimo = posicion
+        else:
+            self.anterior[siguiente] = posicion
+
+    def _quitar(self, posicion):
+        anterior = self.anterior.pop(posicion)
+        siguiente = self.siguiente.pop(posicion)
+        if anterior is None:
+            self.primero = siguiente
+        else:
+            self.siguiente[anterior] = siguiente
+        if siguiente is None:
+            self.ultimo = anterior
+        else:
+            self.anterior[siguiente] = anterior
+
+    def _crear_nodo(self, posicion):
+        """Nodo de visualización de una celda alcanzada (el padre solo lleva la posición anterior)."""
+        g, anterior = self.cache[posicion]
+        h = self.estimar(posicion)
+        return Nodo(Nodo(None, anterior) if anterior is not None else None, posicion, g, h, g + h)
+
+    def _restaurar(self, abiertos, cerrados):
+        """Reconstruye la cache y la frontera desde las listas (historial de TestingScene)."""
+        self.cache = {}
+        for nodo in list(cerrados) + list(abiertos):
+            self.cache[nodo.posicion] = (nodo.g, nodo.padre.posicion if nodo.padre is not None else None)
+        self.siguiente = {}
+        self.anterior = {}
+        self.primero = None
+        self.ultimo = None
+        for nodo in abiertos:
+            self._insertar_despues(self.ultimo, nodo.posicion)
+
+    def _reconstruir_camino(self):
+        """Sigue las celdas anteriores desde el objetivo hasta el inicio."""
+        camino = []
+        actual = self.posicion_fin
+        while actual is not None:
+            camino.append(actual)
+            actual = self.cache[actual][1]
+        return camino[::-1]
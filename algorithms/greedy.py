@@ -1,46 +1,18 @@
 import pygame
 import config
 from algorithms.pathfinder_base import PathfinderBase
-
-class Nodo:
-    """Una clase para representar un nodo en la búsqueda Voraz (Greedy)."""
-    def __init__(self, padre=None, posicion=None):
-        self.padre = padre      # Nodo desde el cual llegamos (para reconstruir camino)
-        self.posicion = posicion # Coordenadas (x, y) del nodo en la grilla
-
-        # Costos en búsqueda Voraz:
-        self.g = 0  # Costo real (se mantiene para reconstrucción, pero NO se usa en decisiones)
-        self.h = 0  # Heurística: estimación al objetivo (ÚNICO criterio de selección)
-        self.f = 0  # En voraz, f = h (solo heurística, ignora costo real)
-
-    def __eq__(self, otro):
-        """Dos nodos son iguales si tienen la misma posición."""
-        return self.posicion == otro.posicion
-    
-    # Propiedades para compatibilidad con código existente
-    @property
-    def parent(self):
-        return self.padre
-    
-    @parent.setter
-    def parent(self, valor):
-        self.padre = valor
-    
-    @property
-    def position(self):
-        return self.posicion
-    
-    @position.setter
-    def position(self, valor):
-        self.posicion = valor
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
 
 class GreedyPathfinder(PathfinderBase):
     """Implementa el algoritmo de búsqueda voraz (greedy) basado solo en heurística."""
 
     def __init__(self, grid, allow_diagonal=False):
         super().__init__(grid, allow_diagonal)
-        self.lista_abierta = []
+        self.lista_abierta = ColaPrioridad()
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()  # Índice de la lista cerrada para consultas O(1)
         self.nodo_inicio = None
         self.nodo_fin = None
         self.camino = None
@@ -49,11 +21,11 @@ class GreedyPathfinder(PathfinderBase):
     # Propiedades para compatibilidad con código existente
     @property
     def open_list(self):
-        return self.lista_abierta
+        return self.lista_abierta.elementos()
     
     @open_list.setter
     def open_list(self, valor):
-        self.lista_abierta = valor
+        self.lista_abierta = self._construir_frontera(valor)
     
     @property
     def closed_list(self):
@@ -62,6 +34,7 @@ class GreedyPathfinder(PathfinderBase):
     @closed_list.setter
     def closed_list(self, valor):
         self.lista_cerrada = valor
+        self.posiciones_cerradas = {nodo.posicion for nodo in valor}
     
     @property
     def start_node(self):
@@ -100,15 +73,20 @@ class GreedyPathfinder(PathfinderBase):
         # Crear nodos de inicio y objetivo
         self.nodo_inicio = Nodo(None, start_pos)
         self.nodo_fin = Nodo(None, end_pos)
+        # Heurística precalculada hacia el objetivo (no cambia durante la búsqueda)
+        self.preparar_heuristica(end_pos)
         
         # Calcular heurística inicial del nodo de inicio
-        self.nodo_inicio.h = self.calcular_heuristica(self.nodo_inicio.posicion, end_pos)
+        self.nodo_inicio.h = self.estimar(self.nodo_inicio.posicion)
         self.nodo_inicio.f = self.nodo_inicio.h  # En voraz, f = h (sin costo g)
         
         # Lista abierta: nodos por evaluar (empezamos con el nodo inicial)
-        self.lista_abierta = [self.nodo_inicio]
+        self.lista_abierta = self._construir_frontera([self.nodo_inicio])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
         # Lista cerrada: nodos ya evaluados
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()
         self.camino = None
         self.terminado = False
         self.iteraciones = 0  # Reiniciar contador de iteraciones
@@ -121,75 +99,51 @@ class GreedyPathfinder(PathfinderBase):
 
         self.iteraciones += 1  # Incrementar contador de iteraciones
 
-        # PASO 1: Encontrar el nodo que parece estar MÁS CERCA del objetivo
-        # Voraz es "codicioso" - siempre elige lo que parece mejor ahora
-        nodo_actual = self.lista_abierta[0]
-        indice_actual = 0
-        for indice, elemento in enumerate(self.lista_abierta):
-            if elemento.f < nodo_actual.f:  # f = h (solo heurística)
-                nodo_actual = elemento
-                indice_actual = indice
+        # PASO 1: Extraer el nodo que parece estar MÁS CERCA del objetivo
+        # Voraz es "codicioso" - siempre elige lo que parece mejor ahora (f = h, solo heurística)
+        nodo_actual = self.lista_abierta.extraer()
 
         # PASO 2: Mover nodo a lista cerrada
-        self.lista_abierta.pop(indice_actual)
         self.lista_cerrada.append(nodo_actual)
+        self.posiciones_cerradas.add(nodo_actual.posicion)
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(EXTRAER, nodo_actual))
 
         # PASO 3: Verificar si hemos llegado al objetivo
         if nodo_actual == self.nodo_fin:
             self.camino = self._reconstruir_camino(nodo_actual)
             self.terminado = True
+            if self.oyente is not None:
+                self.oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
             return True
 
         # PASO 4: Expandir vecinos basándose SOLO en qué tan cerca parecen estar del objetivo
         self._procesar_vecinos(nodo_actual)
         return True
-        # nodo_actual = self.lista_abierta[0]
-        # indice_actual = 0
-        # for indice, elemento in enumerate(self.lista_abierta):
-        #     if elemento.f < nodo_actual.f:
-        #         nodo_actual = elemento
-        #         indice_actual = indice
-
-        # # Mover a la lista cerrada
-        # self.lista_abierta.pop(indice_actual)
-        # self.lista_cerrada.append(nodo_actual)
-
-        # # Meta encontrada
-        # if nodo_actual == self.nodo_fin:
-        #     self.camino = self._reconstruir_camino(nodo_actual)
-        #     self.terminado = True
-        #     return True
-
-        # # Generar y procesar vecinos
-        # self._procesar_vecinos(nodo_actual)
-        # return True
     
     def _procesar_vecinos(self, nodo_actual):
         """Procesa los vecinos del nodo actual usando la funcionalidad de la clase base."""
         vecinos_con_costos = self.get_neighbors_and_costs(nodo_actual.posicion)
-        vecinos = []
-        
-        for posicion_vecino, costo_movimiento in vecinos_con_costos:
-            vecino = Nodo(nodo_actual, posicion_vecino)
-            vecino.move_cost = costo_movimiento
-            vecinos.append(vecino)
+        oyente = self.oyente
 
-        for vecino in vecinos:
+        for posicion_vecino, costo_movimiento in vecinos_con_costos:
             # Si ya está en la lista cerrada, ignorar
-            if vecino in self.lista_cerrada:
+            if posicion_vecino in self.posiciones_cerradas:
                 continue
 
             # Calcular solo la heurística (característica del algoritmo voraz)
-            vecino.h = self.calcular_heuristica(vecino.posicion, self.nodo_fin.posicion)
-            vecino.f = vecino.h  # En voraz, f = h (solo heurística)
-            vecino.g = nodo_actual.g + vecino.move_cost  # Mantener registro del costo real para reconstrucción
+            h = self.estimar(posicion_vecino)
 
             # Si ya está en lista_abierta con mejor heurística, ignorar
-            if any(nodo_abierto for nodo_abierto in self.lista_abierta 
-                   if vecino == nodo_abierto and vecino.f >= nodo_abierto.f):
+            nodo_abierto = self.lista_abierta.obtener(posicion_vecino)
+            if nodo_abierto is not None and h >= nodo_abierto.f:
                 continue
             
-            self.lista_abierta.append(vecino)
+            # En voraz, f = h; g se mantiene solo como registro del costo real para reconstrucción
+            vecino = Nodo(nodo_actual, posicion_vecino, nodo_actual.g + costo_movimiento, h, h)
+            self.lista_abierta.insertar(posicion_vecino, vecino, self._prioridad(vecino))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if nodo_abierto is None else ACTUALIZAR, vecino))
 
     def buscar_camino(self, posicion_inicio, posicion_fin):
         """Ejecuta el algoritmo completo de una vez."""
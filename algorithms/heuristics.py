@@ -0,0 +1,114 @@
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Con más celdas que esto la tabla se llena a medida que se consulta (mapas enormes donde
+# la búsqueda solo visita una parte); con menos se calcula entera y vectorizada al empezar
+LIMITE_TABLA_COMPLETA = 250_000
+# Cantidad máxima de tablas guardadas a la vez (se descarta la usada hace más tiempo)
+LIMITE_TABLAS = 4
+
+_DIAGONAL_MENOS_DOS = math.sqrt(2) - 2
+
+
+# Cada heurística recibe las diferencias absolutas dx, dy. Solo usan abs y aritmética,
+# así que sirven igual para números sueltos que para arreglos de NumPy.
+def manhattan(dx, dy):
+    return dx + dy
+
+
+def octil(dx, dy):
+    # max + (√2 - 1) * min, escrito como (dx + dy) + (√2 - 2) * min
+    return (dx + dy) + _DIAGONAL_MENOS_DOS * (dx + dy - abs(dx - dy)) / 2
+
+
+def chebyshev(dx, dy):
+    return (dx + dy + abs(dx - dy)) / 2
+
+
+def euclidiana(dx, dy):
+    return (dx * dx + dy * dy) ** 0.5
+
+
+HEURISTICAS = {
+    'manhattan': manhattan,
+    'octil': octil,
+    'chebyshev': chebyshev,
+    'euclidiana': euclidiana,
+}
+
+
+def heuristica_por_defecto(permitir_diagonal):
+    """Nombre de la heurística exacta en un mapa sin obstáculos para el tipo de movimiento."""
+    return 'octil' if permitir_diagonal else 'manhattan'
+
+
+class TablaHeuristica:
+    """
+    Valores de la heurística hacia un objetivo fijo, uno por celda en un arreglo plano
+    (índice y * columnas + x). Se calcula una vez al iniciar la búsqueda y cada consulta
+    es un acceso a la lista. Con peso > 1 es la variante ponderada (A* ponderado):
+    expande menos nodos, pero el camino puede ser hasta `peso` veces más caro.
+    """
+
+    def __init__(self, columnas, filas, objetivo, nombre='manhattan', peso=1.0):
+        self.columnas = columnas
+        self.filas = filas
+        self.objetivo = objetivo
+        self.nombre = nombre
+        self.peso = peso
+        self.funcion = HEURISTICAS[nombre]
+        self.valores = self._calcular()
+
+    def _calcular(self):
+        dx = np.abs(np.arange(self.columnas) - self.objetivo[0])[np.newaxis, :]
+        dy = np.abs(np.arange(self.filas) - self.objetivo[1])[:, np.newaxis]
+        # Lista de floats de Python: indexarla es más rápido que leer escalares de NumPy
+        return (self.funcion(dx, dy) * self.peso).ravel().tolist()
+
+    def valor(self, posicion):
+        return self.valores[posicion[1] * self.columnas + posicion[0]]
+
+
+class TablaHeuristicaPerezosa(TablaHeuristica):
+    """Como TablaHeuristica, pero calcula y guarda cada celda la primera vez que se consulta."""
+
+    def _calcular(self):
+        return {}
+
+    def valor(self, posicion):
+        valor = self.valores.get(posicion)
+        if valor is None:
+            dx = abs(posicion[0] - self.objetivo[0])
+            dy = abs(posicion[1] - self.objetivo[1])
+            valor = self.funcion(dx, dy) * self.peso
+            self.valores[posicion] = valor
+        return valor
+
+
+_tablas = OrderedDict()  # (columnas, filas, objetivo, nombre, peso) -> TablaHeuristica
+# El hilo principal y el del servicio de planificación piden tablas a la vez: consultar, crear y
+# descartar se hace con el candado tomado (una tabla descartada sigue sirviendo a quien ya la tiene)
+_candado_tablas = threading.Lock()
+
+
+def obtener_tabla_heuristica(columnas, filas, objetivo, nombre='manhattan', peso=1.0):
+    """
+    Tabla de la heurística hacia `objetivo`: completa si el mapa es manejable, perezosa si es
+    enorme. Solo depende del tamaño del mapa (no de los obstáculos), así que se comparte entre
+    buscadores y búsquedas con el mismo objetivo.
+    """
+    clave = (columnas, filas, objetivo, nombre, peso)
+    with _candado_tablas:
+        tabla = _tablas.get(clave)
+        if tabla is None:
+            clase = TablaHeuristica if columnas * filas <= LIMITE_TABLA_COMPLETA else TablaHeuristicaPerezosa
+            tabla = clase(columnas, filas, objetivo, nombre, peso)
+            _tablas[clave] = tabla
+            if len(_tablas) > LIMITE_TABLAS:
+                _tablas.popitem(last=False)
+        else:
+            _tablas.move_to_end(clave)
+    return tabla
@@ -0,0 +1,452 @@
+import heapq
+
+import config
+from algorithms.pathfinder_base import PathfinderBase, MOVIMIENTOS_BASICOS, MOVIMIENTOS_DIAGONALES, COSTO_DIAGONAL
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+# Una entrada de al menos este largo se representa con dos transiciones (sus extremos) en lugar de una
+LARGO_ENTRADA_DOBLE = 6
+
+
+class AbstraccionJerarquica:
+    """
+    Grafo abstracto de HPA* sobre una cuadrícula.
+
+    El mapa se divide en clusters cuadrados. En cada borde entre dos clusters, los
+    tramos de celdas libres a ambos lados (entradas) se representan con una o dos
+    transiciones. Los extremos de las transiciones son los nodos del grafo; se unen
+    con aristas inter-cluster (el cruce del borde) y con aristas intra-cluster cuyo
+    costo es la distancia real dentro del cluster.
+
+    Cuando cambian celdas, solo se recalculan los bordes que dependen de ellas y las
+    distancias internas de los clusters afectados.
+    """
+
+    def __init__(self, grilla, permitir_diagonal, tamano_cluster):
+        self.grilla = grilla
+        self.permitir_diagonal = permitir_diagonal
+        self.tamano = tamano_cluster
+        self.clusters_x = -(-grilla.columnas // tamano_cluster)
+        self.clusters_y = -(-grilla.filas // tamano_cluster)
+
+        self.movimientos = [(dx, dy, 1.0) for dx, dy in MOVIMIENTOS_BASICOS]
+        if permitir_diagonal:
+            self.movimientos += [(dx, dy, COSTO_DIAGONAL) for dx, dy in MOVIMIENTOS_DIAGONALES]
+
+        self.transiciones = {}  # (cluster_a, cluster_b) -> lista de (celda_a, celda_b, costo)
+        self.inter = {}         # posición -> {posición en otro cluster: costo}
+        self.nodos = {}         # cluster -> conjunto de posiciones de transición
+        self.intra = {}         # posición -> {posición del mismo cluster: distancia interna}
+        self.clusters_reconstruidos = 0  # Estadística: cuántas veces se recalculó un cluster
+        self.version = grilla.version
+        self.reconstruir()
+
+    def reconstruir(self):
+        """Construye toda la abstracción desde cero."""
+        self.transiciones = {}
+        self.inter = {}
+        self.nodos = {}
+        self.intra = {}
+        clusters = [(cx, cy) for cx in range(self.clusters_x) for cy in range(self.clusters_y)]
+        bordes = set()
+        for cluster in clusters:
+            bordes.update(self._bordes_de(cluster))
+        for clave in bordes:
+            self._actualizar_borde(clave)
+        for cluster in clusters:
+            self._calcular_intra(cluster)
+        self.version = self.grilla.version
+
+    def actualizar(self, cambios):
+        """Actualiza la abstracción tras modificar las celdas indicadas, tocando solo sus clusters."""
+        afectados = {self.cluster_de(posicion) for posicion in cambios}
+        bordes = set()
+        for cluster in afectados:
+            bordes.update(self._bordes_de(cluster))
+        for clave in bordes:
+            self._actualizar_borde(clave)
+
+        # Un vecino solo se recalcula si sus nodos cambiaron al rehacer el borde compartido
+        revisar = set(afectados)
+        for cluster_a, cluster_b in bordes:
+            revisar.add(cluster_a)
+            revisar.add(cluster_b)
+        for cluster in revisar:
+            if cluster in afectados or self._nodos_de(cluster) != self.nodos.get(cluster):
+                self._calcular_intra(cluster)
+        self.version = self.grilla.version
+
+    def cluster_de(self, posicion):
+        """Retorna las coordenadas (cx, cy) del cluster que contiene la posición."""
+        return (posicion[0] // self.tamano, posicion[1] // self.tamano)
+
+    def nodos_del_cluster(self, posicion):
+        """Retorna el conjunto de nodos abstractos del cluster que contiene la posición."""
+        return self.nodos.get(self.cluster_de(posicion), set())
+
+    def vecinos(self, posicion):
+        """Genera los pares (vecino, costo) de un nodo abstracto."""
+        yield from self.intra.get(posicion, {}).items()
+        yield from self.inter.get(posicion, {}).items()
+
+    def distancias_locales(self, origen, destinos):
+        """Distancias desde `origen` hasta cada destino alcanzable sin salir de su cluster."""
+        distancias, _ = self._dijkstra_local(origen, destinos)
+        return {destino: distancias[destino] for destino in destinos if destino != origen and destino in distancias}
+
+    def camino_local(self, origen, destino):
+        """Camino celda por celda entre dos posiciones del mismo cluster, sin salir de él."""
+        _, padres = self._dijkstra_local(origen, {destino})
+        camino = []
+        actual = destino
+        while actual is not None:
+            camino.append(actual)
+            actual = padres[actual]
+        return camino[::-1]
+
+    def _limites(self, cluster):
+        """Retorna (x0, y0, x1, y1) del cluster, con x1 e y1 exclusivos."""
+        x0 = cluster[0] * self.tamano
+        y0 = cluster[1] * self.tamano
+        return x0, y0, min(x0 + self.tamano, self.grilla.columnas), min(y0 + self.tamano, self.grilla.filas)
+
+    def _existe(self, cluster):
+        return 0 <= cluster[0] < self.clusters_x and 0 <= cluster[1] < self.clusters_y
+
+    def _libre(self, x, y):
+        grilla = self.grilla
+        return (0 <= x < grilla.columnas and 0 <= y < grilla.filas
+                and grilla.celdas[y * grilla.columnas + x] != config.STATE_OBSTACLE)
+
+    def _bordes_de(self, cluster):
+        """Claves de los bordes cuyas transiciones dependen de las celdas del cluster."""
+        cx, cy = cluster
+        pares = [((cx - 1, cy), (cx, cy)), ((cx, cy), (cx + 1, cy)),
+                 ((cx, cy - 1), (cx, cy)), ((cx, cy), (cx, cy + 1))]
+        if self.permitir_diagonal:
+            pares += [((cx - 1, cy - 1), (cx, cy)), ((cx, cy), (cx + 1, cy + 1)),
+                      ((cx - 1, cy + 1), (cx, cy)), ((cx, cy), (cx + 1, cy - 1)),
+                      # Esquinas entre dos vecinos: el cruce diagonal depende de las celdas de este cluster
+                      ((cx - 1, cy), (cx, cy + 1)), ((cx, cy - 1), (cx + 1, cy)),
+                      ((cx - 1, cy), (cx, cy - 1)), ((cx, cy + 1), (cx + 1, cy))]
+        return [par for par in pares if self._existe(par[0]) and self._existe(par[1])]
+
+    def _actualizar_borde(self, clave):
+        """Reemplaza las transiciones de un borde por las calculadas con el contenido actual."""
+        for celda_a, celda_b, _ in self.transiciones.get(clave, ()):
+            for origen, destino in ((celda_a, celda_b), (celda_b, celda_a)):
+                aristas = self.inter[origen]
+                del aristas[destino]
+                if not aristas:
+                    del self.inter[origen]
+
+        transiciones = self._calcular_transiciones(*clave)
+        self.transiciones[clave] = transiciones
+        for celda_a, celda_b, costo in transiciones:
+            self.inter.setdefault(celda_a, {})[celda_b] = costo
+            self.inter.setdefault(celda_b, {})[celda_a] = costo
+
+    def _calcular_transiciones(self, cluster_a, cluster_b):
+        """Calcula las transiciones entre dos clusters vecinos (cluster_b está a la derecha o en diagonal)."""
+        x0, y0, x1, y1 = self._limites(cluster_a)
+        dx, dy = cluster_b[0] - cluster_a[0], cluster_b[1] - cluster_a[1]
+        libre = self._libre
+
+        if dx and dy:
+            # Esquina: solo hace falta una transición si el cruce diagonal no puede hacerse con dos pasos rectos
+            ax, ay = x1 - 1, (y1 - 1 if dy > 0 else y0)
+            bx, by = ax + 1, ay + dy
+            if libre(ax, ay) and libre(bx, by) and not libre(bx, ay) and not libre(ax, by):
+                return [((ax, ay), (bx, by), COSTO_DIAGONAL)]
+            return []
+
+        if dx:
+            # Borde vertical: última columna de cluster_a frente a la primera de cluster_b
+            pares = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+            paso_x, paso_y, desde, hasta = 0, 1, y0, y1
+        else:
+            # Borde horizontal: última fila de cluster_a frente a la primera de cluster_b
+            pares = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+            paso_x, paso_y, desde, hasta = 1, 0, x0, x1
+
+        # Cada tramo continuo de pares libres es una entrada
+        transiciones = []
+        tramo = []
+        for celda_a, celda_b in pares + [(None, None)]:
+            if celda_a is not None and libre(*celda_a) and libre(*celda_b):
+                tramo.append((celda_a, celda_b))
+                continue
+            if tramo:
+                elegidos = [tramo[len(tramo) // 2]] if len(tramo) < LARGO_ENTRADA_DOBLE else [tramo[0], tramo[-1]]
+                transiciones += [(a, b, 1.0) for a, b in elegidos]
+                tramo = []
+
+        if self.permitir_diagonal:
+            # Cruces diagonales que no pueden reemplazarse por dos pasos rectos libres
+            for celda_a, celda_b in pares:
+                if not libre(*celda_a) or libre(*celda_b):
+                    continue
+                for signo in (-1, 1):
+                    destino = (celda_b[0] + paso_x * signo, celda_b[1] + paso_y * signo)
+                    if not desde <= destino[0] * paso_x + destino[1] * paso_y < hasta:
+                        continue  # Cae en un cluster de esquina: lo cubre esa clave
+                    if libre(*destino) and not libre(celda_a[0] + paso_x * signo, celda_a[1] + paso_y * signo):
+                        transiciones.append((celda_a, destino, COSTO_DIAGONAL))
+        return transiciones
+
+    def _nodos_de(self, cluster):
+        """Extremos de transición que caen dentro del cluster."""
+        nodos = set()
+        for clave in self._bordes_de(cluster):
+            if cluster not in clave:
+                continue
+            for celda_a, celda_b, _ in self.transiciones.get(clave, ()):
+                if self.cluster_de(celda_a) == cluster:
+                    nodos.add(celda_a)
+                if self.cluster_de(celda_b) == cluster:
+                    nodos.add(celda_b)
+        return nodos
+
+    def _calcular_intra(self, cluster):
+        """Recalcula los nodos del cluster y las distancias internas entre cada par de ellos."""
+        for nodo in self.nodos.get(cluster, ()):
+            self.intra.pop(nodo, None)
+        nodos = self._nodos_de(cluster)
+        self.nodos[cluster] = nodos
+        for nodo in nodos:
+            self.intra[nodo] = {}
+        # Las distancias son simétricas: cada nodo solo busca a los que vienen después de él
+        ordenados = sorted(nodos)
+        for i, nodo in enumerate(ordenados):
+            for otro, distancia in self.distancias_locales(nodo, ordenados[i + 1:]).items():
+                self.intra[nodo][otro] = distancia
+                self.intra[otro][nodo] = distancia
+        self.clusters_reconstruidos += 1
+
+    def _dijkstra_local(self, origen, destinos):
+        """Dijkstra sin salir del cluster del origen; se detiene al alcanzar todos los destinos."""
+        x0, y0, x1, y1 = self._limites(self.cluster_de(origen))
+        columnas = self.grilla.columnas
+        celdas = self.grilla.celdas
+        obstaculo = config.STATE_OBSTACLE
+
+        distancias = {origen: 0}
+        padres = {origen: None}
+        pendientes = set(destinos)
+        pendientes.discard(origen)
+        monticulo = [(0, origen)]
+        while monticulo and pendientes:
+            distancia, posicion = heapq.heappop(monticulo)
+            if distancia > distancias[posicion]:
+                continue
+            pendientes.discard(posicion)
+            x, y = posicion
+            for dx, dy, costo in self.movimientos:
+                nx, ny = x + dx, y + dy
+                if x0 <= nx < x1 and y0 <= ny < y1 and celdas[ny * columnas + nx] != obstaculo:
+                    vecino = (nx, ny)
+                    nueva = distancia + costo
+                    if nueva < distancias.get(vecino, float('inf')):
+                        distancias[vecino] = nueva
+                        padres[vecino] = posicion
+                        heapq.heappush(monticulo, (nueva, vecino))
+        return distancias, padres
+
+
+class HierarchicalPathfinder(PathfinderBase):
+    """
+    Implementa HPA* (Hierarchical Pathfinding A*).
+
+    Busca con A* sobre el grafo abstracto de transiciones entre clusters (ver
+    AbstraccionJerarquica) y luego refina cada tramo abstracto en celdas con una
+    búsqueda local dentro del cluster. En mapas grandes expande muy pocos nodos a
+    cambio de caminos que pueden ser algo más largos que el óptimo.
+
+    La abstracción se guarda entre búsquedas y se actualiza solo en los clusters
+    que cambiaron desde la última versión de la cuadrícula. Las listas abierta y
+    cerrada contienen nodos abstractos.
+    """
+
+    def __init__(self, grid, allow_diagonal=False, tamano_cluster=None):
+        super().__init__(grid, allow_diagonal)
+        self.tamano_cluster = tamano_cluster or config.HPA_CLUSTER_SIZE
+        self.abstraccion = None
+        self.aristas_temporales = {}  # Aristas que conectan inicio y objetivo con el grafo abstracto
+        self.lista_abierta = ColaPrioridad()
+        self.lista_cerrada = []
+        self.posiciones_cerradas = set()
+        self.nodo_inicio = None
+        self.nodo_fin = None
+        self.camino_abstracto = None
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.lista_abierta.elementos()
+
+    @open_list.setter
+    def open_list(self, valor):
+        self.lista_abierta = self._construir_frontera(valor)
+
+    @property
+    def closed_list(self):
+        return self.lista_cerrada
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self.lista_cerrada = valor
+        self.posiciones_cerradas = {nodo.posicion for nodo in valor}
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def obtener_abstraccion(self):
+        """Retorna la abstracción al día con la cuadrícula, reconstruyendo solo los clusters modificados."""
+        if self.abstraccion is None:
+            self.abstraccion = AbstraccionJerarquica(self.grid, self.allow_diagonal, self.tamano_cluster)
+        elif self.abstraccion.version != self.grid.version:
+            cambios = self.grid.cambios_desde(self.abstraccion.version)
+            if cambios is None:
+                self.abstraccion.reconstruir()
+            else:
+                self.abstraccion.actualizar(cambios)
+        return self.abstraccion
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.nodo_inicio = Nodo(None, pos_inicio)
+        self.nodo_fin = Nodo(None, pos_final)
+        self.aristas_temporales = {}
+        self.lista_cerrada = []
+        self.posiciones_cerradas = set()
+        self.camino_abstracto = None
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+
+        # Un extremo sobre un obstáculo no tiene distancias locales en su cluster: no hay camino
+        if (self.grid.obtener_estado(pos_inicio) == config.STATE_OBSTACLE
+                or self.grid.obtener_estado(pos_final) == config.STATE_OBSTACLE):
+            self.lista_abierta = self._construir_frontera([])
+            self.terminado = True
+            return
+
+        # Conectar inicio y objetivo con los nodos de sus clusters (solo para esta búsqueda)
+        abstraccion = self.obtener_abstraccion()
+        destinos = set(abstraccion.nodos_del_cluster(pos_inicio))
+        if abstraccion.cluster_de(pos_inicio) == abstraccion.cluster_de(pos_final):
+            destinos.add(pos_final)
+        for nodo, costo in abstraccion.distancias_locales(pos_inicio, destinos).items():
+            self._agregar_arista_temporal(pos_inicio, nodo, costo)
+        for nodo, costo in abstraccion.distancias_locales(pos_final, abstraccion.nodos_del_cluster(pos_final)).items():
+            self._agregar_arista_temporal(nodo, pos_final, costo)
+
+        self.lista_abierta = self._construir_frontera([self.nodo_inicio])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
+
+    def paso(self):
+        """Ejecuta una iteración: expande el nodo abstracto con menor f."""
+        if not self.lista_abierta or self.terminado:
+            return False
+
+        self.iteraciones += 1
+
+        # PASO 1: Extraer el nodo abstracto más prometedor y cerrarlo
+        nodo_actual = self.lista_abierta.extraer()
+        self.lista_cerrada.append(nodo_actual)
+        self.posiciones_cerradas.add(nodo_actual.posicion)
+        oyente = self.oyente
+        if oyente is not None:
+            oyente(evento_de_nodo(EXTRAER, nodo_actual))
+
+        # PASO 2: Verificar si hemos llegado al objetivo
+        if nodo_actual == self.nodo_fin:
+            self.camino = self._refinar_camino(nodo_actual)
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
+            return True
+
+        # PASO 3: Expandir los vecinos en el grafo abstracto (los eventos son de nodos abstractos)
+        for pos_vecino, costo in self._vecinos_abstractos(nodo_actual.posicion):
+            if pos_vecino in self.posiciones_cerradas:
+                continue
+            g = nodo_actual.g + costo
+
+            nodo_abierto = self.lista_abierta.obtener(pos_vecino)
+            if nodo_abierto is not None and g >= nodo_abierto.g:
+                continue
+
+            h = self.calcular_heuristica(pos_vecino, self.nodo_fin.posicion)
+            vecino = Nodo(nodo_actual, pos_vecino, g, h, g + h)
+            self.lista_abierta.insertar(pos_vecino, vecino, self._prioridad(vecino))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if nodo_abierto is None else ACTUALIZAR, vecino))
+        return True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.lista_abierta and not self.terminado:
+            self.paso()
+        return self.camino
+
+    def _agregar_arista_temporal(self, origen, destino, costo):
+        aristas = self.aristas_temporales.setdefault(origen, {})
+        if costo < aristas.get(destino, float('inf')):
+            aristas[destino] = costo
+
+    def _vecinos_abstractos(self, posicion):
+        """Vecinos de un nodo en el grafo abstracto más las aristas temporales de esta búsqueda."""
+        yield from self.abstraccion.vecinos(posicion)
+        yield from self.aristas_temporales.get(posicion, {}).items()
+
+    def _refinar_camino(self, nodo_actual):
+        """Reconstruye el camino abstracto y lo convierte en un camino celda por celda."""
+        abstracto = []
+        actual = nodo_actual
+        while actual is not None:
+            abstracto.append(actual.posicion)
+            actual = actual.padre
+        abstracto.reverse()
+        self.camino_abstracto = abstracto
+
+        camino = [abstracto[0]]
+        for origen, destino in zip(abstracto, abstracto[1:]):
+            if self.abstraccion.cluster_de(origen) == self.abstraccion.cluster_de(destino):
+                # Arista intra-cluster: se recorre con una búsqueda local dentro del cluster
+                camino += self.abstraccion.camino_local(origen, destino)[1:]
+            else:
+                # Arista inter-cluster: es un único paso que cruza el borde
+                camino.append(destino)
+        return camino
@@ -0,0 +1,216 @@
+import config
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, OBJETIVO
+
+INFINITO = float('inf')
+# Tolerancia al comparar f con el umbral (las sumas de costos diagonales acumulan error de redondeo)
+TOLERANCIA = 1e-9
+
+
+class IDAStarPathfinder(PathfinderBase):
+    """
+    Implementa IDA* (A* con profundización iterativa).
+
+    Hace búsquedas en profundidad que descartan todo nodo con f = g + h mayor que un
+    umbral. Si una pasada termina sin llegar al objetivo, el umbral sube al menor f
+    descartado y se empieza de nuevo. Con una heurística admisible el primer camino
+    encontrado es óptimo.
+
+    No guarda listas abierta ni cerrada: solo el camino actual de la búsqueda en
+    profundidad (lista cerrada, para visualizar) y los hermanos que quedan por
+    probar en cada nivel (lista abierta), así que la memoria crece con la
+    profundidad del camino y no con el tamaño del mapa.
+
+    En una cuadrícula hay muchísimos caminos distintos hacia la misma celda, y sin
+    memoria IDA* los recorre todos. Por eso se recuerda el menor g con que se llegó a
+    cada celda en la pasada actual (tabla de transposición) y se poda lo que llega
+    peor; la tabla tiene un tamaño máximo (`limite_transposiciones`, 0 la desactiva),
+    de modo que la memoria sigue acotada. La tabla también permite saber que no hay
+    camino: si todo lo que quedó fuera del umbral son celdas ya alcanzadas en la pasada,
+    ya se recorrió toda la zona conectada al inicio.
+    """
+
+    def __init__(self, grid, allow_diagonal=False, limite_transposiciones=config.IDA_TRANSPOSITION_LIMIT):
+        super().__init__(grid, allow_diagonal)
+        self.limite_transposiciones = limite_transposiciones
+        self.posicion_inicio = None
+        self.posicion_fin = None
+        self.umbral = INFINITO
+        self.siguiente_umbral = INFINITO  # Menor f descartado en la pasada actual
+        self.pasadas = 0                  # Cantidad de umbrales probados
+        self.pila = []                    # Camino actual de la búsqueda en profundidad
+        self.en_pila = set()              # Posiciones de la pila (evita ciclos)
+        self.pendientes = []              # Hijos por probar; el último es el siguiente
+        self.transposiciones = {}         # Posición -> menor g visto en esta pasada
+        self.podadas = set()              # Celdas fuera del umbral que no estaban en la tabla al podarlas
+        self.tabla_incompleta = False     # True si en esta pasada alguna celda no entró en la tabla
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.pendientes
+
+    @open_list.setter
+    def open_list(self, valor):
+        self.pendientes = list(valor)
+        self._olvidar_pasada()
+
+    @property
+    def closed_list(self):
+        return self.pila
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self.pila = list(valor)
+        self.en_pila = {nodo.posicion for nodo in self.pila}
+        self._olvidar_pasada()
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def capturar_estado(self):
+        return (self.umbral, self.siguiente_umbral, self.pasadas)
+
+    def restaurar_estado(self, estado):
+        self.umbral, self.siguiente_umbral, self.pasadas = estado
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.preparar_heuristica(pos_final)
+        self.posicion_inicio = pos_inicio
+        self.posicion_fin = pos_final
+        self.umbral = self.estimar(pos_inicio)
+        self.pasadas = 1
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+        self._empezar_pasada()
+
+    def _empezar_pasada(self):
+        """Vacía la búsqueda en profundidad y la reinicia desde el inicio con el umbral actual."""
+        h = self.estimar(self.posicion_inicio)
+        nodo_inicio = Nodo(None, self.posicion_inicio, 0, h, h)
+        self.siguiente_umbral = INFINITO
+        self.pila = []
+        self.en_pila = set()
+        self.pendientes = [nodo_inicio]
+        self.transposiciones = {self.posicion_inicio: 0}
+        self.podadas = set()
+        self.tabla_incompleta = False
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, nodo_inicio))
+
+    def paso(self):
+        """Ejecuta una iteración: entra al siguiente nodo pendiente o, si la pasada se agotó, sube el umbral."""
+        if self.terminado:
+            return False
+
+        if not self.pendientes:
+            if self.siguiente_umbral == INFINITO or self._zona_completa():
+                return False  # No hay camino
+            self.umbral = self.siguiente_umbral
+            self.pasadas += 1
+            self._empezar_pasada()
+            return True
+
+        self.iteraciones += 1
+
+        # PASO 1: Tomar el siguiente hijo y retroceder la pila hasta su padre
+        nodo_actual = self.pendientes.pop()
+        padre = nodo_actual.padre.posicion if nodo_actual.padre is not None else None
+        while self.pila and self.pila[-1].posicion != padre:
+            self.en_pila.discard(self.pila.pop().posicion)
+        self.pila.append(nodo_actual)
+        self.en_pila.add(nodo_actual.posicion)
+        oyente = self.oyente
+        if oyente is not None:
+            oyente(evento_de_nodo(EXTRAER, nodo_actual))
+
+        # PASO 2: Verificar si hemos llegado al objetivo (la pila es el camino)
+        if nodo_actual.posicion == self.posicion_fin:
+            self.camino = [nodo.posicion for nodo in self.pila]
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
+            return True
+
+        # PASO 3: Generar los hijos dentro del umbral; el de menor f se prueba primero
+        limite = self.umbral + TOLERANCIA
+        transposiciones = self.transposiciones
+        hijos = []
+        for pos_vecino, costo_movimiento in self.get_neighbors_and_costs(nodo_actual.posicion):
+            if pos_vecino in self.en_pila:
+                continue
+            g = nodo_actual.g + costo_movimiento
+            if g >= transposiciones.get(pos_vecino, INFINITO) - TOLERANCIA:
+                continue  # Ya se llegó a esta celda con un costo igual o menor en esta pasada
+            h = self.estimar(pos_vecino)
+            f = g + h
+            if f > limite:
+                if f < self.siguiente_umbral:
+                    self.siguiente_umbral = f
+                if pos_vecino not in transposiciones:
+                    self.podadas.add(pos_vecino)
+                continue
+            if pos_vecino in transposiciones or len(transposiciones) < self.limite_transposiciones:
+                transposiciones[pos_vecino] = g
+            else:
+                self.tabla_incompleta = True
+            hijos.append(Nodo(nodo_actual, pos_vecino, g, h, f))
+        hijos.sort(key=lambda nodo: nodo.f, reverse=True)
+        self.pendientes.extend(hijos)
+        if oyente is not None:
+            for hijo in hijos:
+                oyente(evento_de_nodo(INSERTAR, hijo))
+        return True
+
+    def _zona_completa(self):
+        """
+        True si la pasada que terminó alcanzó todas las celdas conectadas al inicio: cada
+        vecino de una celda expandida se alcanzó o se podó, y todas las podadas por el
+        umbral terminaron alcanzadas. Si la tabla se llenó no se puede asegurar.
+        """
+        if self.tabla_incompleta:
+            return False
+        return all(posicion in self.transposiciones for posicion in self.podadas)
+
+    def _olvidar_pasada(self):
+        """Tras restaurar las listas se desconoce lo visto antes en la pasada (solo se pierde poda)."""
+        self.transposiciones = {}
+        self.podadas = set()
+        self.tabla_incompleta = True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
@@ -0,0 +1,255 @@
+import config
+from algorithms.pathfinder_base import PathfinderBase, MOVIMIENTOS_BASICOS, MOVIMIENTOS_DIAGONALES, COSTO_DIAGONAL
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+
+def _signo(valor):
+    return (valor > 0) - (valor < 0)
+
+
+class JumpPointPathfinder(PathfinderBase):
+    """
+    Implementa Jump Point Search (JPS) sobre cuadrículas de costo uniforme.
+
+    Es un A* que, en lugar de agregar cada vecino a la lista abierta, "salta" en
+    línea recta mientras el camino sea simétrico y solo se detiene en los puntos
+    de salto (celdas con vecinos forzados o el objetivo). Así expande muchos menos
+    nodos que A* y encuentra caminos del mismo costo.
+
+    Las listas abierta y cerrada contienen solo puntos de salto; el camino final se
+    expande celda por celda para que el Agent pueda recorrerlo.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.lista_abierta = ColaPrioridad()
+        self.lista_cerrada = []
+        self.posiciones_cerradas = set()
+        self.nodo_inicio = None
+        self.nodo_fin = None
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return self.lista_abierta.elementos()
+
+    @open_list.setter
+    def open_list(self, valor):
+        self.lista_abierta = self._construir_frontera(valor)
+
+    @property
+    def closed_list(self):
+        return self.lista_cerrada
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self.lista_cerrada = valor
+        self.posiciones_cerradas = {nodo.posicion for nodo in valor}
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.nodo_inicio = Nodo(None, pos_inicio)
+        self.nodo_inicio.h = self.calcular_heuristica(pos_inicio, pos_final)
+        self.nodo_inicio.f = self.nodo_inicio.h
+        self.nodo_fin = Nodo(None, pos_final)
+
+        self.lista_abierta = self._construir_frontera([self.nodo_inicio])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
+        self.lista_cerrada = []
+        self.posiciones_cerradas = set()
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+
+    def paso(self):
+        """Ejecuta una iteración: expande el punto de salto con menor f."""
+        if not self.lista_abierta or self.terminado:
+            return False
+
+        self.iteraciones += 1
+
+        # PASO 1: Extraer el punto de salto más prometedor y cerrarlo
+        nodo_actual = self.lista_abierta.extraer()
+        self.lista_cerrada.append(nodo_actual)
+        self.posiciones_cerradas.add(nodo_actual.posicion)
+        oyente = self.oyente
+        if oyente is not None:
+            oyente(evento_de_nodo(EXTRAER, nodo_actual))
+
+        # PASO 2: Verificar si hemos llegado al objetivo
+        if nodo_actual == self.nodo_fin:
+            self.camino = self._reconstruir_camino(nodo_actual)
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
+            return True
+
+        # PASO 3: Saltar en cada dirección no podada y agregar los puntos de salto encontrados
+        # (los eventos son por punto de salto: el padre es el punto anterior, no la celda vecina)
+        x, y = nodo_actual.posicion
+        for dx, dy in self._direcciones(nodo_actual):
+            punto = self._saltar(x, y, dx, dy)
+            if punto is None or punto in self.posiciones_cerradas:
+                continue
+
+            # El salto es una línea recta u oblicua: su costo es la cantidad de pasos por el costo de cada uno
+            pasos = max(abs(punto[0] - x), abs(punto[1] - y))
+            g = nodo_actual.g + pasos * (COSTO_DIAGONAL if dx and dy else 1.0)
+
+            nodo_abierto = self.lista_abierta.obtener(punto)
+            if nodo_abierto is not None and g >= nodo_abierto.g:
+                continue
+
+            h = self.calcular_heuristica(punto, self.nodo_fin.posicion)
+            sucesor = Nodo(nodo_actual, punto, g, h, g + h)
+            self.lista_abierta.insertar(punto, sucesor, self._prioridad(sucesor))
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR if nodo_abierto is None else ACTUALIZAR, sucesor))
+        return True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.lista_abierta and not self.terminado:
+            self.paso()
+        return self.camino
+
+    def _es_transitable(self, x, y):
+        """True si (x, y) está dentro de la cuadrícula y no es un obstáculo."""
+        columnas = self.grid.columnas
+        return 0 <= x < columnas and 0 <= y < self.grid.filas and self.grid.celdas[y * columnas + x] != config.STATE_OBSTACLE
+
+    def _direcciones(self, nodo):
+        """Direcciones a explorar desde un nodo, podando las que llevan a caminos simétricos."""
+        if nodo.padre is None:
+            # El nodo inicial explora en todas las direcciones permitidas
+            if self.allow_diagonal:
+                return MOVIMIENTOS_BASICOS + MOVIMIENTOS_DIAGONALES
+            return MOVIMIENTOS_BASICOS
+
+        x, y = nodo.posicion
+        dx = _signo(x - nodo.padre.posicion[0])
+        dy = _signo(y - nodo.padre.posicion[1])
+        libre = self._es_transitable
+
+        if not self.allow_diagonal:
+            # En 4 direcciones se sigue recto y se abren los dos giros perpendiculares
+            if dx != 0:
+                return ((dx, 0), (0, -1), (0, 1))
+            return ((0, dy), (-1, 0), (1, 0))
+
+        if dx != 0 and dy != 0:
+            # Diagonal: vecinos naturales más los forzados por obstáculos detrás
+            direcciones = [(dx, 0), (0, dy), (dx, dy)]
+            if not libre(x - dx, y):
+                direcciones.append((-dx, dy))
+            if not libre(x, y - dy):
+                direcciones.append((dx, -dy))
+            return direcciones
+        if dx != 0:
+            direcciones = [(dx, 0)]
+            if not libre(x, y + 1):
+                direcciones.append((dx, 1))
+            if not libre(x, y - 1):
+                direcciones.append((dx, -1))
+            return direcciones
+        direcciones = [(0, dy)]
+        if not libre(x + 1, y):
+            direcciones.append((1, dy))
+        if not libre(x - 1, y):
+            direcciones.append((-1, dy))
+        return direcciones
+
+    def _saltar(self, x, y, dx, dy):
+        """
+        Avanza desde (x, y) en la dirección (dx, dy) y retorna el primer punto de salto
+        encontrado, o None si la línea choca con un obstáculo o el borde.
+        """
+        libre = self._es_transitable
+        objetivo = self.nodo_fin.posicion
+        while True:
+            x += dx
+            y += dy
+            if not libre(x, y):
+                return None
+            if (x, y) == objetivo:
+                return (x, y)
+
+            if self.allow_diagonal:
+                if dx != 0 and dy != 0:
+                    # Vecinos forzados en diagonal
+                    if (not libre(x - dx, y) and libre(x - dx, y + dy)) or (not libre(x, y - dy) and libre(x + dx, y - dy)):
+                        return (x, y)
+                    # Un movimiento diagonal se detiene si alguna de sus componentes rectas encuentra algo
+                    if self._saltar(x, y, dx, 0) is not None or self._saltar(x, y, 0, dy) is not None:
+                        return (x, y)
+                elif dx != 0:
+                    if (not libre(x, y + 1) and libre(x + dx, y + 1)) or (not libre(x, y - 1) and libre(x + dx, y - 1)):
+                        return (x, y)
+                else:
+                    if (not libre(x + 1, y) and libre(x + 1, y + dy)) or (not libre(x - 1, y) and libre(x - 1, y + dy)):
+                        return (x, y)
+            else:
+                if dx != 0:
+                    # Horizontal: se detiene al pasar una esquina que abre un camino perpendicular
+                    if (libre(x, y - 1) and not libre(x - dx, y - 1)) or (libre(x, y + 1) and not libre(x - dx, y + 1)):
+                        return (x, y)
+                else:
+                    if (libre(x - 1, y) and not libre(x - 1, y - dy)) or (libre(x + 1, y) and not libre(x + 1, y - dy)):
+                        return (x, y)
+                    # Un movimiento vertical se detiene si un salto horizontal desde aquí encuentra algo
+                    if self._saltar(x, y, 1, 0) is not None or self._saltar(x, y, -1, 0) is not None:
+                        return (x, y)
+
+    def _reconstruir_camino(self, nodo_actual):
+        """Reconstruye el camino entre puntos de salto y lo expande a pasos de una celda."""
+        puntos = []
+        actual = nodo_actual
+        while actual is not None:
+            puntos.append(actual.posicion)
+            actual = actual.padre
+        puntos.reverse()
+
+        camino = [puntos[0]]
+        for destino in puntos[1:]:
+            x, y = camino[-1]
+            dx = _signo(destino[0] - x)
+            dy = _signo(destino[1] - y)
+            while (x, y) != destino:
+                x += dx
+                y += dy
+                camino.append((x, y))
+        return camino
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+import numpy as np
+
+import config
+from algorithms.heuristics import HEURISTICAS, heuristica_por_defecto
+from algorithms.wavefront import mascara_libre, FrenteDeOnda
+
+# Cantidad máxima de tablas por objetivo guardadas a la vez (se descarta la usada hace más tiempo)
+LIMITE_TABLAS_OBJETIVO = 8
+
+
+class TablaALT:
+    """Valores de la heurística ALT hacia un objetivo, uno por celda (mismo acceso que TablaHeuristica)."""
+
+    def __init__(self, columnas, objetivo, valores):
+        self.columnas = columnas
+        self.objetivo = objetivo
+        self.valores = valores
+
+    def valor(self, posicion):
+        return self.valores[posicion[1] * self.columnas + posicion[0]]
+
+
+class PuntosReferencia:
+    """
+    Heurística ALT (A*, Landmarks, desigualdad triangular).
+
+    Se eligen unas pocas celdas de referencia L y se guarda la distancia real de cada
+    una a todas las celdas. Por la desigualdad triangular, para cualquier celda v y
+    objetivo t se cumple d(v, t) >= |d(L, t) - d(L, v)|, así que el máximo sobre las
+    referencias es una cota inferior válida, mucho más ajustada que la geométrica en
+    mapas con paredes y pasillos.
+
+    Las referencias se eligen por punto más lejano: la primera es la celda más alejada
+    de una celda libre cualquiera y cada siguiente la más alejada de todas las ya
+    elegidas, de modo que queden repartidas por los bordes del mapa. Las distancias
+    se calculan con el frente de onda de NumPy y se guardan en float32.
+    """
+
+    def __init__(self, grilla, permitir_diagonal=False, cantidad=config.ALT_LANDMARKS):
+        self.columnas = grilla.columnas
+        self.filas = grilla.filas
+        self.permitir_diagonal = permitir_diagonal
+        self.referencias = []  # Posiciones (x, y) elegidas
+        self._tablas = OrderedDict()  # (objetivo, peso) -> TablaALT
+
+        mascara = mascara_libre(grilla)
+        filas_distancias = self._elegir(mascara, cantidad)
+        if filas_distancias:
+            self.distancias = np.vstack(filas_distancias).astype(np.float32)
+        else:
+            self.distancias = np.empty((0, self.columnas * self.filas), dtype=np.float32)
+        # Redondear a float32 puede subir la cota un poco; se descuenta para que siga siendo admisible
+        finitas = self.distancias[np.isfinite(self.distancias)]
+        self.margen = float(finitas.max()) * 1e-6 if finitas.size else 0.0
+
+    def _distancias_desde(self, mascara, indice):
+        onda = FrenteDeOnda(mascara, (indice % self.columnas, indice // self.columnas), self.permitir_diagonal)
+        onda.completar()
+        return onda.distancias
+
+    def _elegir(self, mascara, cantidad):
+        """Elige las referencias por punto más lejano y retorna sus arreglos de distancias."""
+        libre = mascara.ravel()
+        if cantidad <= 0 or not libre.any():
+            return []
+
+        # La primera referencia es la celda más lejana (en su componente) a la primera celda libre
+        desde_semilla = self._distancias_desde(mascara, int(np.flatnonzero(libre)[0]))
+        candidata = int(np.argmax(np.where(libre & np.isfinite(desde_semilla), desde_semilla, -1.0)))
+
+        # Distancia de cada celda libre a la referencia más cercana (-inf en obstáculos para no elegirlos)
+        cercania = np.where(libre, np.inf, -np.inf)
+        filas_distancias = []
+        while len(filas_distancias) < cantidad:
+            distancias = self._distancias_desde(mascara, candidata)
+            self.referencias.append((candidata % self.columnas, candidata // self.columnas))
+            filas_distancias.append(distancias)
+            np.minimum(cercania, distancias, out=cercania, where=libre)
+            # Las celdas de componentes aún sin referencia siguen en inf y se eligen primero
+            candidata = int(np.argmax(cercania))
+            if cercania[candidata] <= 0:
+                break  # Todas las celdas libres ya son referencias
+        return filas_distancias
+
+    def tabla_hacia(self, objetivo, peso=1.0):
+        """TablaALT hacia `objetivo`, combinada (máximo) con la heurística geométrica del movimiento."""
+        clave = (objetivo, peso)
+        tabla = self._tablas.get(clave)
+        if tabla is not None:
+            self._tablas.move_to_end(clave)
+            return tabla
+
+        # Cota geométrica: también es admisible y puede ganar cerca del objetivo
+        dx = np.abs(np.arange(self.columnas) - objetivo[0])[np.newaxis, :]
+        dy = np.abs(np.arange(self.filas) - objetivo[1])[:, np.newaxis]
+        valores = HEURISTICAS[heuristica_por_defecto(self.permitir_diagonal)](dx, dy).ravel().astype(np.float64)
+
+        if len(self.referencias):
+            indice = objetivo[1] * self.columnas + objetivo[0]
+            hacia_objetivo = self.distancias[:, indice].astype(np.float64)[:, np.newaxis]
+            with np.errstate(invalid='ignore'):
+                diferencias = np.abs(self.distancias - hacia_objetivo)
+            # Referencias que no alcanzan a la celda o al objetivo no aportan cota
+            diferencias[~np.isfinite(diferencias)] = 0.0
+            np.maximum(valores, diferencias.max(axis=0) - self.margen, out=valores)
+
+        tabla = TablaALT(self.columnas, objetivo, (valores * peso).tolist())
+        self._tablas[clave] = tabla
+        if len(self._tablas) > LIMITE_TABLAS_OBJETIVO:
+            self._tablas.popitem(last=False)
+        return tabla
+
+    def estimar(self, pos1, pos2):
+        """Cota ALT entre dos celdas cualesquiera (sin tabla, para consultas sueltas)."""
+        dx = abs(pos1[0] - pos2[0])
+        dy = abs(pos1[1] - pos2[1])
+        cota = HEURISTICAS[heuristica_por_defecto(self.permitir_diagonal)](dx, dy)
+        if len(self.referencias):
+            a = self.distancias[:, pos1[1] * self.columnas + pos1[0]]
+            b = self.distancias[:, pos2[1] * self.columnas + pos2[0]]
+            validas = np.isfinite(a) & np.isfinite(b)
+            if validas.any():
+                cota = max(cota, float(np.abs(a[validas] - b[validas]).max()) - self.margen)
+        return cota
@@ -0,0 +1,39 @@
+class Nodo:
+    """
+    Nodo de búsqueda compartido por todos los algoritmos.
+
+    Usa __slots__ para no reservar un __dict__ por instancia: cada vecino generado
+    en cada expansión crea uno, así que el ahorro de memoria es considerable en
+    búsquedas grandes.
+    """
+    __slots__ = ('padre', 'posicion', 'g', 'h', 'f')
+
+    def __init__(self, padre=None, posicion=None, g=0, h=0, f=0):
+        self.padre = padre      # Nodo desde el cual llegamos (para reconstruir camino)
+        self.posicion = posicion # Coordenadas (x, y) del nodo en la grilla
+
+        # Costos de la búsqueda (cada algoritmo decide cuál usa para ordenar):
+        self.g = g  # Costo real desde el inicio hasta este nodo
+        self.h = h  # Heurística: estimación del costo desde este nodo al objetivo
+        self.f = f  # Costo total estimado - usado para seleccionar nodos
+
+    def __eq__(self, otro):
+        """Dos nodos son iguales si tienen la misma posición."""
+        return self.posicion == otro.posicion
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def parent(self):
+        return self.padre
+
+    @parent.setter
+    def parent(self, valor):
+        self.padre = valor
+
+    @property
+    def position(self):
+        return self.posicion
+
+    @position.setter
+    def position(self, valor):
+        self.posicion = valor
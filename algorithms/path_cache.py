@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+import config
+
+
+class ResultadoBusqueda:
+    """Camino encontrado y estadísticas de la búsqueda que lo produjo."""
+    __slots__ = ('camino', 'iteraciones', 'nodos_expandidos')
+
+    def __init__(self, camino, iteraciones, nodos_expandidos):
+        self.camino = camino
+        self.iteraciones = iteraciones
+        self.nodos_expandidos = nodos_expandidos
+
+
+class CacheCaminos:
+    """
+    Cache LRU de resultados de búsqueda.
+
+    La clave es (huella de la cuadrícula, inicio, fin, nombre del algoritmo, diagonal).
+    Como la huella depende del contenido, editar la cuadrícula invalida sus entradas
+    sin avisar a la cache: las claves viejas dejan de pedirse y salen por antigüedad.
+    """
+
+    def __init__(self, capacidad=config.PATH_CACHE_SIZE):
+        self.capacidad = capacidad
+        self.entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self.entradas)
+
+    @staticmethod
+    def clave(grilla, inicio, fin, nombre_algoritmo, permitir_diagonal):
+        return (grilla.huella(), inicio, fin, nombre_algoritmo, permitir_diagonal)
+
+    def obtener(self, clave):
+        """Retorna el resultado guardado para la clave (y lo marca como recién usado), o None."""
+        resultado = self.entradas.get(clave)
+        if resultado is None:
+            self.fallos += 1
+            return None
+        self.entradas.move_to_end(clave)
+        self.aciertos += 1
+        return resultado
+
+    def guardar(self, clave, resultado):
+        self.entradas[clave] = resultado
+        self.entradas.move_to_end(clave)
+        if len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+
+    def buscar(self, buscador, nombre_algoritmo, inicio, fin):
+        """
+        Retorna el ResultadoBusqueda de buscador.find_path(inicio, fin), ejecutándolo solo si
+        no está en la cache. El camino devuelto es una copia: se puede modificar sin afectar la cache.
+        """
+        clave = self.clave(buscador.grid, inicio, fin, nombre_algoritmo, buscador.allow_diagonal)
+        resultado = self.obtener(clave)
+        if resultado is None:
+            camino = buscador.find_path(inicio, fin)
+            resultado = ResultadoBusqueda(list(camino) if camino else camino,
+                                          buscador.iterations, len(buscador.closed_list))
+            self.guardar(clave, resultado)
+        return ResultadoBusqueda(list(resultado.camino) if resultado.camino else resultado.camino,
+                                 resultado.iteraciones, resultado.nodos_expandidos)
+
+    def tasa_aciertos(self):
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def limpiar(self):
+        """Vacía la cache y reinicia los contadores."""
+        self.entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+
+# Cache compartida por las escenas: volver a un algoritmo o a un mapa ya calculado no repite la búsqueda
+cache_caminos = CacheCaminos()
@@ -1,4 +1,14 @@
 import math
+import time
+import config
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.heuristics import HEURISTICAS, heuristica_por_defecto, obtener_tabla_heuristica
+from algorithms.search_events import RegistroEventos, DistribuidorEventos
+
+# Movimientos básicos (4 direcciones) y diagonales (4 direcciones adicionales)
+MOVIMIENTOS_BASICOS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+MOVIMIENTOS_DIAGONALES = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+COSTO_DIAGONAL = math.sqrt(2)  # ≈ 1.414
 
 class PathfinderBase:
     """
@@ -9,51 +19,29 @@ class PathfinderBase:
         self.grid = grid
         self.allow_diagonal = allow_diagonal
         self.iteraciones = 0  # Contador de iteraciones
+        # Si es True, la heurística es la distancia exacta del campo de distancias de la cuadrícula
+        # (heurística perfecta, útil para benchmarks de algoritmos que estiman hacia un objetivo fijo)
+        self.usar_campo_distancias = False
+        # Heurística a usar (nombre de HEURISTICAS o 'alt'; None elige manhattan u octil según el movimiento)
+        # y su peso (> 1 da la variante ponderada, que deja de garantizar el camino óptimo)
+        self.heuristica = None
+        self.peso_heuristica = 1.0
+        # estimar(posicion) da la heurística hacia el objetivo preparado con preparar_heuristica
+        self.estimar = None
+        # Función que recibe cada EventoBusqueda (ver search_events); con None no se crea ningún evento
+        self.oyente = None
 
     def get_neighbors_and_costs(self, position):
         """
         Obtiene los vecinos válidos de una posición y sus costos.
-        Retorna una lista de tuplas (nueva_posicion, costo).
+        Retorna una secuencia de tuplas (nueva_posicion, costo).
+        Los vecinos salen de la tabla de adyacencia precalculada de la cuadrícula,
+        que solo se reconstruye cuando el mapa cambia.
         """
-        neighbors = []
-        x, y = position
-        
-        # Movimientos básicos (4 direcciones)
-        basic_moves = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        
-        # Movimientos diagonales (4 direcciones adicionales)
-        diagonal_moves = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        # Combinar movimientos según la configuración
-        moves = basic_moves
-        if self.allow_diagonal:
-            moves.extend(diagonal_moves)
-        
-        for dx, dy in moves:
-            new_x, new_y = x + dx, y + dy
-            
-            # Verificar límites del grid
-            if not (0 <= new_x < self.grid.cols and 0 <= new_y < self.grid.rows):
-                continue
-            
-            # Verificar obstáculos
-            if self.grid.states[new_x][new_y] == self._get_obstacle_state():
-                continue
-            
-            # Calcular costo del movimiento
-            if abs(dx) + abs(dy) == 2:  # Movimiento diagonal
-                cost = math.sqrt(2)  # ≈ 1.414
-            else:  # Movimiento básico
-                cost = 1.0
-            
-            neighbors.append(((new_x, new_y), cost))
-        
-        return neighbors
+        return self.grid.obtener_adyacencia(self.allow_diagonal).vecinos_y_costos(position)
     
     def _get_obstacle_state(self):
         """Obtiene el estado que representa un obstáculo."""
-        # Importamos config aquí para evitar dependencias circulares
-        import config
         return config.STATE_OBSTACLE
     
     def calcular_heuristica(self, pos1, pos2):
@@ -61,21 +49,112 @@ class PathfinderBase:
         Calcula la heurística apropiada según el tipo de movimiento permitido.
         - Si permite diagonal: usa distancia diagonal
         - Si no permite diagonal: usa distancia Manhattan
+        - Si usar_campo_distancias está activo: usa la distancia real hasta pos2
+        - Si se eligió otra heurística (self.heuristica, incluida 'alt') o un peso, se aplican
         """
-        import math
-        
+        if self.usar_campo_distancias:
+            return self.grid.obtener_campo_distancias(pos2, self.allow_diagonal).distancia(pos1)
+
         dx = abs(pos1[0] - pos2[0])
         dy = abs(pos1[1] - pos2[1])
+
+        if self.heuristica == 'alt':
+            return self.grid.obtener_puntos_referencia(self.allow_diagonal).estimar(pos1, pos2) * self.peso_heuristica
+        if self.heuristica is not None or self.peso_heuristica != 1.0:
+            nombre = self.heuristica or heuristica_por_defecto(self.allow_diagonal)
+            return HEURISTICAS[nombre](dx, dy) * self.peso_heuristica
         
         if self.allow_diagonal:
             # Distancia diagonal: combina movimientos diagonales y rectos
             # Costo diagonal = sqrt(2), costo recto = 1
             # Fórmula: max(dx, dy) + (sqrt(2) - 1) * min(dx, dy)
-            return max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
+            return max(dx, dy) + (COSTO_DIAGONAL - 1) * min(dx, dy)
         else:
             # Distancia Manhattan para movimiento solo ortogonal
             return dx + dy
+
+    def preparar_heuristica(self, objetivo):
+        """
+        Deja en self.estimar la heurística hacia `objetivo` para toda la búsqueda. Como el
+        objetivo no cambia, los valores se precalculan en una tabla por celda.
+        """
+        if self.usar_campo_distancias:
+            self.estimar = self.grid.obtener_campo_distancias(objetivo, self.allow_diagonal).distancia
+            return
+        if self.heuristica == 'alt':
+            referencias = self.grid.obtener_puntos_referencia(self.allow_diagonal)
+            self.estimar = referencias.tabla_hacia(objetivo, self.peso_heuristica).valor
+            return
+        nombre = self.heuristica or heuristica_por_defecto(self.allow_diagonal)
+        tabla = obtener_tabla_heuristica(self.grid.columnas, self.grid.filas, objetivo, nombre, self.peso_heuristica)
+        self.estimar = tabla.valor
     
+    def _prioridad(self, nodo):
+        """Valor con el que se ordena un nodo en la lista abierta (por defecto f)."""
+        return nodo.f
+
+    def _construir_frontera(self, nodos):
+        """Crea la cola de prioridad de la lista abierta a partir de una secuencia de nodos."""
+        frontera = ColaPrioridad()
+        for nodo in nodos:
+            frontera.insertar(nodo.posicion, nodo, self._prioridad(nodo))
+        return frontera
+
+    def capturar_estado(self):
+        """
+        Estado interno que no se deduce de open_list/closed_list (por ejemplo, un umbral).
+        El historial de la escena de pruebas lo guarda junto a las listas y lo devuelve con
+        restaurar_estado al retroceder. Por defecto no hay nada que guardar.
+        """
+        return None
+
+    def restaurar_estado(self, estado):
+        """Restaura lo devuelto por capturar_estado (ver arriba)."""
+        pass
+
+    def ejecutar_pasos(self, max_pasos=None, limite_us=None):
+        """
+        Ejecuta pasos seguidos hasta completar `max_pasos`, agotar `limite_us` microsegundos
+        o que la búsqueda no pueda avanzar más. Retorna cuántos pasos se ejecutaron.
+        Sin ningún límite corre hasta el final (como encontrar_camino, pero sin reiniciar).
+        """
+        fin = None if limite_us is None else time.perf_counter_ns() + limite_us * 1000
+        ejecutados = 0
+        while max_pasos is None or ejecutados < max_pasos:
+            if fin is not None and time.perf_counter_ns() >= fin:
+                break
+            if not self.step():
+                break
+            ejecutados += 1
+        return ejecutados
+
+    def run_steps(self, max_steps=None, deadline_us=None):
+        """Método de compatibilidad - llama a ejecutar_pasos."""
+        return self.ejecutar_pasos(max_steps, deadline_us)
+
+    def iterar_eventos(self, pos_inicio=None, pos_final=None):
+        """
+        Generador de los eventos de la búsqueda, en orden. Si se dan las posiciones empieza
+        una búsqueda nueva; si no, continúa la actual. Cada paso se ejecuta recién cuando se
+        piden sus eventos, y el oyente que hubiera sigue recibiendo todo mientras tanto.
+        """
+        registro = RegistroEventos()
+        anterior = self.oyente
+        self.oyente = registro if anterior is None else DistribuidorEventos(anterior, registro)
+        try:
+            if pos_inicio is not None:
+                self.initialize_search(pos_inicio, pos_final)
+                yield from registro.vaciar()
+            while self.step():
+                yield from registro.vaciar()
+            yield from registro.vaciar()
+        finally:
+            self.oyente = anterior
+
+    def iter_events(self, start_pos=None, end_pos=None):
+        """Método de compatibilidad - llama a iterar_eventos."""
+        return self.iterar_eventos(start_pos, end_pos)
+
     # Propiedades para compatibilidad con código existente
     @property
     def iterations(self):
@@ -85,6 +164,14 @@ class PathfinderBase:
     def iterations(self, valor):
         self.iteraciones = valor
     
+    @property
+    def listener(self):
+        return self.oyente
+
+    @listener.setter
+    def listener(self, valor):
+        self.oyente = valor
+
     @property
     def calculate_heuristic(self):
         return self.calcular_heuristica
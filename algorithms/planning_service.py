@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+
+import config
+
+# Estados con que termina un trabajo
+LISTO = 'listo'            # La búsqueda terminó (con o sin camino)
+CANCELADO = 'cancelado'    # Se pidió cancelarlo antes de que terminara
+VENCIDO = 'vencido'        # Superó su tiempo límite
+FALLIDO = 'fallido'        # El buscador lanzó una excepción (queda en ResultadoPlanificacion.error)
+
+
+class TrabajoPlanificacion:
+    """Búsqueda pedida al servicio. `cancelar` y `esperar` son seguros desde cualquier hilo."""
+    __slots__ = ('buscador', 'inicio', 'fin', 'cola_resultados', 'limite_ms', 'condicion_fin', '_cancelado', '_terminado')
+
+    def __init__(self, buscador, inicio, fin, cola_resultados, limite_ms, condicion_fin):
+        self.buscador = buscador
+        self.inicio = inicio
+        self.fin = fin
+        self.cola_resultados = cola_resultados
+        self.limite_ms = limite_ms
+        self.condicion_fin = condicion_fin
+        self._cancelado = threading.Event()
+        self._terminado = threading.Event()
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    def esperar(self, limite_s=None):
+        """Bloquea hasta que el servicio deja de usar el buscador; retorna False si pasó `limite_s`."""
+        return self._terminado.wait(limite_s)
+
+    @property
+    def cancelado(self):
+        return self._cancelado.is_set()
+
+
+class ResultadoPlanificacion:
+    """Lo que el servicio deja en la cola de resultados al terminar un trabajo."""
+    __slots__ = ('trabajo', 'estado', 'camino', 'iteraciones', 'nodos_expandidos', 'tiempo_ms', 'error')
+
+    def __init__(self, trabajo, estado, camino, iteraciones, nodos_expandidos, tiempo_ms, error=None):
+        self.trabajo = trabajo
+        self.estado = estado
+        self.camino = camino      # Lista de posiciones; None si no hay camino o no terminó
+        self.iteraciones = iteraciones
+        self.nodos_expandidos = nodos_expandidos
+        self.tiempo_ms = tiempo_ms
+        self.error = error        # Excepción del buscador si el estado es FALLIDO
+
+
+class ServicioPlanificacion:
+    """
+    Ejecuta búsquedas en un hilo aparte para que el bucle principal nunca espere a una.
+
+    Las escenas envían trabajos con `enviar` y revisan en su update la cola de resultados que
+    pasaron (queue.Queue, segura entre hilos), sin bloquear. Los trabajos se ejecutan de a uno y
+    en orden, paso a paso: cada `pasos_por_control` pasos se revisa si el trabajo se canceló o
+    venció y se cede el GIL al hilo principal, así el frame no se alarga mientras la búsqueda corre.
+
+    Mientras un trabajo está pendiente, el hilo principal no debe tocar su buscador.
+    """
+
+    def __init__(self, pasos_por_control=config.PARALLEL_CANCEL_CHECK_STEPS):
+        self.pasos_por_control = pasos_por_control
+        self.trabajos = queue.Queue()
+        self.hilo = None
+
+    def enviar(self, buscador, inicio, fin, cola_resultados, limite_ms=config.PLANNING_TIMEOUT_MS, condicion_fin=None):
+        """
+        Encola la búsqueda de `inicio` a `fin` con `buscador` y retorna su TrabajoPlanificacion.
+        Con `condicion_fin(buscador)` la búsqueda se detiene apenas se cumple (p. ej. el primer
+        camino de ARA*); `limite_ms` None quita el tiempo límite.
+        """
+        trabajo = TrabajoPlanificacion(buscador, inicio, fin, cola_resultados, limite_ms, condicion_fin)
+        if self.hilo is None:
+            self.hilo = threading.Thread(target=self._atender, name='planificacion', daemon=True)
+            self.hilo.start()
+        self.trabajos.put(trabajo)
+        return trabajo
+
+    def _atender(self):
+        while True:
+            trabajo = self.trabajos.get()
+            try:
+                resultado = self._ejecutar(trabajo)
+            except Exception as error:
+                # Una búsqueda que falla no puede detener el hilo: los trabajos siguientes esperan en la cola
+                resultado = ResultadoPlanificacion(trabajo, FALLIDO, None, 0, 0, 0.0, error)
+            trabajo.cola_resultados.put(resultado)
+            trabajo._terminado.set()
+
+    def _ejecutar(self, trabajo):
+        buscador = trabajo.buscador
+        comienzo = time.perf_counter()
+        if trabajo.cancelado:
+            return ResultadoPlanificacion(trabajo, CANCELADO, None, 0, 0, 0.0)
+        vence = None if trabajo.limite_ms is None else comienzo + trabajo.limite_ms / 1000
+        buscador.initialize_search(trabajo.inicio, trabajo.fin)
+        # La preparación puede ser lenta (abstracción de HPA*, tablas de ALT): se revisa antes del primer paso
+        estado = self._interrumpido(trabajo, vence)
+        pasos = 0
+        while estado == LISTO and buscador.step():
+            if trabajo.condicion_fin is not None and trabajo.condicion_fin(buscador):
+                break
+            pasos += 1
+            if pasos == 1 or pasos % self.pasos_por_control == 0:
+                estado = self._interrumpido(trabajo, vence)
+                time.sleep(0)  # Cede el GIL: el hilo principal dibuja el frame sin esperar a la búsqueda
+        transcurrido = (time.perf_counter() - comienzo) * 1000
+        camino = buscador.path if estado == LISTO else None
+        return ResultadoPlanificacion(trabajo, estado, list(camino) if camino else None,
+                                      buscador.iterations, len(buscador.closed_list), transcurrido)
+
+
+    def _interrumpido(self, trabajo, vence):
+        """CANCELADO o VENCIDO si el trabajo debe detenerse ahora; LISTO si puede seguir."""
+        if trabajo.cancelado:
+            return CANCELADO
+        if vence is not None and time.perf_counter() >= vence:
+            return VENCIDO
+        return LISTO
+
+
+# Servicio compartido por las escenas (un solo hilo de planificación para todo el juego)
+servicio_planificacion = ServicioPlanificacion()
@@ -0,0 +1,101 @@
+import heapq
+import itertools
+
+# Marca para las entradas del montículo que quedaron obsoletas
+_ELIMINADO = object()
+
+
+class ColaPrioridad:
+    """
+    Lista abierta basada en un montículo binario (heapq) con eliminación perezosa.
+
+    Cada clave (normalmente la posición del nodo) tiene como máximo una entrada
+    vigente. Si se vuelve a insertar una clave, la entrada anterior se marca como
+    obsoleta y se descarta cuando llega a la cima del montículo. La tabla de
+    entradas sirve además como índice por posición: `obtener` devuelve en O(1)
+    el nodo abierto con el mejor g/h conocido para esa posición.
+
+    Los empates de prioridad se resuelven por orden de inserción (FIFO), que es
+    el mismo criterio que tenía el recorrido lineal de la lista abierta.
+    """
+    def __init__(self):
+        self._monticulo = []   # Entradas [prioridad, orden, elemento, clave]
+        self._entradas = {}    # clave -> entrada vigente
+        self._contador = itertools.count()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __bool__(self):
+        return bool(self._entradas)
+
+    def __contains__(self, clave):
+        return clave in self._entradas
+
+    def __iter__(self):
+        """Recorre los elementos vigentes en orden de inserción."""
+        for entrada in self._entradas.values():
+            yield entrada[2]
+
+    def insertar(self, clave, elemento, prioridad):
+        """Agrega un elemento o reemplaza el que ya tenía la misma clave."""
+        anterior = self._entradas.pop(clave, None)
+        if anterior is not None:
+            anterior[2] = _ELIMINADO
+        entrada = [prioridad, next(self._contador), elemento, clave]
+        self._entradas[clave] = entrada
+        heapq.heappush(self._monticulo, entrada)
+        # Si las entradas obsoletas dominan el montículo, se reconstruye
+        if len(self._monticulo) > 2 * len(self._entradas) + 64:
+            self._compactar()
+
+    def extraer(self):
+        """Quita y retorna el elemento de menor prioridad, saltando entradas obsoletas."""
+        while self._monticulo:
+            _, _, elemento, clave = heapq.heappop(self._monticulo)
+            if elemento is not _ELIMINADO:
+                del self._entradas[clave]
+                return elemento
+        raise KeyError("extraer de una cola de prioridad vacía")
+
+    def ver_minimo(self):
+        """Retorna (prioridad, elemento) del mínimo vigente sin quitarlo."""
+        while self._monticulo:
+            entrada = self._monticulo[0]
+            if entrada[2] is not _ELIMINADO:
+                return entrada[0], entrada[2]
+            heapq.heappop(self._monticulo)
+        raise KeyError("ver_minimo de una cola de prioridad vacía")
+
+    def obtener(self, clave, defecto=None):
+        """Retorna el elemento vigente asociado a la clave."""
+        entrada = self._entradas.get(clave)
+        return entrada[2] if entrada is not None else defecto
+
+    def eliminar(self, clave):
+        """Invalida la entrada de una clave (si existe)."""
+        entrada = self._entradas.pop(clave, None)
+        if entrada is not None:
+            entrada[2] = _ELIMINADO
+
+    def elementos(self):
+        """Copia de los elementos vigentes como lista (vista para las escenas)."""
+        return [entrada[2] for entrada in self._entradas.values()]
+
+    def _compactar(self):
+        """Descarta las entradas obsoletas y reordena el montículo."""
+        self._monticulo = list(self._entradas.values())
+        heapq.heapify(self._monticulo)
+
+    def limpiar(self):
+        self._monticulo = []
+        self._entradas = {}
+
+    # Propiedades de compatibilidad para métodos
+    @property
+    def push(self):
+        return self.insertar
+
+    @property
+    def pop(self):
+        return self.extraer
@@ -0,0 +1,62 @@
+from collections import Counter, namedtuple
+
+# Tipos de evento que emiten los algoritmos mientras buscan
+EXTRAER = 'extraer'        # Un nodo sale de la lista abierta para expandirse (pasa a la cerrada)
+INSERTAR = 'insertar'      # Un nodo nuevo entra a la lista abierta
+ACTUALIZAR = 'actualizar'  # Un nodo ya abierto (o a reabrir) consigue un costo g mejor
+OBJETIVO = 'objetivo'      # Se encontró el camino (g es su costo)
+OLVIDAR = 'olvidar'        # Un nodo se quita de memoria para no superar un límite (SMA*)
+
+# posicion y padre son celdas (x, y); padre es None en el nodo inicial y en OBJETIVO
+EventoBusqueda = namedtuple('EventoBusqueda', ('tipo', 'posicion', 'g', 'padre'))
+
+
+def evento_de_nodo(tipo, nodo):
+    """Crea el evento de un Nodo (el padre se guarda como posición, no como nodo)."""
+    padre = nodo.padre
+    return EventoBusqueda(tipo, nodo.posicion, nodo.g, padre.posicion if padre is not None else None)
+
+
+class RegistroEventos:
+    """
+    Oyente que acumula los eventos en una lista. vaciar() entrega lo acumulado desde
+    la llamada anterior, así un visualizador procesa solo lo nuevo de cada frame.
+    """
+
+    def __init__(self):
+        self.eventos = []
+
+    def __call__(self, evento):
+        self.eventos.append(evento)
+
+    def __len__(self):
+        return len(self.eventos)
+
+    def vaciar(self):
+        eventos = self.eventos
+        self.eventos = []
+        return eventos
+
+
+class ContadorEventos:
+    """Oyente que solo cuenta los eventos por tipo (métricas sin guardar los eventos)."""
+
+    def __init__(self):
+        self.conteo = Counter()
+
+    def __call__(self, evento):
+        self.conteo[evento.tipo] += 1
+
+    def __getitem__(self, tipo):
+        return self.conteo[tipo]
+
+
+class DistribuidorEventos:
+    """Oyente que reenvía cada evento a varios oyentes (por ejemplo, un registro y un contador)."""
+
+    def __init__(self, *oyentes):
+        self.oyentes = list(oyentes)
+
+    def __call__(self, evento):
+        for oyente in self.oyentes:
+            oyente(evento)
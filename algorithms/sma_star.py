@@ -0,0 +1,310 @@
+import heapq
+import itertools
+
+import config
+from algorithms.pathfinder_base import PathfinderBase
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, OLVIDAR, OBJETIVO
+
+INFINITO = float('inf')
+
+
+class NodoSMA(Nodo):
+    """Nodo del árbol de SMA*: además de lo común guarda sus hijos en memoria y los olvidados."""
+    __slots__ = ('profundidad', 'sucesores', 'indice', 'hijos', 'olvidados', 'version', 'en_memoria')
+
+    def __init__(self, padre, posicion, g, h, f, profundidad):
+        super().__init__(padre, posicion, g, h, f)
+        self.profundidad = profundidad
+        self.sucesores = None   # Pares (posición, costo) a generar, sin volver al padre
+        self.indice = 0         # Próximo sucesor a generar por primera vez
+        self.hijos = {}         # Posición -> hijo en memoria
+        self.olvidados = {}     # Posición -> f respaldado de un hijo que se quitó de memoria
+        self.version = 0        # Cambia con f o con los hijos (invalida las entradas viejas de los montículos)
+        self.en_memoria = True
+
+    @property
+    def completo(self):
+        """True si ya se generaron todos los sucesores al menos una vez."""
+        return self.sucesores is not None and self.indice >= len(self.sucesores)
+
+    @property
+    def expandible(self):
+        """True si le queda algún sucesor fuera de memoria (por generar o para regenerar)."""
+        return not self.completo or bool(self.olvidados)
+
+
+class SMAStarPathfinder(PathfinderBase):
+    """
+    Implementa SMA* (A* simplificado con memoria acotada).
+
+    Como A*, elige siempre el nodo de menor f, pero genera un sucesor por paso y nunca
+    tiene más de `limite_nodos` nodos en memoria. Al llegar al límite olvida la hoja de
+    mayor f (la menos profunda si empatan): la quita del árbol y su padre recuerda el f
+    de esa rama, así sabe cuánto promete y puede regenerarla si vuelve a ser la mejor.
+    Cuando un nodo ya generó todos sus sucesores, su f pasa a ser el menor f de sus
+    hijos (en memoria u olvidados) y el cambio se propaga a los ancestros.
+
+    Con memoria suficiente para el camino óptimo el resultado es óptimo; si el límite es
+    menor que el largo del camino no se encuentra ninguno. Una celda ya en memoria con
+    un g igual o mejor descarta a las que llegan después por otro camino.
+
+    `podas` cuenta los nodos olvidados, `regeneraciones` los que se volvieron a generar
+    y `pico_nodos` el máximo de nodos en memoria, para ajustar el límite.
+    """
+
+    def __init__(self, grid, allow_diagonal=False, limite_nodos=config.SMA_NODE_LIMIT):
+        super().__init__(grid, allow_diagonal)
+        self.limite_nodos = max(2, limite_nodos)
+        self.raiz = None
+        self.posicion_fin = None
+        self.nodos = 0
+        self.mejor_en_memoria = {}  # Posición -> nodo en memoria con menor g en esa celda
+        self.candidatos = []        # Montículo (f, -profundidad, orden, versión, nodo) de nodos expandibles
+        self.hojas = []             # Montículo (-f, profundidad, orden, versión, nodo) de hojas
+        self.orden = itertools.count()
+        self.camino = None
+        self.terminado = False
+        self.podas = 0
+        self.regeneraciones = 0
+        self.pico_nodos = 0
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        return [nodo for nodo in self._nodos_en_memoria() if nodo.expandible]
+
+    @property
+    def closed_list(self):
+        return [nodo for nodo in self._nodos_en_memoria() if not nodo.expandible]
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    @property
+    def prune_count(self):
+        return self.podas
+
+    @property
+    def regeneration_count(self):
+        return self.regeneraciones
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.preparar_heuristica(pos_final)
+        self.posicion_fin = pos_final
+        h = self.estimar(pos_inicio)
+        self.raiz = NodoSMA(None, pos_inicio, 0, h, h, 0)
+        self.nodos = 1
+        self.mejor_en_memoria = {pos_inicio: self.raiz}
+        self.candidatos = []
+        self.hojas = []
+        self._encolar(self.raiz)
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+        self.podas = 0
+        self.regeneraciones = 0
+        self.pico_nodos = 1
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.raiz))
+
+    def paso(self):
+        """Ejecuta una iteración: genera un sucesor del mejor nodo y, si hace falta, olvida la peor hoja."""
+        if self.terminado:
+            return False
+
+        # PASO 1: Tomar el nodo expandible de menor f (el más profundo si empatan)
+        nodo_actual = self._mejor_candidato()
+        if nodo_actual is None or nodo_actual.f == INFINITO:
+            return False  # No hay camino (o no entra en el límite de memoria)
+
+        self.iteraciones += 1
+        oyente = self.oyente
+
+        # PASO 2: Verificar si hemos llegado al objetivo
+        if nodo_actual.posicion == self.posicion_fin:
+            self.camino = self._reconstruir_camino(nodo_actual)
+            self.terminado = True
+            if oyente is not None:
+                oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
+            return True
+
+        # PASO 3: Generar un sucesor (uno nuevo o, si ya se generaron todos, el olvidado más prometedor)
+        hijo = self._generar_sucesor(nodo_actual)
+        if hijo is not None:
+            nodo_actual.hijos[hijo.posicion] = hijo
+            self.nodos += 1
+            anterior = self.mejor_en_memoria.get(hijo.posicion)
+            if anterior is None or hijo.g < anterior.g:
+                self.mejor_en_memoria[hijo.posicion] = hijo
+            self._encolar(hijo)
+            if oyente is not None:
+                oyente(evento_de_nodo(INSERTAR, hijo))
+
+        # PASO 4: Si ya generó todos sus sucesores, su f es el menor de sus hijos (se propaga hacia arriba)
+        self._respaldar(nodo_actual)
+        if not nodo_actual.expandible and oyente is not None:
+            oyente(evento_de_nodo(EXTRAER, nodo_actual))
+
+        # PASO 5: Respetar el límite de memoria olvidando la peor hoja
+        while self.nodos > self.limite_nodos:
+            if not self._olvidar_peor_hoja(hijo):
+                break
+        self.pico_nodos = max(self.pico_nodos, self.nodos)
+        return True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
+
+    def _generar_sucesor(self, nodo):
+        """Crea el próximo sucesor de `nodo`; retorna None si el sucesor quedó descartado."""
+        if nodo.sucesores is None:
+            anterior = nodo.padre.posicion if nodo.padre is not None else None
+            nodo.sucesores = [par for par in self.get_neighbors_and_costs(nodo.posicion) if par[0] != anterior]
+
+        if not nodo.sucesores:
+            return None  # Callejón sin salida: solo se vuelve al padre
+
+        if not nodo.completo:
+            posicion, costo = nodo.sucesores[nodo.indice]
+            nodo.indice += 1
+            f_olvidado = None
+        else:
+            posicion = min(nodo.olvidados, key=nodo.olvidados.get)
+            f_olvidado = nodo.olvidados.pop(posicion)
+            costo = next(c for p, c in nodo.sucesores if p == posicion)
+            self.regeneraciones += 1
+
+        g = nodo.g + costo
+        # Otra rama ya tiene en memoria esta celda con un costo igual o menor: esta no aporta nada
+        mejor = self.mejor_en_memoria.get(posicion)
+        if mejor is not None and mejor.g <= g:
+            return None
+
+        h = self.estimar(posicion)
+        profundidad = nodo.profundidad + 1
+        if posicion != self.posicion_fin and profundidad >= self.limite_nodos - 1:
+            f = INFINITO  # Un camino más largo no entra en memoria
+        else:
+            f = max(nodo.f, g + h)  # El f de un hijo nunca es menor que el de su padre
+        if f_olvidado is not None:
+            f = max(f, f_olvidado)
+        return NodoSMA(nodo, posicion, g, h, f, profundidad)
+
+    def _respaldar(self, nodo):
+        """Actualiza el f de los nodos completos con el menor f de sus hijos, subiendo mientras cambie."""
+        self._encolar(nodo)  # Sus hijos cambiaron aunque su f no cambie
+        while nodo is not None and nodo.completo:
+            minimo = min(min((hijo.f for hijo in nodo.hijos.values()), default=INFINITO),
+                         min(nodo.olvidados.values(), default=INFINITO))
+            if minimo == nodo.f:
+                return
+            nodo.f = minimo
+            self._encolar(nodo)
+            nodo = nodo.padre
+
+    def _olvidar_peor_hoja(self, protegido):
+        """Quita de memoria la hoja de mayor f (sin tocar la raíz ni `protegido`). Retorna si pudo."""
+        apartadas = []
+        hoja = None
+        while self.hojas:
+            entrada = heapq.heappop(self.hojas)
+            candidata = entrada[4]
+            if not self._entrada_vigente(entrada) or candidata.hijos:
+                continue
+            if candidata is self.raiz or candidata is protegido:
+                apartadas.append(entrada)
+                continue
+            hoja = candidata
+            break
+        for entrada in apartadas:
+            heapq.heappush(self.hojas, entrada)
+        if hoja is None:
+            return False
+
+        padre = hoja.padre
+        del padre.hijos[hoja.posicion]
+        padre.olvidados[hoja.posicion] = hoja.f
+        hoja.en_memoria = False
+        if self.mejor_en_memoria.get(hoja.posicion) is hoja:
+            del self.mejor_en_memoria[hoja.posicion]
+        self.nodos -= 1
+        self.podas += 1
+        self._encolar(padre)
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(OLVIDAR, hoja))
+        return True
+
+    def _encolar(self, nodo):
+        """Registra el estado actual del nodo en los montículos (las entradas anteriores quedan vencidas)."""
+        nodo.version += 1
+        orden = next(self.orden)
+        if nodo.expandible:
+            heapq.heappush(self.candidatos, (nodo.f, -nodo.profundidad, orden, nodo.version, nodo))
+        if not nodo.hijos:
+            heapq.heappush(self.hojas, (-nodo.f, nodo.profundidad, orden, nodo.version, nodo))
+        # Las entradas vencidas se acumulan: si superan ampliamente a los nodos vivos se reconstruyen
+        if len(self.candidatos) + len(self.hojas) > 8 * self.nodos + 64:
+            self.candidatos = [e for e in self.candidatos if self._entrada_vigente(e)]
+            self.hojas = [e for e in self.hojas if self._entrada_vigente(e)]
+            heapq.heapify(self.candidatos)
+            heapq.heapify(self.hojas)
+
+    @staticmethod
+    def _entrada_vigente(entrada):
+        nodo = entrada[4]
+        return nodo.en_memoria and nodo.version == entrada[3]
+
+    def _mejor_candidato(self):
+        while self.candidatos:
+            entrada = self.candidatos[0]
+            if self._entrada_vigente(entrada) and entrada[4].expandible:
+                return entrada[4]
+            heapq.heappop(self.candidatos)
+        return None
+
+    def _nodos_en_memoria(self):
+        pendientes = [self.raiz] if self.raiz is not None else []
+        while pendientes:
+            nodo = pendientes.pop()
+            yield nodo
+            pendientes.extend(nodo.hijos.values())
+
+    def _reconstruir_camino(self, nodo_actual):
+        """Reconstruye el camino desde el nodo objetivo hasta el inicio siguiendo los padres."""
+        camino = []
+        actual = nodo_actual
+        while actual is not None:
+            camino.append(actual.posicion)
+            actual = actual.padre
+        return camino[::-1]
@@ -1,46 +1,18 @@
 import pygame
 import config
 from algorithms.pathfinder_base import PathfinderBase
-
-class Nodo:
-    """Una clase para representar un nodo en la búsqueda por Costo Uniforme."""
-    def __init__(self, padre=None, posicion=None):
-        self.padre = padre      # Nodo desde el cual llegamos (para reconstruir camino)
-        self.posicion = posicion # Coordenadas (x, y) del nodo en la grilla
-
-        # Costos en Costo Uniforme:
-        self.g = 0  # Costo real acumulado desde el inicio (ÚNICO criterio de selección)
-        self.h = 0  # No se usa heurística (búsqueda ciega como Dijkstra)
-        self.f = 0  # En costo uniforme, f = g (solo costo real, sin estimación)
-
-    def __eq__(self, otro):
-        """Dos nodos son iguales si tienen la misma posición."""
-        return self.posicion == otro.posicion
-    
-    # Propiedades para compatibilidad con código existente
-    @property
-    def parent(self):
-        return self.padre
-    
-    @parent.setter
-    def parent(self, valor):
-        self.padre = valor
-    
-    @property
-    def position(self):
-        return self.posicion
-    
-    @position.setter
-    def position(self, valor):
-        self.posicion = valor
+from algorithms.priority_queue import ColaPrioridad
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, evento_de_nodo, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
 
 class UniformCostPathfinder(PathfinderBase):
     """Implementa el algoritmo de búsqueda por costo uniforme (Uniform Cost Search)."""
 
     def __init__(self, grid, allow_diagonal=False):
         super().__init__(grid, allow_diagonal)
-        self.lista_abierta = []
+        self.lista_abierta = ColaPrioridad()
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()  # Índice de la lista cerrada para consultas O(1)
         self.nodo_inicio = None
         self.nodo_fin = None
         self.camino = None
@@ -49,11 +21,11 @@ class UniformCostPathfinder(PathfinderBase):
     # Propiedades para compatibilidad con código existente
     @property
     def open_list(self):
-        return self.lista_abierta
+        return self.lista_abierta.elementos()
     
     @open_list.setter
     def open_list(self, valor):
-        self.lista_abierta = valor
+        self.lista_abierta = self._construir_frontera(valor)
     
     @property
     def closed_list(self):
@@ -62,6 +34,7 @@ class UniformCostPathfinder(PathfinderBase):
     @closed_list.setter
     def closed_list(self, valor):
         self.lista_cerrada = valor
+        self.posiciones_cerradas = {nodo.posicion for nodo in valor}
     
     @property
     def start_node(self):
@@ -106,9 +79,12 @@ class UniformCostPathfinder(PathfinderBase):
         self.nodo_inicio.f = 0  # f = g (sin componente heurístico)
         
         # Lista abierta: nodos por evaluar (empezamos con el nodo inicial)
-        self.lista_abierta = [self.nodo_inicio]
+        self.lista_abierta = self._construir_frontera([self.nodo_inicio])
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(INSERTAR, self.nodo_inicio))
         # Lista cerrada: nodos con costo mínimo ya confirmado
         self.lista_cerrada = []
+        self.posiciones_cerradas = set()
         self.camino = None
         self.terminado = False
         self.iteraciones = 0  # Reiniciar contador de iteraciones
@@ -121,86 +97,64 @@ class UniformCostPathfinder(PathfinderBase):
 
         self.iteraciones += 1  # Incrementar contador de iteraciones
 
-        # PASO 1: Encontrar el nodo con menor costo acumulado (más barato hasta ahora)
+        # PASO 1: Extraer el nodo con menor costo acumulado (más barato hasta ahora)
         # Costo Uniforme busca la solución de menor costo, sin importar el objetivo
-        nodo_actual = self.lista_abierta[0]
-        indice_actual = 0
-        for indice, elemento in enumerate(self.lista_abierta):
-            if elemento.g < nodo_actual.g:  # Comparar solo costo g (sin heurística)
-                nodo_actual = elemento
-                indice_actual = indice
+        nodo_actual = self.lista_abierta.extraer()  # Ordenada solo por costo g (sin heurística)
 
         # PASO 2: Mover nodo a lista cerrada (costo mínimo confirmado)
-        self.lista_abierta.pop(indice_actual)
         self.lista_cerrada.append(nodo_actual)
+        self.posiciones_cerradas.add(nodo_actual.posicion)
+        if self.oyente is not None:
+            self.oyente(evento_de_nodo(EXTRAER, nodo_actual))
 
         # PASO 3: Verificar si hemos llegado al objetivo
         if nodo_actual == self.nodo_fin:
             self.camino = self._reconstruir_camino(nodo_actual)
             self.terminado = True
+            if self.oyente is not None:
+                self.oyente(EventoBusqueda(OBJETIVO, nodo_actual.posicion, nodo_actual.g, None))
             return True
 
         # PASO 4: Expandir vecinos priorizando menor costo acumulado
         self._procesar_vecinos(nodo_actual)
         return True
-        nodo_actual = self.lista_abierta[0]
-        indice_actual = 0
-        for indice, elemento in enumerate(self.lista_abierta):
-            if elemento.g < nodo_actual.g:
-                nodo_actual = elemento
-                indice_actual = indice
-
-        # Mover a la lista cerrada
-        self.lista_abierta.pop(indice_actual)
-        self.lista_cerrada.append(nodo_actual)
-
-        # Meta encontrada
-        if nodo_actual == self.nodo_fin:
-            self.camino = self._reconstruir_camino(nodo_actual)
-            self.terminado = True
-            return True
-
-        # Generar y procesar vecinos
-        self._procesar_vecinos(nodo_actual)
-        return True
-        return True
     
+    def _prioridad(self, nodo):
+        """Costo Uniforme ordena la lista abierta solo por el costo acumulado g."""
+        return nodo.g
+
     def _procesar_vecinos(self, nodo_actual):
         """Procesa los vecinos del nodo actual usando la funcionalidad de la clase base."""
         vecinos_con_costos = self.get_neighbors_and_costs(nodo_actual.posicion)
-        vecinos = []
-        
-        for posicion_vecino, costo_movimiento in vecinos_con_costos:
-            vecino = Nodo(nodo_actual, posicion_vecino)
-            vecino.move_cost = costo_movimiento
-            vecinos.append(vecino)
+        oyente = self.oyente
 
-        for vecino in vecinos:
+        for posicion_vecino, costo_movimiento in vecinos_con_costos:
             # Si ya está en la lista cerrada, ignorar
-            if vecino in self.lista_cerrada:
+            if posicion_vecino in self.posiciones_cerradas:
                 continue
 
-            # Calcular el costo acumulado
-            vecino.g = nodo_actual.g + vecino.move_cost
-            vecino.h = 0  # No se usa heurística en costo uniforme
-            vecino.f = vecino.g  # En costo uniforme, f = g
+            # Calcular el costo acumulado (sin heurística en costo uniforme: f = g)
+            g = nodo_actual.g + costo_movimiento
 
             # Verificar si ya está en lista_abierta con un costo menor o igual
-            nodo_existente = None
-            for nodo_abierto in self.lista_abierta:
-                if vecino == nodo_abierto:
-                    nodo_existente = nodo_abierto
-                    break
+            nodo_existente = self.lista_abierta.obtener(posicion_vecino)
             
-            if nodo_existente:
+            if nodo_existente is not None:
                 # Si encontramos un camino mejor al mismo nodo, actualizar
-                if vecino.g < nodo_existente.g:
-                    nodo_existente.g = vecino.g
-                    nodo_existente.f = vecino.f
-                    nodo_existente.padre = vecino.padre
+                if g < nodo_existente.g:
+                    nodo_existente.g = g
+                    nodo_existente.f = g
+                    nodo_existente.padre = nodo_actual
+                    # Reinsertar con la nueva prioridad (la entrada anterior queda obsoleta)
+                    self.lista_abierta.insertar(posicion_vecino, nodo_existente, self._prioridad(nodo_existente))
+                    if oyente is not None:
+                        oyente(evento_de_nodo(ACTUALIZAR, nodo_existente))
             else:
                 # Si no está en lista_abierta, agregarlo
-                self.lista_abierta.append(vecino)
+                vecino = Nodo(nodo_actual, posicion_vecino, g, 0, g)
+                self.lista_abierta.insertar(posicion_vecino, vecino, self._prioridad(vecino))
+                if oyente is not None:
+                    oyente(evento_de_nodo(INSERTAR, vecino))
 
     def buscar_camino(self, posicion_inicio, posicion_fin):
         """Ejecuta el algoritmo completo de una vez."""
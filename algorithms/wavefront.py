@@ -0,0 +1,267 @@
+import numpy as np
+
+import config
+from algorithms.pathfinder_base import PathfinderBase, MOVIMIENTOS_BASICOS, MOVIMIENTOS_DIAGONALES, COSTO_DIAGONAL
+from algorithms.node import Nodo
+from algorithms.search_events import EventoBusqueda, EXTRAER, INSERTAR, ACTUALIZAR, OBJETIVO
+
+
+def mascara_libre(grilla):
+    """Arreglo booleano (filas, columnas) con True en las celdas que no son obstáculo."""
+    celdas = np.frombuffer(grilla.celdas, dtype=np.uint8).copy()
+    return (celdas != config.STATE_OBSTACLE).reshape(grilla.filas, grilla.columnas)
+
+
+class FrenteDeOnda:
+    """
+    Propagación vectorizada de distancias desde un origen sobre una máscara de celdas libres.
+
+    Cada onda asienta de una vez todas las celdas de la frontera cuya distancia está
+    en [m, m + 1), donde m es la menor distancia de la frontera: como ningún
+    movimiento cuesta menos de 1, ninguna otra celda puede mejorarlas. Luego relaja
+    sus vecinos con operaciones de NumPy sobre arreglos de índices. Sin diagonales
+    cada onda es exactamente una capa de BFS; con diagonales (costos 1 y √2) es una
+    corrección de etiquetas por bandas que da distancias octiles exactas.
+    """
+
+    def __init__(self, mascara, origen, permitir_diagonal=False):
+        self.filas, self.columnas = mascara.shape
+        self.libre = mascara.ravel()
+        total = self.filas * self.columnas
+
+        movimientos = [(dx, dy, 1.0) for dx, dy in MOVIMIENTOS_BASICOS]
+        if permitir_diagonal:
+            movimientos += [(dx, dy, COSTO_DIAGONAL) for dx, dy in MOVIMIENTOS_DIAGONALES]
+        self.movimientos = movimientos
+
+        self.origen = origen[1] * self.columnas + origen[0]
+        self.distancias = np.full(total, np.inf)
+        self.predecesores = np.full(total, -1, dtype=np.int64)  # Celda anterior en el camino desde el origen
+        self.asentadas = np.zeros(total, dtype=bool)
+        self.distancias[self.origen] = 0.0
+        self.frontera = np.array([self.origen], dtype=np.int64)
+        self.ondas = 0
+
+    def avanzar(self):
+        """Procesa una onda. Retorna los índices asentados, o None si ya no queda frontera."""
+        if self.frontera.size == 0:
+            return None
+        columnas, filas = self.columnas, self.filas
+
+        # PASO 1: Asentar la banda de menor distancia
+        distancias_frontera = self.distancias[self.frontera]
+        en_banda = distancias_frontera < distancias_frontera.min() + 1.0
+        asentar = self.frontera[en_banda]
+        resto = self.frontera[~en_banda]
+        self.asentadas[asentar] = True
+
+        # PASO 2: Generar los candidatos de todos los movimientos a la vez
+        xs, ys = asentar % columnas, asentar // columnas
+        base = self.distancias[asentar]
+        destinos, nuevas, origenes = [], [], []
+        for dx, dy, costo in self.movimientos:
+            nx, ny = xs + dx, ys + dy
+            dentro = (nx >= 0) & (nx < columnas) & (ny >= 0) & (ny < filas)
+            indices = ny[dentro] * columnas + nx[dentro]
+            # Solo se entra a celdas libres que todavía no están asentadas
+            validos = self.libre[indices] & ~self.asentadas[indices]
+            destinos.append(indices[validos])
+            nuevas.append(base[dentro][validos] + costo)
+            origenes.append(asentar[dentro][validos])
+        destinos = np.concatenate(destinos)
+        nuevas = np.concatenate(nuevas)
+        origenes = np.concatenate(origenes)
+
+        # PASO 3: Aplicar la menor distancia por celda (minimum.at resuelve los repetidos)
+        anteriores = self.distancias[destinos]
+        np.minimum.at(self.distancias, destinos, nuevas)
+        ganadores = (nuevas == self.distancias[destinos]) & (nuevas < anteriores)
+        destinos = destinos[ganadores]
+        self.predecesores[destinos] = origenes[ganadores]
+
+        self.frontera = np.union1d(resto, destinos)
+        self.ondas += 1
+        return asentar
+
+    def completar(self):
+        """Avanza hasta agotar la frontera (distancias a todo el mapa)."""
+        while self.avanzar() is not None:
+            pass
+
+
+def transformada_distancias(grilla, origen, permitir_diagonal=False):
+    """
+    Distancia desde `origen` a cada celda de la cuadrícula (BFS sin diagonales, octil con ellas).
+    Retorna (distancias, predecesores) como arreglos (filas, columnas); inf y -1 si no se alcanza.
+    """
+    onda = FrenteDeOnda(mascara_libre(grilla), origen, permitir_diagonal)
+    onda.completar()
+    forma = (grilla.filas, grilla.columnas)
+    return onda.distancias.reshape(forma), onda.predecesores.reshape(forma)
+
+
+def extraer_camino(distancias, predecesores, destino):
+    """Camino desde el origen de la transformada hasta `destino`, o None si no es alcanzable."""
+    columnas = predecesores.shape[1]
+    if not np.isfinite(distancias[destino[1], destino[0]]):
+        return None
+    plano = predecesores.ravel()
+    indice = destino[1] * columnas + destino[0]
+    camino = []
+    while indice >= 0:
+        camino.append((int(indice % columnas), int(indice // columnas)))
+        indice = plano[indice]
+    return camino[::-1]
+
+
+class WavefrontPathfinder(PathfinderBase):
+    """
+    Búsqueda por frente de onda vectorizada con NumPy (ver FrenteDeOnda).
+
+    Cada paso procesa una onda completa en lugar de un solo nodo, así que la cantidad
+    de iteraciones es la cantidad de ondas. Se detiene en cuanto el objetivo queda
+    asentado; transformada_distancias calcula el mapa entero.
+    """
+
+    def __init__(self, grid, allow_diagonal=False):
+        super().__init__(grid, allow_diagonal)
+        self.onda = None
+        self.indice_objetivo = None
+        self.camino = None
+        self.terminado = False
+
+    # Propiedades para compatibilidad con código existente
+    @property
+    def open_list(self):
+        if self.onda is None:
+            return []
+        return self._crear_nodos(self.onda.frontera)
+
+    @open_list.setter
+    def open_list(self, valor):
+        self._restaurar(valor, self.closed_list)
+
+    @property
+    def closed_list(self):
+        if self.onda is None:
+            return []
+        return self._crear_nodos(np.flatnonzero(self.onda.asentadas))
+
+    @closed_list.setter
+    def closed_list(self, valor):
+        self._restaurar(self.open_list, valor)
+
+    @property
+    def path(self):
+        return self.camino
+
+    @path.setter
+    def path(self, valor):
+        self.camino = valor
+
+    @property
+    def is_finished(self):
+        return self.terminado
+
+    @is_finished.setter
+    def is_finished(self, valor):
+        self.terminado = valor
+
+    def initialize_search(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a inicializar_busqueda."""
+        return self.inicializar_busqueda(start_pos, end_pos)
+
+    def step(self):
+        """Método de compatibilidad - llama a paso."""
+        return self.paso()
+
+    def find_path(self, start_pos, end_pos):
+        """Método de compatibilidad - llama a encontrar_camino."""
+        return self.encontrar_camino(start_pos, end_pos)
+
+    def inicializar_busqueda(self, pos_inicio, pos_final):
+        """Prepara el algoritmo para una nueva búsqueda."""
+        self.onda = FrenteDeOnda(mascara_libre(self.grid), pos_inicio, self.allow_diagonal)
+        self.indice_objetivo = pos_final[1] * self.grid.columnas + pos_final[0]
+        self.camino = None
+        self.terminado = False
+        self.iteraciones = 0
+        if self.oyente is not None:
+            self.oyente(EventoBusqueda(INSERTAR, pos_inicio, 0.0, None))
+
+    def paso(self):
+        """Ejecuta una iteración: procesa una onda completa."""
+        if self.terminado:
+            return False
+
+        # El objetivo puede estar asentado ya si se restauró un estado final
+        if not self.onda.asentadas[self.indice_objetivo]:
+            if self.onda.frontera.size == 0:
+                return False
+            self.iteraciones += 1
+            if self.oyente is None:
+                self.onda.avanzar()
+            else:
+                distancias_previas = self.onda.distancias.copy()
+                self._emitir_onda(self.onda.avanzar(), distancias_previas)
+
+        if self.onda.asentadas[self.indice_objetivo]:
+            forma = (self.grid.filas, self.grid.columnas)
+            objetivo = (self.indice_objetivo % self.grid.columnas, self.indice_objetivo // self.grid.columnas)
+            self.camino = extraer_camino(self.onda.distancias.reshape(forma), self.onda.predecesores.reshape(forma), objetivo)
+            self.terminado = True
+            if self.oyente is not None:
+                self.oyente(EventoBusqueda(OBJETIVO, objetivo, float(self.onda.distancias[self.indice_objetivo]), None))
+        return True
+
+    def encontrar_camino(self, pos_inicio, pos_final):
+        """Ejecuta el algoritmo completo de una vez."""
+        self.inicializar_busqueda(pos_inicio, pos_final)
+        while self.paso():
+            pass
+        return self.camino
+
+    def _emitir_onda(self, asentadas, distancias_previas):
+        """Emite los eventos de una onda: sus celdas asentadas y las que entraron o mejoraron en la frontera."""
+        columnas = self.grid.columnas
+        onda = self.onda
+
+        def celda(indice):
+            return (int(indice % columnas), int(indice // columnas))
+
+        def padre(indice):
+            previo = onda.predecesores[indice]
+            return celda(previo) if previo >= 0 else None
+
+        for indice in asentadas:
+            self.oyente(EventoBusqueda(EXTRAER, celda(indice), float(onda.distancias[indice]), padre(indice)))
+        frontera = onda.frontera
+        mejoradas = frontera[onda.distancias[frontera] < distancias_previas[frontera]]
+        for indice in mejoradas:
+            tipo = INSERTAR if distancias_previas[indice] == np.inf else ACTUALIZAR
+            self.oyente(EventoBusqueda(tipo, celda(indice), float(onda.distancias[indice]), padre(indice)))
+
+    def _crear_nodos(self, indices):
+        """Nodos de visualización (g = f = distancia desde el inicio) para los índices dados."""
+        columnas = self.grid.columnas
+        distancias = self.onda.distancias
+        return [Nodo(None, (int(i % columnas), int(i // columnas)), float(distancias[i]), 0, float(distancias[i]))
+                for i in indices]
+
+    def _restaurar(self, abiertos, cerrados):
+        """Reconstruye distancias, celdas asentadas y frontera desde las listas (historial de TestingScene)."""
+        onda = self.onda
+        columnas = self.grid.columnas
+        onda.distancias[:] = np.inf
+        onda.asentadas[:] = False
+        for nodo in cerrados:
+            indice = nodo.posicion[1] * columnas + nodo.posicion[0]
+            onda.distancias[indice] = nodo.g
+            onda.asentadas[indice] = True
+        frontera = []
+        for nodo in abiertos:
+            indice = nodo.posicion[1] * columnas + nodo.posicion[0]
+            onda.distancias[indice] = nodo.g
+            frontera.append(indice)
+        # Los predecesores se conservan: los que quedan son válidos para las distancias finales
+        onda.frontera = np.array(sorted(frontera), dtype=np.int64)
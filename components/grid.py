@@ -1,6 +1,54 @@
+import hashlib
 import pygame
 import config
 from utils import map_manager # Importamos nuestro gestor de mapas
+from algorithms.adjacency import TablaAdyacencia
+from algorithms.distance_field import CampoDistancias
+from algorithms.landmarks import PuntosReferencia
+
+# Cantidad máxima de cambios de celda recordados; si se supera, se considera un cambio total
+LIMITE_REGISTRO_CAMBIOS = 4096
+# Cantidad máxima de campos de distancia guardados a la vez (se descarta el más antiguo)
+LIMITE_CAMPOS_DISTANCIA = 8
+
+
+class _ColumnaEstados:
+    """Vista de una columna x del buffer plano, para poder escribir estados[x][y]."""
+    __slots__ = ('_grilla', '_x')
+
+    def __init__(self, grilla, x):
+        self._grilla = grilla
+        self._x = x
+
+    def __len__(self):
+        return self._grilla.filas
+
+    def __getitem__(self, y):
+        if not 0 <= y < self._grilla.filas:
+            raise IndexError("fila fuera de la cuadrícula")
+        return self._grilla.celdas[y * self._grilla.columnas + self._x]
+
+    def __setitem__(self, y, estado):
+        if not 0 <= y < self._grilla.filas:
+            raise IndexError("fila fuera de la cuadrícula")
+        self._grilla.celdas[y * self._grilla.columnas + self._x] = estado
+        self._grilla._marcar_modificada((self._x, y))
+
+
+class _VistaEstados:
+    """Vista delgada que conserva la API estados[x][y] sobre el buffer plano de la cuadrícula."""
+    __slots__ = ('_grilla',)
+
+    def __init__(self, grilla):
+        self._grilla = grilla
+
+    def __len__(self):
+        return self._grilla.columnas
+
+    def __getitem__(self, x):
+        if not 0 <= x < self._grilla.columnas:
+            raise IndexError("columna fuera de la cuadrícula")
+        return _ColumnaEstados(self._grilla, x)
 
 
 class Grid:
@@ -13,8 +61,18 @@ class Grid:
             self.columnas = config.SCREEN_WIDTH // config.CELL_SIZE
             self.filas = config.SCREEN_HEIGHT // config.CELL_SIZE
         
-        # El estado se inicializará al limpiar o cargar
-        self.estados = []
+        # El estado se inicializará al limpiar o cargar.
+        # Se guarda en un buffer plano de un byte por celda, indexado como y * columnas + x
+        self.celdas = bytearray()
+        # Versión del contenido: aumenta con cada modificación e invalida las estructuras derivadas
+        self.version = 0
+        self._adyacencias = {}  # permitir_diagonal -> TablaAdyacencia
+        self._campos = {}       # (objetivo, permitir_diagonal) -> CampoDistancias
+        self._referencias = {}  # permitir_diagonal -> PuntosReferencia (heurística ALT)
+        self._huella = None     # Hash del contenido de la versión actual (se calcula al pedirlo)
+        # Registro de cambios de celda (versión, posición) para actualizar estructuras de forma incremental
+        self._cambios = []
+        self._version_completa = 0  # Última versión en que cambió todo el contenido de una vez
         self.posicion_inicio = None
         self.posicion_fin = None
         self.limpiar() # Asegura un estado inicial limpio
@@ -36,6 +94,21 @@ class Grid:
     def rows(self, valor):
         self.filas = valor
     
+    @property
+    def estados(self):
+        """Vista [x][y] de los estados (compatibilidad con el formato de lista de listas)."""
+        return _VistaEstados(self)
+    
+    @estados.setter
+    def estados(self, valor):
+        # Acepta una lista de listas indexada [x][y] y la copia al buffer plano
+        celdas = bytearray(self.columnas * self.filas)
+        for x in range(self.columnas):
+            for y in range(self.filas):
+                celdas[y * self.columnas + x] = valor[x][y]
+        self.celdas = celdas
+        self._marcar_modificada()
+    
     @property
     def states(self):
         return self.estados
@@ -59,11 +132,128 @@ class Grid:
     @end_pos.setter
     def end_pos(self, valor):
         self.posicion_fin = valor
+
+    def __getstate__(self):
+        # Al enviar la cuadrícula a otro proceso solo viaja el contenido; las tablas derivadas se recalculan allá
+        return {
+            'columnas': self.columnas,
+            'filas': self.filas,
+            'celdas': bytes(self.celdas),
+            'posicion_inicio': self.posicion_inicio,
+            'posicion_fin': self.posicion_fin,
+        }
+
+    def __setstate__(self, estado):
+        self.columnas = estado['columnas']
+        self.filas = estado['filas']
+        self.celdas = bytearray(estado['celdas'])
+        self.posicion_inicio = estado['posicion_inicio']
+        self.posicion_fin = estado['posicion_fin']
+        self.version = 0
+        self._adyacencias = {}
+        self._campos = {}
+        self._referencias = {}
+        self._huella = None
+        self._cambios = []
+        self._version_completa = 0
+
+    def indice(self, posicion):
+        """Convierte una posición (x, y) en el identificador entero de la celda."""
+        return posicion[1] * self.columnas + posicion[0]
+
+    def posicion(self, indice):
+        """Convierte un identificador entero de celda en su posición (x, y)."""
+        return (indice % self.columnas, indice // self.columnas)
+
+    def obtener_estado(self, posicion):
+        """Retorna el estado de la celda en la posición (x, y)."""
+        return self.celdas[posicion[1] * self.columnas + posicion[0]]
+
+    def _establecer_estado(self, posicion, estado):
+        self.celdas[posicion[1] * self.columnas + posicion[0]] = estado
+        self._marcar_modificada(posicion)
+
+    def _marcar_modificada(self, posicion=None):
+        """
+        Registra un cambio en el contenido y descarta las tablas de adyacencia, campos de distancia y puntos de referencia cacheados.
+        Si se indica la posición, el cambio queda en el registro; si no, se asume que cambió todo.
+        """
+        self.version += 1
+        self._adyacencias = {}
+        self._campos = {}
+        self._referencias = {}
+        self._huella = None
+        if posicion is None or len(self._cambios) >= LIMITE_REGISTRO_CAMBIOS:
+            self._cambios = []
+            self._version_completa = self.version
+        else:
+            self._cambios.append((self.version, posicion))
+
+    def cambios_desde(self, version):
+        """
+        Retorna el conjunto de posiciones modificadas después de `version`, o None si
+        desde entonces hubo un cambio total (carga de mapa, limpieza) y hay que reconstruir todo.
+        """
+        if version < self._version_completa:
+            return None
+        return {posicion for version_cambio, posicion in self._cambios if version_cambio > version}
+
+    def huella(self):
+        """
+        Hash del contenido (dimensiones y celdas) de la versión actual. Dos cuadrículas con el
+        mismo mapa tienen la misma huella, y una edición que se deshace vuelve a la huella anterior.
+        """
+        if self._huella is None:
+            resumen = hashlib.blake2b(digest_size=16)
+            resumen.update(self.columnas.to_bytes(4, 'little'))
+            resumen.update(self.filas.to_bytes(4, 'little'))
+            resumen.update(self.celdas)
+            self._huella = resumen.hexdigest()
+        return self._huella
+
+    def obtener_adyacencia(self, permitir_diagonal=False):
+        """
+        Retorna la tabla de adyacencia (CSR) de la versión actual de la cuadrícula.
+        Se construye la primera vez que se pide para cada modo de movimiento.
+        """
+        tabla = self._adyacencias.get(permitir_diagonal)
+        if tabla is None:
+            tabla = TablaAdyacencia(self, permitir_diagonal)
+            self._adyacencias[permitir_diagonal] = tabla
+        return tabla
+
+    def obtener_campo_distancias(self, objetivo=None, permitir_diagonal=False):
+        """
+        Retorna el campo de distancias hacia `objetivo` (por defecto, el fin) de la versión actual.
+        Se calcula la primera vez que se pide para cada objetivo y modo de movimiento.
+        """
+        if objetivo is None:
+            objetivo = self.posicion_fin
+        clave = (objetivo, permitir_diagonal)
+        campo = self._campos.get(clave)
+        if campo is None:
+            if len(self._campos) >= LIMITE_CAMPOS_DISTANCIA:
+                del self._campos[next(iter(self._campos))]
+            campo = CampoDistancias(self, objetivo, permitir_diagonal)
+            self._campos[clave] = campo
+        return campo
         
+    def obtener_puntos_referencia(self, permitir_diagonal=False):
+        """
+        Retorna los puntos de referencia (heurística ALT) de la versión actual.
+        Se eligen y calculan la primera vez que se piden para cada modo de movimiento.
+        """
+        referencias = self._referencias.get(permitir_diagonal)
+        if referencias is None:
+            referencias = PuntosReferencia(self, permitir_diagonal)
+            self._referencias[permitir_diagonal] = referencias
+        return referencias
+
     def cargar_mapa(self, ruta_archivo):
         """Limpia la cuadrícula y carga un nuevo mapa, validando cada elemento."""
         # 1. Empieza con una cuadrícula completamente vacía
-        self.estados = [[config.STATE_FREE for _ in range(self.filas)] for _ in range(self.columnas)]
+        self.celdas = bytearray([config.STATE_FREE]) * (self.columnas * self.filas)
+        self._marcar_modificada()
         self.posicion_inicio = None
         self.posicion_fin = None
 
@@ -76,17 +266,17 @@ class Grid:
         datos_posicion_inicio = tuple(datos_mapa["start"])
         if 0 <= datos_posicion_inicio[0] < self.columnas and 0 <= datos_posicion_inicio[1] < self.filas:
             self.posicion_inicio = datos_posicion_inicio
-            self.estados[self.posicion_inicio[0]][self.posicion_inicio[1]] = config.STATE_START
+            self._establecer_estado(self.posicion_inicio, config.STATE_START)
 
         datos_posicion_fin = tuple(datos_mapa["end"])
         if 0 <= datos_posicion_fin[0] < self.columnas and 0 <= datos_posicion_fin[1] < self.filas:
             self.posicion_fin = datos_posicion_fin
-            self.estados[self.posicion_fin[0]][self.posicion_fin[1]] = config.STATE_END
+            self._establecer_estado(self.posicion_fin, config.STATE_END)
 
         if "obstacles" in datos_mapa:
             for obstaculo in datos_mapa["obstacles"]:
                 if 0 <= obstaculo[0] < self.columnas and 0 <= obstaculo[1] < self.filas:
-                    self.estados[obstaculo[0]][obstaculo[1]] = config.STATE_OBSTACLE
+                    self._establecer_estado(obstaculo, config.STATE_OBSTACLE)
 
     # --- NUEVOS MÉTODOS PARA EL EDITOR ---
     def obtener_celda_desde_posicion(self, pos):
@@ -99,48 +289,48 @@ class Grid:
     
     def alternar_obstaculo(self, posicion_grilla):
         """Cambia el estado de una celda entre libre y obstáculo."""
-        x, y = posicion_grilla
+        estado = self.obtener_estado(posicion_grilla)
         # No se puede poner un obstáculo en el inicio o fin
-        if self.estados[x][y] == config.STATE_START or self.estados[x][y] == config.STATE_END:
+        if estado == config.STATE_START or estado == config.STATE_END:
             return
         
-        if self.estados[x][y] == config.STATE_FREE:
-            self.estados[x][y] = config.STATE_OBSTACLE
+        if estado == config.STATE_FREE:
+            self._establecer_estado(posicion_grilla, config.STATE_OBSTACLE)
         else:
-            self.estados[x][y] = config.STATE_FREE
+            self._establecer_estado(posicion_grilla, config.STATE_FREE)
     
     def establecer_obstaculo(self, posicion_grilla, es_obstaculo):
         """Establece específicamente si una celda debe ser un obstáculo o no."""
-        x, y = posicion_grilla
+        estado = self.obtener_estado(posicion_grilla)
         # No se puede modificar el inicio o fin
-        if self.estados[x][y] == config.STATE_START or self.estados[x][y] == config.STATE_END:
+        if estado == config.STATE_START or estado == config.STATE_END:
             return
         
         if es_obstaculo:
-            self.estados[x][y] = config.STATE_OBSTACLE
+            self._establecer_estado(posicion_grilla, config.STATE_OBSTACLE)
         else:
-            self.estados[x][y] = config.STATE_FREE
+            self._establecer_estado(posicion_grilla, config.STATE_FREE)
             
     def mover_punto(self, tipo_punto, nueva_pos):
         """Mueve el punto de inicio o fin a una nueva posición."""
-        x, y = nueva_pos
         # No se puede mover a un obstáculo o encima del otro punto
-        if self.estados[x][y] == config.STATE_OBSTACLE or nueva_pos == self.posicion_fin or nueva_pos == self.posicion_inicio:
+        if self.obtener_estado(nueva_pos) == config.STATE_OBSTACLE or nueva_pos == self.posicion_fin or nueva_pos == self.posicion_inicio:
             return
 
         if tipo_punto == 'start':
             # Borra la posición anterior y actualiza la nueva
-            self.estados[self.posicion_inicio[0]][self.posicion_inicio[1]] = config.STATE_FREE
+            self._establecer_estado(self.posicion_inicio, config.STATE_FREE)
             self.posicion_inicio = nueva_pos
-            self.estados[x][y] = config.STATE_START
+            self._establecer_estado(nueva_pos, config.STATE_START)
         elif tipo_punto == 'end':
-            self.estados[self.posicion_fin[0]][self.posicion_fin[1]] = config.STATE_FREE
+            self._establecer_estado(self.posicion_fin, config.STATE_FREE)
             self.posicion_fin = nueva_pos
-            self.estados[x][y] = config.STATE_END
+            self._establecer_estado(nueva_pos, config.STATE_END)
     
     def limpiar(self):
         """Limpia el mapa y coloca los puntos de inicio/fin en posiciones por defecto seguras."""
-        self.estados = [[config.STATE_FREE for _ in range(self.filas)] for _ in range(self.columnas)]
+        self.celdas = bytearray([config.STATE_FREE]) * (self.columnas * self.filas)
+        self._marcar_modificada()
         
         # Coloca los puntos de inicio y fin en posiciones por defecto relativas al tamaño actual
         inicio_x = 1
@@ -149,18 +339,18 @@ class Grid:
 
         if 0 <= inicio_x < self.columnas:
             self.posicion_inicio = (inicio_x, posicion_y)
-            self.estados[self.posicion_inicio[0]][self.posicion_inicio[1]] = config.STATE_START
+            self._establecer_estado(self.posicion_inicio, config.STATE_START)
         
         if 0 <= fin_x < self.columnas:
             self.posicion_fin = (fin_x, posicion_y)
-            self.estados[self.posicion_fin[0]][self.posicion_fin[1]] = config.STATE_END
+            self._establecer_estado(self.posicion_fin, config.STATE_END)
 
     def obtener_datos_mapa(self):
         """Exporta el estado actual del mapa a un diccionario."""
         obstaculos = []
         for x in range(self.columnas):
             for y in range(self.filas):
-                if self.estados[x][y] == config.STATE_OBSTACLE:
+                if self.celdas[y * self.columnas + x] == config.STATE_OBSTACLE:
                     obstaculos.append([x, y])
         return {
             "start": list(self.posicion_inicio),
@@ -176,7 +366,7 @@ class Grid:
         for x in range(self.columnas):
             for y in range(self.filas):
                 # Dibuja el rectángulo de la celda con su color de estado
-                estado = self.estados[x][y]
+                estado = self.celdas[y * self.columnas + x]
                 color = config.STATE_COLORS.get(estado, config.GRAY)
                 rectangulo = pygame.Rect(x * config.CELL_SIZE + dx, y * config.CELL_SIZE + dy, config.CELL_SIZE, config.CELL_SIZE)
                 pygame.draw.rect(pantalla, color, rectangulo)
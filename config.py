@@ -10,6 +10,53 @@ CELL_SIZE = 40
 GRID_WIDTH = SCREEN_WIDTH // CELL_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // CELL_SIZE
 
+# --- BÚSQUEDA JERÁRQUICA (HPA*) ---
+# Lado (en celdas) de cada cluster en que se divide el mapa
+HPA_CLUSTER_SIZE = 8
+
+# --- CACHE DE CAMINOS ---
+# Cantidad máxima de resultados de búsqueda guardados (se descarta el usado hace más tiempo)
+PATH_CACHE_SIZE = 64
+
+# --- HEURÍSTICA ALT (PUNTOS DE REFERENCIA) ---
+# Cantidad de celdas de referencia cuyas distancias se precalculan
+ALT_LANDMARKS = 6
+
+# --- ARA* (A* ANYTIME) ---
+# Peso inicial de la heurística y cuánto baja en cada mejora (con peso 1 el camino es óptimo)
+ARA_INITIAL_WEIGHT = 2.5
+ARA_WEIGHT_STEP = 0.5
+# Tiempo por frame (en segundos) que las escenas dedican a mejorar el camino
+ARA_FRAME_BUDGET = 0.004
+
+# --- IDA* (A* CON PROFUNDIZACIÓN ITERATIVA) ---
+# Máximo de celdas cuyo mejor g recuerda cada pasada (0: IDA* puro, sin memoria por celda)
+IDA_TRANSPOSITION_LIMIT = 65536
+
+# --- SMA* (A* CON MEMORIA ACOTADA) ---
+# Máximo de nodos en memoria; al superarlo se olvida la hoja de mayor f
+SMA_NODE_LIMIT = 2000
+
+# --- PLANIFICACIÓN COOPERATIVA (WHCA*) ---
+# Pasos que planifica cada agente respetando las reservas de los demás (replanifica a la mitad)
+COOPERATIVE_WINDOW = 16
+# Máximo de estados que expande cada búsqueda; al superarlo se toma el mejor plan parcial (tiempo por frame acotado)
+COOPERATIVE_EXPANSION_LIMIT = 300
+# Cantidades de rivales IA que se pueden elegir en la carrera (se mueven sin chocar entre sí)
+RACE_RIVAL_COUNTS = (0, 4, 12, 24, 48)
+
+# --- CONSULTAS EN LOTE (PROCESOS) ---
+# Procesos de trabajo para las consultas en lote (None: uno por núcleo)
+BATCH_WORKERS = None
+# Consultas que resuelve cada tarea enviada a un proceso (menos tareas = menos comunicación)
+BATCH_CHUNK_SIZE = 16
+# Pasos que da una búsqueda en segundo plano entre controles de cancelación
+PARALLEL_CANCEL_CHECK_STEPS = 256
+
+# --- PLANIFICACIÓN EN SEGUNDO PLANO ---
+# Tiempo máximo de una búsqueda del servicio de planificación antes de abandonarla (milisegundos)
+PLANNING_TIMEOUT_MS = 10000
+
 # --- COLORES (en formato RGB) ---
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -30,4 +77,26 @@ STATE_COLORS = {
     STATE_OBSTACLE: BLACK,
     STATE_START: (0, 150, 0), # Verde oscuro
     STATE_END: (150, 0, 0)   # Rojo oscuro
-}
\ No newline at end of file
+}
+
+# --- COSTOS ENTEROS (MOTORES DE DIAL) ---
+# Escala de punto fijo: un paso recto cuesta FIXED_POINT_SCALE y uno diagonal round(√2 · FIXED_POINT_SCALE).
+# 169 da 239/169, una reducida de la fracción continua de √2 (error ~9e-6, menor que 1414/1000), y
+# mantiene chica la cola de cubetas, que tiene una cubeta por unidad de costo.
+FIXED_POINT_SCALE = 169
+# Factor por el que se multiplica el costo de entrar a una celda según su estado (los estados que
+# no figuran valen 1). Los motores de costos enteros lo respetan; el resto solo distingue obstáculos.
+# Un terreno nuevo (barro, agua...) se agrega como STATE_* con su color y su factor (>= 1) aquí.
+TERRAIN_COSTS = {
+    STATE_FREE: 1,
+    STATE_START: 1,
+    STATE_END: 1,
+}
+# --- SELECCIÓN AUTOMÁTICA DE MOTOR ("Auto") ---
+# Umbrales medidos con utils/benchmark.py --auto. Sin diagonales, con costo uniforme y algunos
+# obstáculos, BFS gana hasta esta cantidad de celdas libres (un mapa de la pantalla tiene 576 celdas)
+AUTO_BFS_MAX_FREE_CELLS = 640
+# Proporción de obstáculos desde la cual A* con montículo deja de ser el más rápido: sin diagonales
+# le ganan BFS o A* Dial apenas hay obstáculos; con diagonales, A* Dial recién en mapas muy cerrados
+AUTO_DIAL_MIN_DENSITY = 0.05
+AUTO_DIAL_MIN_DENSITY_DIAGONAL = 0.35
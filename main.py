@@ -51,6 +51,7 @@ class Game:
             self.current_scene.draw(self.screen)
             pygame.display.flip()
 
+        self.current_scene.on_exit() # Libera los recursos de la escena activa (procesos, hilos)
         pygame.quit()
         sys.exit()
 
@@ -60,6 +61,7 @@ class Game:
     def switch_scene(self, scene_name):
         """Función para cambiar entre escenas."""
         if scene_name in self.scenes:
+            self.current_scene.on_exit()
             self.current_scene = self.scenes[scene_name]
             self.current_scene.on_enter()
         else:
@@ -5,6 +5,7 @@ from scenes.scene_base import SceneBase
 from components.grid import Grid
 from components.button import Button
 from utils import map_manager
+from algorithms.d_star_lite import DStarLitePathfinder
 
 class EditorScene(SceneBase):
     def __init__(self, game):
@@ -24,6 +25,14 @@ class EditorScene(SceneBase):
             Button(config.SCREEN_WIDTH - 220, 20, 200, 50, 'Guardar Mapa', self.save_map),
             Button(config.SCREEN_WIDTH - 220, 90, 200, 50, 'Limpiar', self.grid.clear),
         ]
+
+        # Vista previa del camino: D* Lite repara el camino tras cada edición en lugar de recalcularlo
+        self.show_path_preview = False
+        self.path_preview = None
+        self.preview_version = None  # Versión de la cuadrícula con la que se calculó la vista previa
+        self.preview_pathfinder = DStarLitePathfinder(self.grid)
+        self.preview_button = Button(config.SCREEN_WIDTH - 220, 160, 200, 50, 'Vista previa: OFF', self.toggle_path_preview)
+        self.buttons.append(self.preview_button)
         
         # Calcular el área segura para el modo IA vs IA y guardarla
         self.ia_vs_ia_cell_size = 25
@@ -105,6 +114,11 @@ class EditorScene(SceneBase):
                         
                         self.last_painted_cell = grid_pos
 
+    def toggle_path_preview(self):
+        self.show_path_preview = not self.show_path_preview
+        self.preview_button.text = f"Vista previa: {'ON' if self.show_path_preview else 'OFF'}"
+        self.preview_version = None  # Forzar el cálculo en el próximo update
+
     def update(self, dt):
         # Timer para el mensaje de guardado
         if self.message_timer > 0:
@@ -112,10 +126,25 @@ class EditorScene(SceneBase):
         else:
             self.saved_message = ""
 
+        # Reparar la vista previa solo cuando la cuadrícula cambió
+        if self.show_path_preview and self.preview_version != self.grid.version:
+            self.preview_version = self.grid.version
+            if self.grid.start_pos and self.grid.end_pos:
+                self.path_preview = self.preview_pathfinder.find_path(self.grid.start_pos, self.grid.end_pos)
+            else:
+                self.path_preview = None
+
     def draw(self, screen):
         screen.fill(config.GRAY)
         self.grid.draw(screen)
 
+        # Dibujar la vista previa del camino (sin tapar inicio ni fin)
+        if self.show_path_preview and self.path_preview:
+            for pos in self.path_preview:
+                if pos != self.grid.start_pos and pos != self.grid.end_pos:
+                    rect = pygame.Rect(pos[0] * config.CELL_SIZE, pos[1] * config.CELL_SIZE, config.CELL_SIZE, config.CELL_SIZE)
+                    pygame.draw.rect(screen, (128, 0, 128), rect)
+
         # --- AÑADIR ESTO ---
         # Dibujar la guía visual para el modo IA vs IA
         # Creamos una superficie temporal para poder dibujarla con transparencia
@@ -1,3 +1,7 @@
+import queue
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
 import pygame
 import config
 from scenes.scene_base import SceneBase
@@ -8,13 +12,40 @@ from algorithms.a_star import AStarPathfinder
 from algorithms.dijkstra import DijkstraPathfinder
 from algorithms.greedy import GreedyPathfinder
 from algorithms.uniform_cost import UniformCostPathfinder
+from algorithms.jump_point import JumpPointPathfinder
+from algorithms.bidirectional import BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder
+from algorithms.hierarchical import HierarchicalPathfinder
+from algorithms.d_star_lite import DStarLitePathfinder
+from algorithms.wavefront import WavefrontPathfinder
+from algorithms.ida_star import IDAStarPathfinder
+from algorithms.fringe_search import FringeSearchPathfinder
+from algorithms.sma_star import SMAStarPathfinder
+from algorithms.dial import DialPathfinder, DialAStarPathfinder
+from algorithms.auto import AutoPathfinder
+from algorithms.ara_star import ARAStarPathfinder, empalmar_camino
+from algorithms.path_cache import cache_caminos, ResultadoBusqueda
+from algorithms.batch_queries import BuscadorParalelo, ResultadoConsulta
+from algorithms.planning_service import servicio_planificacion, CANCELADO, VENCIDO, FALLIDO
 
 # Algoritmos disponibles
 AVAILABLE_ALGORITHMS = [
     ('a_star', 'A*'),
     ('dijkstra', 'Dijkstra'),
     ('greedy', 'Voraz'),
-    ('uniform_cost', 'Costo Uniforme')
+    ('uniform_cost', 'Costo Uniforme'),
+    ('jump_point', 'JPS'),
+    ('bidirectional_a_star', 'A* Bidir.'),
+    ('bidirectional_dijkstra', 'Dijkstra Bidir.'),
+    ('hierarchical', 'HPA*'),
+    ('d_star_lite', 'D* Lite'),
+    ('wavefront', 'Wavefront'),
+    ('ara_star', 'ARA*'),
+    ('ida_star', 'IDA*'),
+    ('fringe', 'Fringe'),
+    ('sma_star', 'SMA*'),
+    ('dial', 'Dial'),
+    ('dial_a_star', 'A* Dial'),
+    ('auto', 'Auto')
 ]
 
 def get_pathfinder(name, grid, allow_diagonal=False):
@@ -27,6 +58,32 @@ def get_pathfinder(name, grid, allow_diagonal=False):
         return GreedyPathfinder(grid, allow_diagonal)
     elif name == 'uniform_cost':
         return UniformCostPathfinder(grid, allow_diagonal)
+    elif name == 'jump_point':
+        return JumpPointPathfinder(grid, allow_diagonal)
+    elif name == 'bidirectional_a_star':
+        return BidirectionalAStarPathfinder(grid, allow_diagonal)
+    elif name == 'bidirectional_dijkstra':
+        return BidirectionalDijkstraPathfinder(grid, allow_diagonal)
+    elif name == 'hierarchical':
+        return HierarchicalPathfinder(grid, allow_diagonal)
+    elif name == 'd_star_lite':
+        return DStarLitePathfinder(grid, allow_diagonal)
+    elif name == 'wavefront':
+        return WavefrontPathfinder(grid, allow_diagonal)
+    elif name == 'ara_star':
+        return ARAStarPathfinder(grid, allow_diagonal)
+    elif name == 'ida_star':
+        return IDAStarPathfinder(grid, allow_diagonal)
+    elif name == 'fringe':
+        return FringeSearchPathfinder(grid, allow_diagonal)
+    elif name == 'sma_star':
+        return SMAStarPathfinder(grid, allow_diagonal)
+    elif name == 'dial':
+        return DialPathfinder(grid, allow_diagonal)
+    elif name == 'dial_a_star':
+        return DialAStarPathfinder(grid, allow_diagonal)
+    elif name == 'auto':
+        return AutoPathfinder(grid, allow_diagonal)
     else:
         raise ValueError(f"Algoritmo desconocido: {name}")
 
@@ -36,7 +93,20 @@ def get_algorithm_display_name(name):
         'a_star': 'A*',
         'dijkstra': 'Dijkstra',
         'greedy': 'Voraz',
-        'uniform_cost': 'Costo Uniforme'
+        'uniform_cost': 'Costo Uniforme',
+        'jump_point': 'JPS',
+        'bidirectional_a_star': 'A* Bidir.',
+        'bidirectional_dijkstra': 'Dijkstra Bidir.',
+        'hierarchical': 'HPA*',
+        'd_star_lite': 'D* Lite',
+        'wavefront': 'Wavefront',
+        'ara_star': 'ARA*',
+        'ida_star': 'IDA*',
+        'fringe': 'Fringe',
+        'sma_star': 'SMA*',
+        'dial': 'Dial',
+        'dial_a_star': 'A* Dial',
+        'auto': 'Auto'
     }
     return names.get(name, name.upper())
 
@@ -110,20 +180,34 @@ class IAvsIAScene(SceneBase):
         self.ai2_nodes_expanded = 0
         self.ai1_iterations = 0
         self.ai2_iterations = 0
+        self.ai1_time_ms = None  # Tiempo de la búsqueda (None si el camino salió de la cache)
+        self.ai2_time_ms = None
+
+        # Las dos búsquedas corren a la vez en procesos de trabajo (se crean al entrar a la escena
+        # y se cierran al salir)
+        self.buscador_paralelo = None
+        self.computing = False
+        self.searches = {}  # Jugador (1 o 2) -> Future con el ResultadoConsulta de su búsqueda
+        # ARA* se busca en el hilo del servicio de planificación (sus mejoras siguen en este proceso)
+        self.planning_results = queue.Queue()
+        self.ara_jobs = {}  # TrabajoPlanificacion -> Future de su jugador
+        self.error_text = ""  # Aviso cuando una búsqueda falló (se muestra en lugar de las instrucciones)
     
     def _create_algorithm_buttons(self):
         """Crea los botones para selección de algoritmos."""
         button_width = 120
         button_height = 30
         button_spacing = 35
+        column_spacing = button_width + 10
+        buttons_per_column = 7  # Más filas llegarían al botón de movimiento diagonal
         
         # Botones para el algoritmo 1 (lado izquierdo)
         self.algo1_buttons = []
         start_y = 190  # Más espacio desde arriba para las estadísticas
         for i, (algo_id, algo_name) in enumerate(AVAILABLE_ALGORITHMS):
             button = Button(
-                self.offset1[0], 
-                start_y + i * button_spacing,
+                self.offset1[0] + (i // buttons_per_column) * column_spacing, 
+                start_y + (i % buttons_per_column) * button_spacing,
                 button_width, button_height,
                 algo_name,
                 lambda algo=algo_id: self._select_algorithm_1(algo)
@@ -134,8 +218,8 @@ class IAvsIAScene(SceneBase):
         self.algo2_buttons = []
         for i, (algo_id, algo_name) in enumerate(AVAILABLE_ALGORITHMS):
             button = Button(
-                self.offset2[0], 
-                start_y + i * button_spacing,
+                self.offset2[0] + (i // buttons_per_column) * column_spacing, 
+                start_y + (i % buttons_per_column) * button_spacing,
                 button_width, button_height,
                 algo_name,
                 lambda algo=algo_id: self._select_algorithm_2(algo)
@@ -145,22 +229,40 @@ class IAvsIAScene(SceneBase):
     def _select_algorithm_1(self, algorithm):
         """Selecciona el algoritmo para el jugador 1."""
         if algorithm != self.algo2_name and not self.race_started:
+            if algorithm != self.algo1_name:
+                self._cancel_searches()
             self.algo1_name = algorithm
     
     def _select_algorithm_2(self, algorithm):
         """Selecciona el algoritmo para el jugador 2."""
         if algorithm != self.algo1_name and not self.race_started:
+            if algorithm != self.algo2_name:
+                self._cancel_searches()
             self.algo2_name = algorithm
     
     def _start_race(self):
-        """Inicia la competencia entre los algoritmos seleccionados."""
-        if not self.race_started and not self.race_finished:
-            self.race_started = True
+        """Inicia la competencia entre los algoritmos seleccionados (o cancela el cálculo en curso)."""
+        if self.computing:
+            self._cancel_searches()
+        elif not self.race_started and not self.race_finished:
             self._initialize_algorithms()
+
+    def _cancel_searches(self):
+        """Anula las búsquedas en curso y vuelve a la selección de algoritmos."""
+        if not self.computing:
+            return
+        self.buscador_paralelo.cancelar()
+        for trabajo in self.ara_jobs:
+            trabajo.cancelar()
+        self.ara_jobs = {}
+        self.searches = {}
+        self.computing = False
+        self.start_button.text = "COMENZAR"
     
     def _toggle_diagonal(self):
         """Activa/desactiva el movimiento diagonal."""
         if not self.race_started:
+            self._cancel_searches()
             self.allow_diagonal = not self.allow_diagonal
             self.diagonal_button.text = f"Movimiento Diagonal: {'ON' if self.allow_diagonal else 'OFF'}"
     
@@ -174,39 +276,191 @@ class IAvsIAScene(SceneBase):
         # PASO 2: Verificar que el mapa tenga inicio y fin válidos
         if not self.grid1.start_pos or not self.grid1.end_pos:
             self.winner_text = "MAPA INVÁLIDO"
+            self.race_started = True
             self.race_finished = True
             return
         
         start = self.grid1.start_pos
+        self.error_text = ""
         
-        # PASO 3: Ejecutar algoritmos y capturar métricas de rendimiento
-        # PASO 3: Ejecutar algoritmos y capturar métricas de rendimiento
-        # Configurar IA 1 (primer algoritmo)
+        # PASO 3: Lanzar las dos búsquedas a la vez; los resultados se reciben en update
         self.ai1 = Agent(start, (255, 128, 0)) # Naranja
-        self.ai1.path = self.pathfinder1.find_path(start, self.grid1.end_pos)  # Ejecutar algoritmo completo
-        self.ai1_nodes_expanded = len(self.pathfinder1.closed_list)  # Nodos explorados
-        self.ai1_iterations = self.pathfinder1.iterations  # Iteraciones realizadas
-        
-        # Configurar IA 2 (segundo algoritmo)
         self.ai2 = Agent(start, (0, 191, 255)) # Celeste
-        self.ai2.path = self.pathfinder2.find_path(start, self.grid2.end_pos)  # Ejecutar algoritmo completo
-        self.ai2_nodes_expanded = len(self.pathfinder2.closed_list)  # Nodos explorados
-        self.ai2_iterations = self.pathfinder2.iterations  # Iteraciones realizadas
+        self.searches = {
+            1: self._calcular_camino(self.pathfinder1, self.algo1_name, start, self.grid1.end_pos),
+            2: self._calcular_camino(self.pathfinder2, self.algo2_name, start, self.grid2.end_pos),
+        }
+        self.computing = True
+        self.start_button.text = "CANCELAR"
+
+    def _receive_results(self):
+        """
+        Cuando terminaron las dos búsquedas, carga caminos y métricas y arranca la carrera. Si alguna
+        falló (proceso de trabajo caído, error al enviarla, tiempo agotado) se avisa en la escena y se
+        vuelve a la selección de algoritmos.
+        """
+        self._recibir_planificacion()
+        if not all(futuro.done() for futuro in self.searches.values()):
+            return
+        fallas = []
+        resultados = {}
+        for jugador, futuro in self.searches.items():
+            try:
+                resultados[jugador] = futuro.result()
+            except Exception as error:
+                fallas.append((jugador, error))
+            else:
+                if resultados[jugador] is None:  # El proceso de trabajo la abandonó por una cancelación
+                    fallas.append((jugador, None))
+        self.searches = {}
+        self.computing = False
+        self.start_button.text = "COMENZAR"
+        if fallas:
+            self._informar_fallas(fallas)
+            return
+        resultado1 = resultados[1]
+        resultado2 = resultados[2]
+        self.race_started = True
+
+        # Configurar IA 1 (primer algoritmo)
+        self._guardar_en_cache(self.pathfinder1, self.algo1_name, resultado1)
+        self.ai1.path = resultado1.camino
+        self.ai1_nodes_expanded = resultado1.nodos_expandidos  # Nodos explorados
+        self.ai1_iterations = resultado1.iteraciones  # Iteraciones realizadas
+        self.ai1_time_ms = resultado1.tiempo_ms
+
+        # Configurar IA 2 (segundo algoritmo)
+        self._guardar_en_cache(self.pathfinder2, self.algo2_name, resultado2)
+        self.ai2.path = resultado2.camino
+        self.ai2_nodes_expanded = resultado2.nodos_expandidos  # Nodos explorados
+        self.ai2_iterations = resultado2.iteraciones  # Iteraciones realizadas
+        self.ai2_time_ms = resultado2.tiempo_ms
 
         # PASO 4: Configurar animación de la carrera visual
         self.move_speed = 0.05  # Velocidad de animación (20 pasos por segundo)
         self.move_timer = 0
         self.path_index = 1  # Empezar desde el segundo nodo (el primero es la posición inicial)
 
+    def _recibir_planificacion(self):
+        """Pasa a su Future el resultado de cada búsqueda de ARA* que terminó en el servicio de planificación."""
+        while True:
+            try:
+                resultado = self.planning_results.get_nowait()
+            except queue.Empty:
+                return
+            futuro = self.ara_jobs.pop(resultado.trabajo, None)
+            if futuro is None:
+                continue  # Búsqueda cancelada: su resultado se descarta
+            if resultado.estado == CANCELADO:
+                futuro.cancel()
+            elif resultado.estado == VENCIDO:
+                futuro.set_exception(TimeoutError("tiempo agotado"))
+            elif resultado.estado == FALLIDO:
+                futuro.set_exception(resultado.error)
+            else:
+                trabajo = resultado.trabajo
+                futuro.set_result(ResultadoConsulta(0, trabajo.inicio, trabajo.fin, resultado.camino, resultado.iteraciones,
+                                                    resultado.nodos_expandidos, resultado.tiempo_ms))
+
+    def _informar_fallas(self, fallas):
+        """Deja el aviso de las búsquedas que fallaron y, si los procesos de trabajo se cayeron, los recrea."""
+        avisos = []
+        for jugador, error in fallas:
+            if error is None:
+                motivo = "cancelada"
+            elif isinstance(error, TimeoutError):
+                motivo = "tiempo agotado"
+            else:
+                motivo = type(error).__name__
+            avisos.append(f"Jugador {jugador}: {motivo}")
+            if isinstance(error, BrokenProcessPool):
+                self._recrear_procesos()
+        self.error_text = "Falló la búsqueda (" + ", ".join(avisos) + ")"
+
+    def _recrear_procesos(self):
+        """Reemplaza los procesos de trabajo caídos para que la próxima carrera pueda calcularse."""
+        if self.buscador_paralelo is not None:
+            self.buscador_paralelo.cerrar()
+        self.buscador_paralelo = BuscadorParalelo(procesos=2)
+        self.buscador_paralelo.preparar()
+
+    def _calcular_camino(self, pathfinder, algo_name, start, end):
+        """
+        Lanza la búsqueda de un agente y retorna un Future con su ResultadoConsulta. El primer camino
+        acotado de ARA* se busca en el hilo del servicio de planificación, sobre el mismo buscador, que
+        después lo sigue mejorando en update sin bloquear el frame; un camino que ya está en la cache
+        no se recalcula; el resto de los algoritmos corre en un proceso de trabajo.
+        """
+        futuro = Future()
+        if isinstance(pathfinder, AutoPathfinder):
+            pathfinder.elegir()  # Deja registrados motor y motivo (el proceso de trabajo elige igual)
+        if isinstance(pathfinder, ARAStarPathfinder):
+            trabajo = servicio_planificacion.enviar(pathfinder, start, end, self.planning_results,
+                                                    condicion_fin=lambda buscador: buscador.path is not None)
+            self.ara_jobs[trabajo] = futuro
+            return futuro
+        guardado = cache_caminos.obtener(cache_caminos.clave(pathfinder.grid, start, end, algo_name, pathfinder.allow_diagonal))
+        if guardado is not None:
+            futuro.set_result(ResultadoConsulta(0, start, end, list(guardado.camino) if guardado.camino else guardado.camino,
+                                                guardado.iteraciones, guardado.nodos_expandidos, None))
+            return futuro
+        try:
+            return self.buscador_paralelo.enviar(pathfinder.grid, type(pathfinder), pathfinder.allow_diagonal, start, end)
+        except Exception as error:  # Procesos caídos o ejecutor cerrado: se informa al recibir los resultados
+            futuro.set_exception(error)
+            return futuro
+
+    def _guardar_en_cache(self, pathfinder, algo_name, resultado):
+        """Guarda el camino calculado en la cache compartida (ARA* sigue mejorándolo, no se guarda)."""
+        if isinstance(pathfinder, ARAStarPathfinder) or resultado.tiempo_ms is None:
+            return
+        clave = cache_caminos.clave(pathfinder.grid, resultado.inicio, resultado.fin, algo_name, pathfinder.allow_diagonal)
+        cache_caminos.guardar(clave, ResultadoBusqueda(list(resultado.camino) if resultado.camino else resultado.camino,
+                                                       resultado.iteraciones, resultado.nodos_expandidos))
+
+    def _texto_nodos(self, agente, nodes_expanded, time_ms):
+        """Primera línea de estadísticas: nodos expandidos, pasos y tiempo de la búsqueda."""
+        tiempo = "cache" if time_ms is None else f"{time_ms:.1f} ms"
+        return f"Nodos: {nodes_expanded} | Pasos: {len(agente.path or [])-1} | {tiempo}"
+
+    def _mejorar_camino_anytime(self, pathfinder, agente):
+        """Dedica un presupuesto fijo del frame a mejorar el camino de ARA* y lo empalma en la carrera."""
+        if pathfinder.is_finished or not agente.path:
+            return
+        if pathfinder.mejorar(config.ARA_FRAME_BUDGET):
+            nuevo = empalmar_camino(agente.path, min(self.path_index, len(agente.path)), pathfinder.path)
+            if nuevo is not None:
+                agente.path = nuevo
+
+    def _texto_iteraciones(self, pathfinder, iterations):
+        """Segunda línea de estadísticas (con la cota de suboptimalidad si el algoritmo es ARA*)."""
+        if isinstance(pathfinder, ARAStarPathfinder):
+            return f"Iteraciones: {iterations} | Cota: {pathfinder.suboptimality_bound:.2f}"
+        if isinstance(pathfinder, AutoPathfinder):
+            return f"Iteraciones: {iterations} | {pathfinder.motivo}"
+        return f"Iteraciones: {iterations}"
+
+    def _titulo_algoritmo(self, algo_name, pathfinder):
+        """Nombre del algoritmo para el título (con el motor elegido si es Auto y ya se eligió)."""
+        nombre = get_algorithm_display_name(algo_name)
+        if self.race_started and isinstance(pathfinder, AutoPathfinder) and pathfinder.nombre_motor:
+            return f"{nombre} ({pathfinder.nombre_motor})"
+        return nombre
+
     def on_enter(self):
         """Se ejecuta cuando se entra a la escena."""
         # Sobreescribimos config para esta escena
         config.CELL_SIZE = self.cell_size
         
         # Resetear estado
+        if self.buscador_paralelo is None:
+            self.buscador_paralelo = BuscadorParalelo(procesos=2)
+            self.buscador_paralelo.preparar()
+        self._cancel_searches()
         self.race_started = False
         self.race_finished = False
         self.winner_text = ""
+        self.error_text = ""
         self.allow_diagonal = False
         self.diagonal_button.text = "Movimiento Diagonal: OFF"
         
@@ -223,6 +477,15 @@ class IAvsIAScene(SceneBase):
         self.ai2_nodes_expanded = 0
         self.ai1_iterations = 0
         self.ai2_iterations = 0
+        self.ai1_time_ms = None
+        self.ai2_time_ms = None
+
+    def al_salir(self):
+        """Se ejecuta al salir de la escena: cierra los procesos de trabajo de las búsquedas."""
+        self._cancel_searches()
+        if self.buscador_paralelo is not None:
+            self.buscador_paralelo.cerrar()
+            self.buscador_paralelo = None
 
     def update(self, dt):
         """
@@ -234,7 +497,12 @@ class IAvsIAScene(SceneBase):
         2. Gestionar tiempo de animación para movimiento fluido
         3. Mover ambos agentes al siguiente nodo de su camino
         4. Detectar cuando algún agente llega al destino y determinar ganador
+        Mientras las búsquedas corren en segundo plano solo se revisa si ya terminaron.
         """
+        if self.computing:
+            self._receive_results()
+            return
+
         # Solo actualizar si la carrera ha comenzado y no ha terminado
         if not self.race_started or self.race_finished or self.winner_text:
             return
@@ -242,6 +510,16 @@ class IAvsIAScene(SceneBase):
         # Verificar que los agentes existan
         if not self.ai1 or not self.ai2:
             return
+
+        # Los algoritmos anytime (ARA*) siguen mejorando su camino mientras los agentes avanzan
+        if isinstance(self.pathfinder1, ARAStarPathfinder):
+            self._mejorar_camino_anytime(self.pathfinder1, self.ai1)
+            self.ai1_nodes_expanded = len(self.pathfinder1.closed_list)
+            self.ai1_iterations = self.pathfinder1.iterations
+        if isinstance(self.pathfinder2, ARAStarPathfinder):
+            self._mejorar_camino_anytime(self.pathfinder2, self.ai2)
+            self.ai2_nodes_expanded = len(self.pathfinder2.closed_list)
+            self.ai2_iterations = self.pathfinder2.iterations
             
         # GESTIÓN DE TIEMPO DE ANIMACIÓN
         # Acumular tiempo transcurrido para controlar velocidad
@@ -306,7 +584,7 @@ class IAvsIAScene(SceneBase):
             # TECLA ESC: Regresar al menú principal
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 config.CELL_SIZE = 40 # Restaura el tamaño de celda original
-                self.game.switch_scene('menu')
+                self.game.switch_scene('menu') # al_salir cancela las búsquedas y cierra los procesos
             
             # EVENTOS DE BOTONES (solo si no hay carrera activa)
             if not self.race_started:
@@ -359,19 +637,19 @@ class IAvsIAScene(SceneBase):
             self.ai2.draw(screen, self.offset2)
 
             # Dibujar estadísticas cuando la carrera ha comenzado
-            stats1_line1 = self.font_stats.render(f"Nodos: {self.ai1_nodes_expanded} | Pasos: {len(self.ai1.path or [])-1}", True, config.WHITE)
-            stats1_line2 = self.font_stats.render(f"Iteraciones: {self.ai1_iterations}", True, config.WHITE)
+            stats1_line1 = self.font_stats.render(self._texto_nodos(self.ai1, self.ai1_nodes_expanded, self.ai1_time_ms), True, config.WHITE)
+            stats1_line2 = self.font_stats.render(self._texto_iteraciones(self.pathfinder1, self.ai1_iterations), True, config.WHITE)
             screen.blit(stats1_line1, (self.offset1[0], 35))
             screen.blit(stats1_line2, (self.offset1[0], 55))
 
-            stats2_line1 = self.font_stats.render(f"Nodos: {self.ai2_nodes_expanded} | Pasos: {len(self.ai2.path or [])-1}", True, config.WHITE)
-            stats2_line2 = self.font_stats.render(f"Iteraciones: {self.ai2_iterations}", True, config.WHITE)
+            stats2_line1 = self.font_stats.render(self._texto_nodos(self.ai2, self.ai2_nodes_expanded, self.ai2_time_ms), True, config.WHITE)
+            stats2_line2 = self.font_stats.render(self._texto_iteraciones(self.pathfinder2, self.ai2_iterations), True, config.WHITE)
             screen.blit(stats2_line1, (self.offset2[0], 35))
             screen.blit(stats2_line2, (self.offset2[0], 55))
 
         # Dibujar títulos de los algoritmos seleccionados
-        algo1_display = get_algorithm_display_name(self.algo1_name)
-        algo2_display = get_algorithm_display_name(self.algo2_name)
+        algo1_display = self._titulo_algoritmo(self.algo1_name, self.pathfinder1)
+        algo2_display = self._titulo_algoritmo(self.algo2_name, self.pathfinder2)
         
         # Título lado izquierdo
         title1 = self.font_title.render(f"Jugador 1: {algo1_display}", True, config.WHITE)
@@ -383,8 +661,13 @@ class IAvsIAScene(SceneBase):
 
         # Si la carrera no ha comenzado, mostrar interfaz de selección
         if not self.race_started:
-            # Instrucciones
-            instruction_text = self.font_stats.render("Selecciona los algoritmos y presiona COMENZAR", True, config.WHITE)
+            # Instrucciones (o aviso de que las búsquedas siguen corriendo o de que fallaron)
+            if self.computing:
+                instruction_text = self.font_stats.render("Calculando caminos... (cambiar la selección cancela)", True, config.WHITE)
+            elif self.error_text:
+                instruction_text = self.font_stats.render(self.error_text, True, (255, 120, 120))
+            else:
+                instruction_text = self.font_stats.render("Selecciona los algoritmos y presiona COMENZAR", True, config.WHITE)
             text_rect = instruction_text.get_rect(center=(config.SCREEN_WIDTH // 2, 160))
             screen.blit(instruction_text, text_rect)
             
@@ -1,3 +1,5 @@
+import queue
+
 import pygame
 import config
 from scenes.scene_base import SceneBase
@@ -7,11 +9,27 @@ from algorithms.a_star import AStarPathfinder
 from algorithms.dijkstra import DijkstraPathfinder
 from algorithms.greedy import GreedyPathfinder
 from algorithms.uniform_cost import UniformCostPathfinder
+from algorithms.jump_point import JumpPointPathfinder
+from algorithms.hierarchical import HierarchicalPathfinder
+from algorithms.d_star_lite import DStarLitePathfinder
+from algorithms.wavefront import WavefrontPathfinder
+from algorithms.ida_star import IDAStarPathfinder
+from algorithms.fringe_search import FringeSearchPathfinder
+from algorithms.sma_star import SMAStarPathfinder
+from algorithms.dial import DialPathfinder, DialAStarPathfinder
+from algorithms.auto import AutoPathfinder, elegir_motor
+from algorithms.ara_star import ARAStarPathfinder, empalmar_camino
+from algorithms.path_cache import cache_caminos, ResultadoBusqueda
+from algorithms.planning_service import servicio_planificacion, LISTO, VENCIDO, FALLIDO
+from algorithms.cooperative_planner import PlanificadorCooperativo, celdas_de_salida
 from components.button import Button
 
 SP1 = 0.12
 SP2 = 0.080
 
+# Colores de los rivales IA (se repiten si hay más rivales que colores)
+RIVAL_COLORS = [(220, 60, 60), (60, 200, 90), (200, 80, 220), (240, 220, 60), (60, 210, 210), (255, 255, 255)]
+
 class RaceScene(SceneBase):
     """
     Escena de carrera entre humano e IA.
@@ -19,10 +37,12 @@ class RaceScene(SceneBase):
     PROPÓSITO: Permitir al jugador competir directamente contra un algoritmo de IA
     CARACTERÍSTICAS:
     1. Control humano con teclas direccionales (movimiento continuo)
-    2. Selección de algoritmo de IA (A*, Dijkstra, Voraz, Costo Uniforme)
+    2. Selección de algoritmo de IA (A*, Dijkstra, Voraz, Costo Uniforme, JPS, HPA*, D* Lite, Wavefront, ARA*, IDA*, Fringe, SMA*, Dial, A* Dial, Auto)
     3. Toggle de movimiento diagonal
     4. Medición de tiempos de finalización
     5. Detección de ganador en tiempo real
+    6. Rivales IA opcionales que se mueven sin chocar entre sí ni con la IA (planificación cooperativa)
+    7. Búsqueda del camino de la IA en segundo plano (el frame no espera a la búsqueda)
     """
     def __init__(self, game):
         super().__init__(game)
@@ -42,7 +62,18 @@ class RaceScene(SceneBase):
             "A*": AStarPathfinder(self.grid, self.allow_diagonal),
             "Dijkstra": DijkstraPathfinder(self.grid, self.allow_diagonal),
             "Voraz": GreedyPathfinder(self.grid, self.allow_diagonal),
-            "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal)
+            "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal),
+            "JPS": JumpPointPathfinder(self.grid, self.allow_diagonal),
+            "HPA*": HierarchicalPathfinder(self.grid, self.allow_diagonal),
+            "D* Lite": DStarLitePathfinder(self.grid, self.allow_diagonal),
+            "Wavefront": WavefrontPathfinder(self.grid, self.allow_diagonal),
+            "ARA*": ARAStarPathfinder(self.grid, self.allow_diagonal),
+            "IDA*": IDAStarPathfinder(self.grid, self.allow_diagonal),
+            "Fringe": FringeSearchPathfinder(self.grid, self.allow_diagonal),
+            "SMA*": SMAStarPathfinder(self.grid, self.allow_diagonal),
+            "Dial": DialPathfinder(self.grid, self.allow_diagonal),
+            "A* Dial": DialAStarPathfinder(self.grid, self.allow_diagonal),
+            "Auto": AutoPathfinder(self.grid, self.allow_diagonal)
         }
         self.current_algo_name = "A*"
         self.pathfinder = self.algorithms[self.current_algo_name]
@@ -54,6 +85,19 @@ class RaceScene(SceneBase):
         self.switch_algo_button = Button(config.SCREEN_WIDTH - 220, 20, 200, 50, 'IA: A*', self.switch_algorithm)
         self.start_race_button = Button(config.SCREEN_WIDTH - 220, 90, 200, 50, 'Carrera: Comenzar', self.toggle_race_state)
         self.diagonal_button = Button(config.SCREEN_WIDTH - 220, 160, 200, 40, 'Diagonal: OFF', self.toggle_diagonal)
+        self.rivals_button = Button(config.SCREEN_WIDTH - 220, 330, 200, 40, 'Rivales IA: 0', self.cycle_rival_count)
+
+        # RIVALES IA (planificados juntos con una tabla de reservas para no chocar)
+        self.rival_count_index = 0
+        self.rivals = []
+        self.rival_planner = None
+        self.rival_finish_time = None
+
+        # BÚSQUEDA EN SEGUNDO PLANO (el camino de la IA llega por la cola en update)
+        self.planning_results = queue.Queue()
+        self.ai_job = None       # Trabajo pendiente del servicio de planificación (None: no hay)
+        self.ai_status = ""      # Aviso cuando la búsqueda no dio un camino a tiempo o falló
+        self.auto_choice = None  # (motor, motivo) que eligió "Auto" para el mapa actual
         
         # SISTEMA DE MEDICIÓN DE TIEMPO
         # Para determinar quién llega primero y por cuánto margen
@@ -78,6 +122,9 @@ class RaceScene(SceneBase):
         3. Configurar velocidades de movimiento
         4. Inicializar algoritmo seleccionado
         """
+        # Una búsqueda que siga en el hilo de planificación leería la cuadrícula mientras se reescribe:
+        # se cancela y se espera a que la suelte antes de cargar el mapa
+        self.cancel_ai_job(esperar=True)
         # Cargar mapa y obtener posición inicial
         self.grid.load_map(self.game.selected_map) # Carga el JSON como matriz 2D
         start = self.grid.start_pos
@@ -118,20 +165,32 @@ class RaceScene(SceneBase):
                 "A*": AStarPathfinder(self.grid, self.allow_diagonal),
                 "Dijkstra": DijkstraPathfinder(self.grid, self.allow_diagonal),
                 "Voraz": GreedyPathfinder(self.grid, self.allow_diagonal),
-                "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal)
+                "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal),
+                "JPS": JumpPointPathfinder(self.grid, self.allow_diagonal),
+                "HPA*": HierarchicalPathfinder(self.grid, self.allow_diagonal),
+                "D* Lite": DStarLitePathfinder(self.grid, self.allow_diagonal),
+                "Wavefront": WavefrontPathfinder(self.grid, self.allow_diagonal),
+                "ARA*": ARAStarPathfinder(self.grid, self.allow_diagonal),
+                "IDA*": IDAStarPathfinder(self.grid, self.allow_diagonal),
+                "Fringe": FringeSearchPathfinder(self.grid, self.allow_diagonal),
+                "SMA*": SMAStarPathfinder(self.grid, self.allow_diagonal),
+                "Dial": DialPathfinder(self.grid, self.allow_diagonal),
+                "A* Dial": DialAStarPathfinder(self.grid, self.allow_diagonal),
+                "Auto": AutoPathfinder(self.grid, self.allow_diagonal)
             }
             self.pathfinder = self.algorithms[self.current_algo_name]
             
             # Recalcular camino de la IA con nuevas reglas de movimiento
             if self.grid.start_pos and self.grid.end_pos:
-                self.ai.path = self.pathfinder.find_path(self.grid.start_pos, self.grid.end_pos)
+                self.calculate_ai_path()
+            self.create_rivals()
 
     def switch_algorithm(self, initial_setup=False):
         """
         Cambiar algoritmo de IA disponible.
         
         PROPÓSITO: Permitir al jugador seleccionar contra qué algoritmo competir
-        ALGORITMOS DISPONIBLES: A*, Dijkstra, Voraz, Costo Uniforme
+        ALGORITMOS DISPONIBLES: A*, Dijkstra, Voraz, Costo Uniforme, JPS, HPA*, D* Lite, Wavefront, ARA*, IDA*, Fringe, SMA*, Dial, A* Dial, Auto
         FUNCIONAMIENTO: Ciclar entre algoritmos y recalcular camino
         """
         algo_names = list(self.algorithms.keys())
@@ -149,11 +208,129 @@ class RaceScene(SceneBase):
 
         # Calcular camino óptimo para el algoritmo seleccionado
         if self.grid.start_pos and self.grid.end_pos:
-            self.ai.path = self.pathfinder.find_path(self.grid.start_pos, self.grid.end_pos)
+            self.calculate_ai_path()
 
         # Reiniciar estado de carrera
         self.reset_race()
         
+    def calculate_ai_path(self):
+        """
+        Calcular el camino de la IA con el algoritmo activo, sin bloquear el frame.
+
+        Un camino que ya está en la cache se usa enseguida; si no, la búsqueda se envía al
+        servicio de planificación (hilo aparte) y el camino llega en update. De ARA* solo se
+        busca así el primer camino acotado; después se sigue mejorando en update con el
+        presupuesto de cada frame. Una búsqueda anterior todavía pendiente se cancela.
+        """
+        self.cancel_ai_job()
+        self.ai.path = None
+        self.ai_status = ""
+        # Motor y motivo de "Auto" para mostrarlos (sin tocar el buscador, que puede seguir en el hilo)
+        self.auto_choice = elegir_motor(self.grid, self.allow_diagonal)[1:] if isinstance(self.pathfinder, AutoPathfinder) else None
+        if not isinstance(self.pathfinder, ARAStarPathfinder):
+            guardado = cache_caminos.obtener(self._ai_cache_key())
+            if guardado is not None:
+                self.ai.path = list(guardado.camino) if guardado.camino else guardado.camino
+                return
+        condicion_fin = (lambda buscador: buscador.path is not None) if isinstance(self.pathfinder, ARAStarPathfinder) else None
+        self.ai_job = servicio_planificacion.enviar(self.pathfinder, self.grid.start_pos, self.grid.end_pos,
+                                                    self.planning_results, condicion_fin=condicion_fin)
+
+    def _ai_cache_key(self):
+        return cache_caminos.clave(self.grid, self.grid.start_pos, self.grid.end_pos, self.current_algo_name, self.allow_diagonal)
+
+    def cancel_ai_job(self, esperar=False):
+        """
+        Cancelar la búsqueda pendiente de la IA (su resultado se descarta al llegar).
+        Con `esperar`, además bloquea hasta que el hilo de planificación deja de usar la cuadrícula
+        (la cancelación se nota en el siguiente control, a lo sumo PARALLEL_CANCEL_CHECK_STEPS pasos).
+        """
+        if self.ai_job is not None:
+            self.ai_job.cancelar()
+            if esperar:
+                self.ai_job.esperar()
+            self.ai_job = None
+
+    def receive_ai_path(self):
+        """
+        Tomar el camino de la IA si la búsqueda en segundo plano ya terminó (sin esperar).
+        Los resultados de búsquedas canceladas o reemplazadas se descartan.
+        """
+        while True:
+            try:
+                resultado = self.planning_results.get_nowait()
+            except queue.Empty:
+                return
+            if resultado.trabajo is not self.ai_job:
+                continue
+            self.ai_job = None
+            self.ai.path = resultado.camino
+            if resultado.estado == VENCIDO:
+                self.ai_status = "IA: tiempo agotado"
+            elif resultado.estado == FALLIDO:
+                self.ai_status = f"IA: falló la búsqueda ({type(resultado.error).__name__})"
+            elif resultado.estado == LISTO and not isinstance(self.pathfinder, ARAStarPathfinder):
+                cache_caminos.guardar(self._ai_cache_key(), ResultadoBusqueda(
+                    list(resultado.camino) if resultado.camino else resultado.camino,
+                    resultado.iteraciones, resultado.nodos_expandidos))
+            # Los rivales esquivan el camino de la IA: se ubican ahora que se conoce
+            self.create_rivals()
+
+    def improve_ai_path(self):
+        """
+        Mejorar el camino de ARA* con el presupuesto de tiempo de un frame.
+        Si encuentra uno mejor, lo empalma desde la posición actual de la IA.
+        """
+        if self.ai_job is not None or not isinstance(self.pathfinder, ARAStarPathfinder):
+            return
+        if self.pathfinder.is_finished or not self.ai.path:
+            return
+        if self.pathfinder.mejorar(config.ARA_FRAME_BUDGET):
+            nuevo = empalmar_camino(self.ai.path, min(self.ai_path_index, len(self.ai.path)), self.pathfinder.path)
+            if nuevo is not None:
+                self.ai.path = nuevo
+                if self.rival_planner is not None:
+                    self.rival_planner.fijar_camino('ia', nuevo)
+
+    def cycle_rival_count(self):
+        """Pasar a la siguiente cantidad de rivales IA (config.RACE_RIVAL_COUNTS)."""
+        self.rival_count_index = (self.rival_count_index + 1) % len(config.RACE_RIVAL_COUNTS)
+        self.rivals_button.text = f"Rivales IA: {config.RACE_RIVAL_COUNTS[self.rival_count_index]}"
+        self.create_rivals()
+
+    def create_rivals(self):
+        """
+        Ubicar los rivales IA en las celdas libres más cercanas a la salida y planificarlos.
+
+        Todos comparten un PlanificadorCooperativo: reservan celda e instante de cada paso,
+        así que no chocan entre sí, y esquivan el camino de la IA principal, que se reserva
+        como camino fijo (su celda en cada paso de la carrera).
+        """
+        self.rivals = []
+        self.rival_planner = None
+        self.rival_finish_time = None
+        cantidad = config.RACE_RIVAL_COUNTS[self.rival_count_index]
+        if not cantidad or not self.grid.start_pos or not self.grid.end_pos or self.ai_job is not None:
+            return  # Con la búsqueda de la IA pendiente, se crean al recibir su camino
+        self.rival_planner = PlanificadorCooperativo(self.grid, self.allow_diagonal)
+        self.rival_planner.fijar_camino('ia', self.ai.path)
+        salidas = celdas_de_salida(self.grid, self.grid.start_pos, cantidad, self.allow_diagonal, evitar=self.ai.path or ())
+        for i, celda in enumerate(salidas):
+            rival = Agent(celda, RIVAL_COLORS[i % len(RIVAL_COLORS)])
+            self.rivals.append(rival)
+            self.rival_planner.agregar_agente(rival, self.grid.end_pos)
+        # Las primeras ventanas se planifican ahora, antes de la carrera, y no en su primer paso
+        self.rival_planner.planificar_nuevos()
+
+    def move_rivals(self):
+        """Avanzar un paso a todos los rivales (al mismo ritmo que la IA principal)."""
+        if self.rival_planner is None:
+            return
+        for rival in self.rival_planner.avanzar():
+            rival.finished = True
+            if self.rival_finish_time is None:
+                self.rival_finish_time = self.race_time
+
     def toggle_race_state(self):
         """
         Iniciar o reiniciar la carrera.
@@ -167,7 +344,7 @@ class RaceScene(SceneBase):
             # REINICIAR CARRERA
             # Si la carrera está en marcha, el botón funciona como "Reiniciar"
             self.reset_race()
-        else:
+        elif self.ai_job is None:  # No se larga mientras la IA todavía busca su camino
             # INICIAR CARRERA
             # Si la carrera está pausada, la inicia
             self.race_started = True
@@ -204,6 +381,9 @@ class RaceScene(SceneBase):
             self.player.position = self.grid.start_pos
         
         # REINICIAR ESTADO DE LA IA
+        # (con ARA* se vuelve al mejor camino completo, no al empalmado durante la carrera anterior)
+        if self.ai_job is None and isinstance(self.pathfinder, ARAStarPathfinder) and self.pathfinder.path:
+            self.ai.path = list(self.pathfinder.path)
         self.ai.finished = False
         self.ai.steps = 0
         self.ai_path_index = 1  # Empezar desde el segundo nodo del camino
@@ -213,6 +393,9 @@ class RaceScene(SceneBase):
         self.player.path = [self.grid.start_pos]  # Camino recorrido por el jugador
         self.player.steps = 0
 
+        # REINICIAR RIVALES (vuelven a la salida con planes nuevos)
+        self.create_rivals()
+
     def handle_events(self, events):
         """
         Manejar eventos de entrada del usuario.
@@ -226,6 +409,7 @@ class RaceScene(SceneBase):
         for event in events:
             # TECLA ESC: Regresar al menú principal
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.cancel_ai_job()
                 self.game.switch_scene('menu')
 
             # BOTÓN DE CARRERA: Siempre activo (iniciar/reiniciar)
@@ -235,6 +419,7 @@ class RaceScene(SceneBase):
             if not self.race_started:
                 self.switch_algo_button.handle_event(event)  # Cambiar algoritmo de IA
                 self.diagonal_button.handle_event(event)     # Toggle movimiento diagonal
+                self.rivals_button.handle_event(event)       # Cantidad de rivales IA
 
     def update(self, dt):
         """
@@ -247,6 +432,12 @@ class RaceScene(SceneBase):
         3. Movimiento automático de la IA
         4. Detección de llegada al destino
         """
+        # Recibir el camino de la IA si la búsqueda en segundo plano ya terminó
+        self.receive_ai_path()
+
+        # ARA* sigue mejorando el camino de la IA en cada frame (también antes de la carrera)
+        self.improve_ai_path()
+
         # Solo actualizar si la carrera está activa y no hay ganador
         if not self.race_started or self.winner_text: 
             return
@@ -296,15 +487,15 @@ class RaceScene(SceneBase):
                 if moved:
                     self.player_move_timer = 0
 
-        # Mover la IA
-        if not self.ai.finished and self.ai.path:
-            self.ai_move_timer += dt
-            if self.ai_move_timer >= self.ai_move_speed:
-                self.ai_move_timer = 0
-                if self.ai_path_index < len(self.ai.path):
-                    self.ai.position = self.ai.path[self.ai_path_index]
-                    self.ai.steps += 1
-                    self.ai_path_index += 1
+        # Mover la IA y los rivales en el mismo paso (las reservas de los rivales cuentan los pasos de la IA)
+        self.ai_move_timer += dt
+        if self.ai_move_timer >= self.ai_move_speed:
+            self.ai_move_timer = 0
+            if not self.ai.finished and self.ai.path and self.ai_path_index < len(self.ai.path):
+                self.ai.position = self.ai.path[self.ai_path_index]
+                self.ai.steps += 1
+                self.ai_path_index += 1
+            self.move_rivals()
 
         # Comprobar si el jugador llegó al objetivo
         if not self.player.finished and self.player.position == self.grid.end_pos:
@@ -317,23 +508,21 @@ class RaceScene(SceneBase):
             self.ai_finish_time = self.race_time
 
         # Comprobar ganador
-        if self.player.finished or self.ai.finished:
+        rival_finished = self.rival_finish_time is not None
+        if self.player.finished or self.ai.finished or rival_finished:
             self.race_started = False
             self.start_race_button.text = "Carrera: Reiniciar"
             
-            # Determinar ganador basado en quién terminó primero
-            if self.player.finished and self.ai.finished:
-                # Ambos terminaron, el que terminó primero gana
-                if self.player_finish_time < self.ai_finish_time:
-                    self.winner_text = "¡GANASTE!"
-                elif self.ai_finish_time < self.player_finish_time:
-                    self.winner_text = "GANA LA IA"
-                else:
-                    self.winner_text = "¡EMPATE!"
-            elif self.player.finished:
-                self.winner_text = "¡GANASTE!"
-            elif self.ai.finished:
-                self.winner_text = "GANA LA IA"
+            # Determinar ganador basado en quién terminó primero (inf: no llegó)
+            finish_times = {
+                "¡GANASTE!": self.player_finish_time if self.player.finished else float('inf'),
+                "GANA LA IA": self.ai_finish_time if self.ai.finished else float('inf'),
+                "GANA UN RIVAL": self.rival_finish_time if rival_finished else float('inf'),
+            }
+            best_time = min(finish_times.values())
+            winners = [text for text, finish_time in finish_times.items() if finish_time == best_time]
+            # Si el jugador llegó a la vez que alguna IA es empate; entre IAs gana la principal
+            self.winner_text = "¡EMPATE!" if len(winners) > 1 and "¡GANASTE!" in winners else winners[0]
 
     def draw(self, screen):
         screen.fill(config.GRAY)
@@ -356,6 +545,10 @@ class RaceScene(SceneBase):
 
         self.player.draw(screen)
         self.ai.draw(screen)
+        # Los rivales que llegaron salen del mapa
+        for rival in self.rivals:
+            if not rival.finished:
+                rival.draw(screen)
 
         info_font = pygame.font.SysFont('B612Mono', 20)
         instructions = [
@@ -365,6 +558,9 @@ class RaceScene(SceneBase):
         if self.allow_diagonal:
             instructions.append('Q/E/Z/C: Mover diagonal')
             
+        if self.auto_choice is not None and isinstance(self.pathfinder, AutoPathfinder):
+            instructions.append(f'Auto: {self.auto_choice[0]} ({self.auto_choice[1]})')
+            
         for i, instruction in enumerate(instructions):
             info_text = info_font.render(instruction, True, config.WHITE)
             screen.blit(info_text, (10, 10 + i * 25))
@@ -373,6 +569,7 @@ class RaceScene(SceneBase):
         self.switch_algo_button.draw(screen)
         self.start_race_button.draw(screen)
         self.diagonal_button.draw(screen)
+        self.rivals_button.draw(screen)
         
         # Mostrar tiempo actual durante la carrera
         if self.race_started and not self.winner_text:
@@ -380,6 +577,32 @@ class RaceScene(SceneBase):
             time_surface = self.font_stats.render(time_text, True, config.WHITE)
             screen.blit(time_surface, (config.SCREEN_WIDTH - 220, 230))
 
+            # Distancia óptima que le falta al jugador (consulta O(1) al campo de distancias cacheado)
+            campo = self.grid.obtener_campo_distancias(self.grid.end_pos, self.allow_diagonal)
+            restante = campo.distancia(self.player.position)
+            remaining_text = f"Te faltan: {restante:.1f}" if restante != float('inf') else "Te faltan: --"
+            remaining_surface = self.font_stats.render(remaining_text, True, config.WHITE)
+            screen.blit(remaining_surface, (config.SCREEN_WIDTH - 220, 260))
+
+        # Estado de la búsqueda de la IA antes de la carrera
+        if not self.race_started and not self.winner_text and (self.ai_job is not None or self.ai_status):
+            status_text = "Calculando camino..." if self.ai_job is not None else self.ai_status
+            status_surface = self.font_stats.render(status_text, True, config.WHITE)
+            screen.blit(status_surface, (config.SCREEN_WIDTH - 220, 230))
+
+        # Cota de suboptimalidad del camino actual de ARA* (1.00 = óptimo)
+        if self.ai_job is None and isinstance(self.pathfinder, ARAStarPathfinder):
+            cota = self.pathfinder.suboptimality_bound
+            bound_text = f"Cota ARA*: {cota:.2f}" if cota != float('inf') else "Cota ARA*: --"
+            bound_surface = self.font_stats.render(bound_text, True, config.WHITE)
+            screen.blit(bound_surface, (config.SCREEN_WIDTH - 220, 290))
+
+        # Mayor tiempo de un paso de los rivales en la carrera (planificación incluida)
+        if self.rival_planner is not None and self.race_started:
+            plan_text = f"Plan máx: {self.rival_planner.maximo_ms:.1f}ms"
+            plan_surface = self.font_stats.render(plan_text, True, config.WHITE)
+            screen.blit(plan_surface, (config.SCREEN_WIDTH - 220, 380))
+
         if self.winner_text:
             # Dibujar las estadísticas finales
             center_x = config.SCREEN_WIDTH / 2
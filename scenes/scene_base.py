@@ -16,6 +16,10 @@ class SceneBase:
         """Se ejecuta cada vez que la escena se convierte en la activa."""
         pass # Las clases hijas pueden sobreescribir esto
 
+    def al_salir(self):
+        """Se ejecuta cuando la escena deja de ser la activa o se cierra el juego."""
+        pass # Las clases hijas pueden sobreescribir esto para liberar recursos
+
     def manejar_eventos(self, eventos):
         """Procesa todos los eventos de la cola de Pygame."""
         raise NotImplementedError # Obliga a las clases hijas a implementar este método
@@ -32,6 +36,10 @@ class SceneBase:
     @property
     def on_enter(self):
         return self.al_entrar
+
+    @property
+    def on_exit(self):
+        return self.al_salir
     
     @property
     def handle_events(self):
@@ -8,6 +8,18 @@ from algorithms.a_star import AStarPathfinder
 from algorithms.dijkstra import DijkstraPathfinder
 from algorithms.greedy import GreedyPathfinder
 from algorithms.uniform_cost import UniformCostPathfinder
+from algorithms.jump_point import JumpPointPathfinder
+from algorithms.bidirectional import BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder
+from algorithms.hierarchical import HierarchicalPathfinder
+from algorithms.d_star_lite import DStarLitePathfinder
+from algorithms.wavefront import WavefrontPathfinder
+from algorithms.ida_star import IDAStarPathfinder
+from algorithms.fringe_search import FringeSearchPathfinder
+
+# Multiplicadores de velocidad del modo automático (sobre 20 pasos por segundo)
+AUTO_SPEEDS = (1, 10, 100, 1000)
+# Tiempo máximo por frame (en microsegundos) para ejecutar pasos sin trabar la pantalla
+FRAME_BUDGET_US = 8000
 
 class TestingScene(SceneBase):
     """
@@ -17,7 +29,7 @@ class TestingScene(SceneBase):
     CARACTERÍSTICAS:
     1. Visualización paso a paso de la exploración de nodos
     2. Historial navegable (avanzar/retroceder pasos)
-    3. Modo automático con velocidad controlable
+    3. Modo automático con velocidad controlable (multiplicadores) y "Terminar" sin trabar la pantalla
     4. Intercambio entre algoritmos en tiempo real
     5. Visualización de costos y heurísticas en cada nodo
     6. Toggle de movimiento diagonal
@@ -37,9 +49,18 @@ class TestingScene(SceneBase):
         # Diccionario con todos los algoritmos que se pueden visualizar
         self.algorithms = {
             "A*": AStarPathfinder(self.grid, self.allow_diagonal),
+            "A* ALT": AStarPathfinder(self.grid, self.allow_diagonal, heuristica='alt'),
             "Dijkstra": DijkstraPathfinder(self.grid, self.allow_diagonal),
             "Voraz": GreedyPathfinder(self.grid, self.allow_diagonal),
-            "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal)
+            "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal),
+            "JPS": JumpPointPathfinder(self.grid, self.allow_diagonal),
+            "A* Bidir": BidirectionalAStarPathfinder(self.grid, self.allow_diagonal),
+            "Dijkstra Bidir": BidirectionalDijkstraPathfinder(self.grid, self.allow_diagonal),
+            "HPA*": HierarchicalPathfinder(self.grid, self.allow_diagonal),
+            "D* Lite": DStarLitePathfinder(self.grid, self.allow_diagonal),
+            "Wavefront": WavefrontPathfinder(self.grid, self.allow_diagonal),
+            "IDA*": IDAStarPathfinder(self.grid, self.allow_diagonal),
+            "Fringe": FringeSearchPathfinder(self.grid, self.allow_diagonal)
         }
         self.current_algo_name = "A*"
         self.pathfinder = self.algorithms[self.current_algo_name]
@@ -49,6 +70,8 @@ class TestingScene(SceneBase):
         self.is_auto_running = False
         self.auto_step_speed = 0.05  # 0.05 segundos = 20 pasos por segundo
         self.auto_step_timer = 0.0
+        self.speed_index = 0         # Índice en AUTO_SPEEDS (x1 = 20 pasos por segundo)
+        self.is_finishing = False    # "Terminar": correr hasta el final repartido en varios frames
 
         # SISTEMA DE HISTORIAL DE PASOS
         # Permite navegar hacia adelante y atrás en la ejecución
@@ -62,6 +85,8 @@ class TestingScene(SceneBase):
         self.auto_button = Button(config.SCREEN_WIDTH - 220, 160, 200, 50, 'Auto: OFF', self.toggle_auto_mode)
         self.diagonal_button = Button(config.SCREEN_WIDTH - 220, 230, 200, 40, 'Diagonal: OFF', self.toggle_diagonal)
         self.tree_button = Button(config.SCREEN_WIDTH - 220, 280, 200, 40, 'Visualizar Árbol', self.open_tree_visualizer)
+        self.speed_button = Button(config.SCREEN_WIDTH - 220, 330, 95, 40, 'Vel: x1', self.cycle_auto_speed)
+        self.finish_button = Button(config.SCREEN_WIDTH - 115, 330, 95, 40, 'Terminar', self.finish_now)
 
     def on_enter(self):
         """
@@ -87,9 +112,18 @@ class TestingScene(SceneBase):
         # Necesario porque el tipo de movimiento afecta las heurísticas
         self.algorithms = {
             "A*": AStarPathfinder(self.grid, self.allow_diagonal),
+            "A* ALT": AStarPathfinder(self.grid, self.allow_diagonal, heuristica='alt'),
             "Dijkstra": DijkstraPathfinder(self.grid, self.allow_diagonal),
             "Voraz": GreedyPathfinder(self.grid, self.allow_diagonal),
-            "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal)
+            "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal),
+            "JPS": JumpPointPathfinder(self.grid, self.allow_diagonal),
+            "A* Bidir": BidirectionalAStarPathfinder(self.grid, self.allow_diagonal),
+            "Dijkstra Bidir": BidirectionalDijkstraPathfinder(self.grid, self.allow_diagonal),
+            "HPA*": HierarchicalPathfinder(self.grid, self.allow_diagonal),
+            "D* Lite": DStarLitePathfinder(self.grid, self.allow_diagonal),
+            "Wavefront": WavefrontPathfinder(self.grid, self.allow_diagonal),
+            "IDA*": IDAStarPathfinder(self.grid, self.allow_diagonal),
+            "Fringe": FringeSearchPathfinder(self.grid, self.allow_diagonal)
         }
         self.pathfinder = self.algorithms[self.current_algo_name]
         
@@ -109,6 +143,7 @@ class TestingScene(SceneBase):
         # Limpiar historial de pasos previos
         self.history = []
         self.current_step = 0
+        self.is_finishing = False
         
         # Inicializar algoritmo en posiciones de inicio y destino
         self.pathfinder.initialize_search(self.grid.start_pos, self.grid.end_pos)
@@ -126,12 +161,14 @@ class TestingScene(SceneBase):
         2. Lista cerrada (nodos ya explorados)
         3. Camino actual encontrado
         4. Estado de finalización del algoritmo
+        5. Estado interno propio del algoritmo (por ejemplo, el umbral de IDA*)
         """
         return {
             "open_list": copy.deepcopy(self.pathfinder.open_list),
             "closed_list": copy.deepcopy(self.pathfinder.closed_list),
             "path": copy.deepcopy(self.pathfinder.path),
-            "is_finished": self.pathfinder.is_finished
+            "is_finished": self.pathfinder.is_finished,
+            "extra": copy.deepcopy(self.pathfinder.capturar_estado())
         }
 
     def step_forward(self):
@@ -161,6 +198,29 @@ class TestingScene(SceneBase):
         self.history.append(self.get_current_state_snapshot())
         self.current_step += 1
 
+    def run_steps(self, max_steps=None):
+        """
+        Avanzar varios pasos de una vez guardando un solo estado en el historial.
+
+        PROPÓSITO: Modo automático rápido y "Terminar" sin trabar la pantalla
+        FUNCIONAMIENTO:
+        1. Ejecutar hasta max_steps pasos, sin pasar del presupuesto de tiempo del frame
+        2. Capturar el estado resultante (retroceder vuelve al estado previo al lote)
+        3. Retornar cuántos pasos se ejecutaron (0 si el algoritmo ya no puede avanzar)
+        """
+        if self.pathfinder.is_finished:
+            return 0
+
+        # Si retrocedimos y ahora avanzamos, borramos el futuro anterior
+        if self.current_step < len(self.history) - 1:
+            self.history = self.history[:self.current_step + 1]
+
+        executed = self.pathfinder.run_steps(max_steps, FRAME_BUDGET_US)
+        if executed:
+            self.history.append(self.get_current_state_snapshot())
+            self.current_step += 1
+        return executed
+
     def step_back(self):
         """
         Retroceder un paso en la ejecución del algoritmo.
@@ -181,6 +241,7 @@ class TestingScene(SceneBase):
             self.pathfinder.closed_list = copy.deepcopy(state["closed_list"])
             self.pathfinder.path = copy.deepcopy(state["path"])
             self.pathfinder.is_finished = state["is_finished"]
+            self.pathfinder.restaurar_estado(copy.deepcopy(state["extra"]))
 
     def toggle_diagonal(self):
         """
@@ -200,9 +261,18 @@ class TestingScene(SceneBase):
             # Esto es necesario porque el tipo de movimiento afecta las heurísticas
             self.algorithms = {
                 "A*": AStarPathfinder(self.grid, self.allow_diagonal),
+                "A* ALT": AStarPathfinder(self.grid, self.allow_diagonal, heuristica='alt'),
                 "Dijkstra": DijkstraPathfinder(self.grid, self.allow_diagonal),
                 "Voraz": GreedyPathfinder(self.grid, self.allow_diagonal),
-                "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal)
+                "Costo U": UniformCostPathfinder(self.grid, self.allow_diagonal),
+                "JPS": JumpPointPathfinder(self.grid, self.allow_diagonal),
+                "A* Bidir": BidirectionalAStarPathfinder(self.grid, self.allow_diagonal),
+                "Dijkstra Bidir": BidirectionalDijkstraPathfinder(self.grid, self.allow_diagonal),
+                "HPA*": HierarchicalPathfinder(self.grid, self.allow_diagonal),
+                "D* Lite": DStarLitePathfinder(self.grid, self.allow_diagonal),
+                "Wavefront": WavefrontPathfinder(self.grid, self.allow_diagonal),
+                "IDA*": IDAStarPathfinder(self.grid, self.allow_diagonal),
+                "Fringe": FringeSearchPathfinder(self.grid, self.allow_diagonal)
             }
             self.pathfinder = self.algorithms[self.current_algo_name]
             
@@ -223,12 +293,23 @@ class TestingScene(SceneBase):
         self.auto_button.text = f"Auto: {'ON' if self.is_auto_running else 'OFF'}"
         self.auto_step_timer = 0.0  # Reiniciar temporizador al cambiar modo
 
+    def cycle_auto_speed(self):
+        """Cambiar el multiplicador de velocidad del modo automático (x1, x10, x100, x1000)."""
+        self.speed_index = (self.speed_index + 1) % len(AUTO_SPEEDS)
+        self.speed_button.text = f"Vel: x{AUTO_SPEEDS[self.speed_index]}"
+        self.auto_step_timer = 0.0
+
+    def finish_now(self):
+        """Correr el algoritmo hasta el final, repartiendo el trabajo en frames con tiempo acotado."""
+        if not self.pathfinder.is_finished:
+            self.is_finishing = True
+
     def switch_algorithm(self):
         """
         Cambiar entre algoritmos disponibles.
         
         PROPÓSITO: Permitir comparar diferentes algoritmos en el mismo mapa
-        ALGORITMOS: A*, Dijkstra, Voraz, Costo Uniforme
+        ALGORITMOS: A*, A* con heurística ALT, Dijkstra, Voraz, Costo Uniforme, JPS, A* y Dijkstra bidireccionales, HPA*, D* Lite, Wavefront, IDA*, Fringe
         EFECTO: Reiniciar búsqueda con algoritmo seleccionado
         """
         # Ciclar al siguiente algoritmo en la lista
@@ -260,7 +341,7 @@ class TestingScene(SceneBase):
                 self.game.switch_scene('menu')
             
             # BOTONES DE NAVEGACIÓN: Solo activos si no hay auto-ejecución
-            if not self.is_auto_running:
+            if not self.is_auto_running and not self.is_finishing:
                 self.next_step_button.handle_event(event)    # Avanzar paso
                 self.back_step_button.handle_event(event)    # Retroceder paso
                 self.diagonal_button.handle_event(event)     # Toggle diagonal
@@ -269,6 +350,8 @@ class TestingScene(SceneBase):
             self.switch_algo_button.handle_event(event)      # Cambiar algoritmo
             self.auto_button.handle_event(event)             # Toggle auto-mode
             self.tree_button.handle_event(event)             # Visualizador de árbol
+            self.speed_button.handle_event(event)            # Velocidad del modo automático
+            self.finish_button.handle_event(event)           # Terminar la búsqueda
 
     def update(self, dt):
         """
@@ -276,20 +359,30 @@ class TestingScene(SceneBase):
         
         PROPÓSITO: Gestionar progreso automático del algoritmo
         FUNCIONAMIENTO:
-        1. Acumular tiempo transcurrido
-        2. Si es tiempo de dar paso automático y algoritmo no terminó
-        3. Ejecutar siguiente paso del algoritmo
-        4. Reiniciar temporizador para próximo paso
+        1. "Terminar": ejecutar todos los pasos que entren en el presupuesto del frame
+        2. Modo automático: acumular tiempo y ejecutar los pasos que correspondan
+           según el multiplicador de velocidad (en un solo lote por frame)
+        3. Desactivar el modo automático cuando el algoritmo termina o no puede avanzar
         """
+        # TERMINAR AHORA: lotes acotados por tiempo hasta que el algoritmo termine
+        if self.is_finishing:
+            if self.run_steps() == 0 or self.pathfinder.is_finished:
+                self.is_finishing = False
+
         # MODO AUTOMÁTICO: Solo si está activado y algoritmo no terminó
-        if self.is_auto_running and not self.history[self.current_step]["is_finished"]:
+        elif self.is_auto_running and not self.history[self.current_step]["is_finished"]:
             # Acumular tiempo para controlar velocidad
             self.auto_step_timer += dt
+            step_interval = self.auto_step_speed / AUTO_SPEEDS[self.speed_index]
             
-            # Si es tiempo de dar el siguiente paso
-            if self.auto_step_timer >= self.auto_step_speed:
-                self.auto_step_timer = 0  # Reiniciar temporizador
-                self.step_forward()       # Ejecutar siguiente paso
+            # Cantidad de pasos que corresponden al tiempo acumulado
+            steps_due = int(self.auto_step_timer / step_interval)
+            if steps_due >= 1:
+                executed = self.run_steps(steps_due)
+                # Si el presupuesto del frame cortó el lote, no se acumula deuda de pasos
+                self.auto_step_timer = self.auto_step_timer - steps_due * step_interval if executed == steps_due else 0.0
+                if executed == 0 and not self.pathfinder.is_finished:
+                    self.toggle_auto_mode()  # No hay más pasos posibles (por ejemplo, no existe camino)
         
         # Si el algoritmo termina mientras está en modo auto, lo desactivamos
         if self.pathfinder.is_finished and self.is_auto_running:
@@ -325,7 +418,7 @@ class TestingScene(SceneBase):
              self._draw_node_scores(screen, node)
 
         # Dibujar UI
-        if not self.is_auto_running:
+        if not self.is_auto_running and not self.is_finishing:
             self.back_step_button.draw(screen)
             self.next_step_button.draw(screen)
             self.diagonal_button.draw(screen)
@@ -333,6 +426,8 @@ class TestingScene(SceneBase):
         self.switch_algo_button.draw(screen)
         self.auto_button.draw(screen)
         self.tree_button.draw(screen)
+        self.speed_button.draw(screen)
+        self.finish_button.draw(screen)
         
         info_font = pygame.font.SysFont('B612Mono', 24)
         info_text = info_font.render('Presiona ESC para volver al menu', True, config.WHITE)
@@ -0,0 +1,454 @@
+"""
+Benchmark de los algoritmos de búsqueda.
+
+Mide la tasa de expansión (iteraciones por segundo) de cada algoritmo sobre los
+mapas de assets/maps/ y sobre cuadrículas generadas aleatoriamente de mayor tamaño.
+
+Uso (desde la raíz del proyecto):
+    python -m utils.benchmark
+    python -m utils.benchmark --tamanos 64 128 --densidad 0.25 --diagonal
+"""
+import argparse
+import glob
+import math
+import os
+import random
+import time
+import tracemalloc
+
+import config
+from components.grid import Grid
+from components.agent import Agent
+from algorithms.a_star import AStarPathfinder
+from algorithms.dijkstra import DijkstraPathfinder
+from algorithms.greedy import GreedyPathfinder
+from algorithms.uniform_cost import UniformCostPathfinder
+from algorithms.jump_point import JumpPointPathfinder
+from algorithms.bidirectional import BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder
+from algorithms.hierarchical import HierarchicalPathfinder
+from algorithms.d_star_lite import DStarLitePathfinder
+from algorithms.wavefront import WavefrontPathfinder
+from algorithms.ara_star import ARAStarPathfinder
+from algorithms.ida_star import IDAStarPathfinder
+from algorithms.fringe_search import FringeSearchPathfinder
+from algorithms.sma_star import SMAStarPathfinder
+from algorithms.dial import DialPathfinder, DialAStarPathfinder
+from algorithms.bfs import BFSPathfinder
+from algorithms.auto import AutoPathfinder, elegir_motor
+from algorithms.cooperative_planner import PlanificadorCooperativo, celdas_de_salida
+from algorithms.batch_queries import ConsultorLotes
+from algorithms.heuristics import HEURISTICAS
+from algorithms.search_events import ContadorEventos, EXTRAER, INSERTAR, ACTUALIZAR
+
+ALGORITMOS = {
+    "A*": AStarPathfinder,
+    "Dijkstra": DijkstraPathfinder,
+    "Voraz": GreedyPathfinder,
+    "Costo U": UniformCostPathfinder,
+    "JPS": JumpPointPathfinder,
+    "A* Bidir": BidirectionalAStarPathfinder,
+    "Dijkstra Bidir": BidirectionalDijkstraPathfinder,
+    "HPA*": HierarchicalPathfinder,
+    "D* Lite": DStarLitePathfinder,
+    "Wavefront": WavefrontPathfinder,
+    "ARA*": ARAStarPathfinder,
+    "IDA*": IDAStarPathfinder,
+    "Fringe": FringeSearchPathfinder,
+    "SMA*": SMAStarPathfinder,
+    "Dial": DialPathfinder,
+    "A* Dial": DialAStarPathfinder,
+    "Auto": AutoPathfinder,
+}
+
+# --sma abandona una búsqueda de SMA* que supera esta cantidad de veces las iteraciones de A*
+SMA_TOPE_RELATIVO = 100
+
+# Motores óptimos entre los que --auto busca el más rápido. BFS no está en ALGORITMOS: solo es
+# óptimo sin diagonales, así que se usa únicamente desde Auto (y aquí, sin diagonales)
+CANDIDATOS_AUTO = {
+    "BFS": BFSPathfinder,
+    "A*": AStarPathfinder,
+    "A* Dial": DialAStarPathfinder,
+    "JPS": JumpPointPathfinder,
+    "A* Bidir": BidirectionalAStarPathfinder,
+    "Dijkstra Bidir": BidirectionalDijkstraPathfinder,
+}
+
+# Algoritmos que compara --memoria (IDA* y Fringe no guardan listas completas como A*)
+ALGORITMOS_MEMORIA = ("A*", "IDA*", "Fringe")
+
+
+def a_estrella_exacta(grilla, permitir_diagonal):
+    """A* con heurística perfecta (campo de distancias de la cuadrícula): cota inferior de expansiones."""
+    buscador = AStarPathfinder(grilla, permitir_diagonal)
+    buscador.usar_campo_distancias = True
+    return buscador
+
+
+def a_estrella_con_heuristica(nombre, peso=1.0):
+    """Fábrica de A* con la heurística `nombre` de HEURISTICAS y el peso indicado."""
+    def crear(grilla, permitir_diagonal):
+        buscador = AStarPathfinder(grilla, permitir_diagonal)
+        buscador.heuristica = nombre
+        buscador.peso_heuristica = peso
+        return buscador
+    return crear
+
+
+def generar_cuadricula(tamano, densidad, semilla=0):
+    """Crea una cuadrícula cuadrada con obstáculos aleatorios (reproducible por semilla)."""
+    grilla = Grid(cols=tamano, rows=tamano)
+    aleatorio = random.Random(semilla)
+    for x in range(tamano):
+        for y in range(tamano):
+            if (x, y) in (grilla.start_pos, grilla.end_pos):
+                continue
+            if aleatorio.random() < densidad:
+                grilla.set_obstacle((x, y), True)
+    return grilla
+
+
+def cargar_cuadricula(ruta_mapa):
+    """Carga un mapa JSON en una cuadrícula del tamaño de la pantalla."""
+    grilla = Grid()
+    grilla.load_map(ruta_mapa)
+    return grilla
+
+
+def medir(clase_algoritmo, grilla, permitir_diagonal, repeticiones=3):
+    """Ejecuta find_path varias veces y devuelve (iteraciones, mejor tiempo, largo del camino)."""
+    mejor_tiempo = float("inf")
+    iteraciones = 0
+    largo_camino = 0
+    for _ in range(repeticiones):
+        buscador = clase_algoritmo(grilla, permitir_diagonal)
+        inicio = time.perf_counter()
+        camino = buscador.find_path(grilla.start_pos, grilla.end_pos)
+        transcurrido = time.perf_counter() - inicio
+        mejor_tiempo = min(mejor_tiempo, transcurrido)
+        iteraciones = buscador.iterations
+        largo_camino = len(camino) if camino else 0
+    return iteraciones, mejor_tiempo, largo_camino
+
+
+def ejecutar(escenarios, permitir_diagonal, repeticiones, algoritmos=ALGORITMOS):
+    """Imprime una tabla con los resultados de cada algoritmo en cada escenario."""
+    print(f"Diagonal: {'ON' if permitir_diagonal else 'OFF'}")
+    print(f"{'escenario':<24}{'algoritmo':<12}{'iter':>8}{'ms':>10}{'iter/s':>12}{'camino':>8}")
+    for nombre_escenario, grilla in escenarios:
+        for nombre_algoritmo, clase_algoritmo in algoritmos.items():
+            iteraciones, tiempo, largo = medir(clase_algoritmo, grilla, permitir_diagonal, repeticiones)
+            tasa = iteraciones / tiempo if tiempo > 0 else 0.0
+            print(f"{nombre_escenario:<24}{nombre_algoritmo:<12}{iteraciones:>8}{tiempo * 1000:>10.2f}{tasa:>12.0f}{largo:>8}")
+
+
+def reporte_alt(escenarios, permitir_diagonal):
+    """Imprime, por escenario, las expansiones de A* con su heurística normal y con ALT."""
+    print(f"A* vs A* ALT (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'A*':>8}{'ALT':>8}{'reducción':>11}{'mismo costo':>13}")
+    for nombre_escenario, grilla in escenarios:
+        normal = AStarPathfinder(grilla, permitir_diagonal)
+        camino_normal = normal.find_path(grilla.start_pos, grilla.end_pos)
+        alt = AStarPathfinder(grilla, permitir_diagonal, heuristica='alt')
+        camino_alt = alt.find_path(grilla.start_pos, grilla.end_pos)
+        reduccion = 1 - alt.iterations / normal.iterations if normal.iterations else 0.0
+        mismo_costo = costo_camino(camino_normal) == costo_camino(camino_alt)
+        print(f"{nombre_escenario:<24}{normal.iterations:>8}{alt.iterations:>8}{reduccion:>10.0%}{'sí' if mismo_costo else 'NO':>13}")
+
+
+def reporte_dial(escenarios, permitir_diagonal, repeticiones=3):
+    """
+    Imprime, por escenario, el tiempo de Dijkstra y A* (montículo, costos flotantes) junto al de
+    sus versiones con cola de cubetas y costos enteros, y si los costos de los caminos coinciden.
+    """
+    pares = (("Dijkstra", DijkstraPathfinder, DialPathfinder), ("A*", AStarPathfinder, DialAStarPathfinder))
+    print(f"Montículo vs cubetas de Dial (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'algoritmo':<12}{'iter':>8}{'ms':>10}{'iter Dial':>11}{'ms Dial':>10}{'aceleración':>13}{'mismo costo':>13}")
+    for nombre_escenario, grilla in escenarios:
+        for nombre_algoritmo, clase_flotante, clase_dial in pares:
+            iteraciones, tiempo, _ = medir(clase_flotante, grilla, permitir_diagonal, repeticiones)
+            iteraciones_dial, tiempo_dial, _ = medir(clase_dial, grilla, permitir_diagonal, repeticiones)
+            camino = clase_flotante(grilla, permitir_diagonal).find_path(grilla.start_pos, grilla.end_pos)
+            camino_dial = clase_dial(grilla, permitir_diagonal).find_path(grilla.start_pos, grilla.end_pos)
+            aceleracion = tiempo / tiempo_dial if tiempo_dial > 0 else 0.0
+            mismo_costo = costo_camino(camino) == costo_camino(camino_dial)
+            print(f"{nombre_escenario:<24}{nombre_algoritmo:<12}{iteraciones:>8}{tiempo * 1000:>10.2f}{iteraciones_dial:>11}"
+                  f"{tiempo_dial * 1000:>10.2f}{aceleracion:>12.2f}x{'sí' if mismo_costo else 'NO':>13}")
+
+
+def reporte_auto(escenarios, permitir_diagonal, repeticiones=3):
+    """
+    Imprime, por escenario, el motor que elige Auto (y por qué) junto al más rápido de los
+    candidatos óptimos, y cuánto más lento es el elegido (1.00x = eligió el más rápido).
+    """
+    candidatos = [nombre for nombre in CANDIDATOS_AUTO if not (permitir_diagonal and nombre == "BFS")]
+    print(f"Elección de Auto (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'elegido':<10}{'ms':>8}{'más rápido':>14}{'ms':>8}{'relación':>10}  motivo")
+    for nombre_escenario, grilla in escenarios:
+        _, elegido, motivo = elegir_motor(grilla, permitir_diagonal)
+        tiempos = {nombre: medir(CANDIDATOS_AUTO[nombre], grilla, permitir_diagonal, repeticiones)[1] for nombre in candidatos}
+        mas_rapido = min(tiempos, key=tiempos.get)
+        relacion = tiempos[elegido] / tiempos[mas_rapido] if tiempos[mas_rapido] > 0 else 0.0
+        print(f"{nombre_escenario:<24}{elegido:<10}{tiempos[elegido] * 1000:>8.2f}{mas_rapido:>14}"
+              f"{tiempos[mas_rapido] * 1000:>8.2f}{relacion:>9.2f}x  {motivo}")
+
+
+def medir_memoria(clase_algoritmo, grilla, permitir_diagonal):
+    """
+    Pico de memoria (en bytes) que reserva una búsqueda con find_path. Antes se hace una búsqueda
+    sin medir para que las estructuras compartidas (tabla de adyacencia, tablas de heurística)
+    ya existan y no se cuenten.
+    """
+    clase_algoritmo(grilla, permitir_diagonal).find_path(grilla.start_pos, grilla.end_pos)
+    buscador = clase_algoritmo(grilla, permitir_diagonal)
+    tracemalloc.start()
+    try:
+        buscador.find_path(grilla.start_pos, grilla.end_pos)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def reporte_memoria(escenarios, permitir_diagonal, nombres=ALGORITMOS_MEMORIA):
+    """Imprime el pico de memoria de cada algoritmo y su proporción respecto de A*."""
+    print(f"Pico de memoria por búsqueda (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'algoritmo':<12}{'KiB':>10}{'vs A*':>8}")
+    for nombre_escenario, grilla in escenarios:
+        referencia = None
+        for nombre_algoritmo in nombres:
+            pico = medir_memoria(ALGORITMOS[nombre_algoritmo], grilla, permitir_diagonal)
+            if referencia is None:
+                referencia = pico
+            proporcion = pico / referencia if referencia else 0.0
+            print(f"{nombre_escenario:<24}{nombre_algoritmo:<12}{pico / 1024:>10.1f}{proporcion:>8.2f}")
+
+
+def reporte_sma(escenarios, permitir_diagonal, limites, repeticiones=3, tope_relativo=SMA_TOPE_RELATIVO):
+    """
+    Imprime, por escenario, el tiempo de A* y el de SMA* con cada límite de nodos, junto con
+    cuántos nodos olvidó y regeneró, el pico de nodos en memoria y si el costo coincide con A*.
+    Con un límite muy justo SMA* puede olvidar y regenerar casi sin fin: se corta al superar
+    `tope_relativo` veces las iteraciones de A*.
+    """
+    print(f"SMA* vs A* (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'límite':>8}{'iter':>9}{'ms':>10}{'podas':>9}{'regen':>8}{'pico':>7}{'mismo costo':>13}")
+    for nombre_escenario, grilla in escenarios:
+        iteraciones, tiempo, _ = medir(AStarPathfinder, grilla, permitir_diagonal, repeticiones)
+        costo_referencia = costo_camino(AStarPathfinder(grilla, permitir_diagonal).find_path(grilla.start_pos, grilla.end_pos))
+        print(f"{nombre_escenario:<24}{'A*':>8}{iteraciones:>9}{tiempo * 1000:>10.2f}")
+        for limite in limites:
+            mejor_tiempo = float("inf")
+            for _ in range(repeticiones):
+                buscador = SMAStarPathfinder(grilla, permitir_diagonal, limite)
+                inicio = time.perf_counter()
+                buscador.initialize_search(grilla.start_pos, grilla.end_pos)
+                cortado = buscador.run_steps(iteraciones * tope_relativo) == iteraciones * tope_relativo
+                mejor_tiempo = min(mejor_tiempo, time.perf_counter() - inicio)
+                if cortado and not buscador.is_finished:
+                    break  # No tiene sentido repetir una búsqueda que no termina
+            if cortado and not buscador.is_finished:
+                resultado = "cortado"
+            else:
+                resultado = "sí" if costo_camino(buscador.path) == costo_referencia else "NO"
+            print(f"{'':<24}{limite:>8}{buscador.iterations:>9}{mejor_tiempo * 1000:>10.2f}{buscador.podas:>9}"
+                  f"{buscador.regeneraciones:>8}{buscador.pico_nodos:>7}{resultado:>13}")
+
+
+def reporte_cooperativo(escenarios, permitir_diagonal, cantidades, limite_pasos=2000):
+    """
+    Imprime, por escenario y cantidad de agentes (que salen alrededor del inicio hacia el fin),
+    cuántos llegaron, en cuántos pasos, el tiempo medio y máximo por paso, las expansiones por
+    paso y cuántos movimientos hubo que cancelar al ejecutarlos.
+    """
+    print(f"Planificación cooperativa WHCA* (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'agentes':>8}{'llegaron':>9}{'pasos':>7}{'ms/paso':>9}{'ms máx':>8}{'exp/paso':>10}{'esperas':>9}")
+    for nombre_escenario, grilla in escenarios:
+        if grilla.obtener_campo_distancias(grilla.end_pos, permitir_diagonal).distancia(grilla.start_pos) == float("inf"):
+            print(f"{nombre_escenario:<24}{'sin camino':>8}")
+            continue
+        for cantidad in cantidades:
+            planificador = PlanificadorCooperativo(grilla, permitir_diagonal)
+            for celda in celdas_de_salida(grilla, grilla.start_pos, cantidad, permitir_diagonal):
+                planificador.agregar_agente(Agent(celda, (0, 0, 0)), grilla.end_pos)
+            planificador.planificar_nuevos()
+            expansiones_iniciales = planificador.expansiones
+            total_ms = 0.0
+            pasos = 0
+            while planificador.activos() and pasos < limite_pasos:
+                planificador.avanzar()
+                total_ms += planificador.ultimo_ms
+                pasos += 1
+            media = total_ms / pasos if pasos else 0.0
+            expansiones = (planificador.expansiones - expansiones_iniciales) / pasos if pasos else 0.0
+            print(f"{nombre_escenario:<24}{len(planificador.agentes):>8}{len(planificador.llegados):>9}{pasos:>7}"
+                  f"{media:>9.2f}{planificador.maximo_ms:>8.2f}{expansiones:>10.0f}{planificador.esperas_forzadas:>9}")
+
+
+def reporte_replanificacion(escenarios, permitir_diagonal, cambios, semilla=0):
+    """
+    Alterna `cambios` celdas al azar en cada escenario y, tras cada cambio, repara el camino con
+    D* Lite y lo compara con una búsqueda nueva de Dijkstra. Imprime las expansiones medias de la
+    reparación y cuántas veces difirieron los costos (debe ser 0). Las cuadrículas quedan modificadas.
+    """
+    print(f"Replanificación incremental D* Lite (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'cambios':>8}{'exp D*':>9}{'exp Dijk':>10}{'distintos':>11}")
+    aleatorio = random.Random(semilla)
+    for nombre_escenario, grilla in escenarios:
+        buscador = DStarLitePathfinder(grilla, permitir_diagonal)
+        buscador.find_path(grilla.start_pos, grilla.end_pos)
+        expansiones_d = expansiones_dijkstra = distintos = 0
+        for _ in range(cambios):
+            posicion = (aleatorio.randrange(grilla.columnas), aleatorio.randrange(grilla.filas))
+            if posicion not in (grilla.start_pos, grilla.end_pos):
+                grilla.toggle_obstacle(posicion)
+            camino = buscador.replanificar(grilla.start_pos)
+            expansiones_d += buscador.iteraciones
+            referencia = DijkstraPathfinder(grilla, permitir_diagonal)
+            camino_referencia = referencia.find_path(grilla.start_pos, grilla.end_pos)
+            expansiones_dijkstra += referencia.iteraciones
+            if costo_camino(camino) != costo_camino(camino_referencia):
+                distintos += 1
+        print(f"{nombre_escenario:<24}{cambios:>8}{expansiones_d / cambios:>9.0f}"
+              f"{expansiones_dijkstra / cambios:>10.0f}{distintos:>11}")
+
+
+def pares_aleatorios(grilla, cantidad, semilla=0):
+    """Pares (inicio, fin) de celdas libres elegidas al azar (reproducibles por semilla)."""
+    libres = [grilla.posicion(indice) for indice, estado in enumerate(grilla.celdas) if estado != config.STATE_OBSTACLE]
+    aleatorio = random.Random(semilla)
+    return [(aleatorio.choice(libres), aleatorio.choice(libres)) for _ in range(cantidad)]
+
+
+def reporte_lote(escenarios, permitir_diagonal, consultas, procesos, nombre_algoritmo="A*"):
+    """
+    Imprime, por escenario, el tiempo de resolver `consultas` pares aleatorios uno tras otro en este
+    proceso y repartidos entre `procesos` procesos (incluye crear los procesos y enviarles la
+    cuadrícula), y si los costos coinciden.
+    """
+    clase_algoritmo = ALGORITMOS[nombre_algoritmo]
+    print(f"Consultas en lote con {nombre_algoritmo} (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'consultas':>10}{'serie ms':>10}{'lote ms':>10}{'procesos':>9}{'aceleración':>13}{'mismo costo':>13}")
+    for nombre_escenario, grilla in escenarios:
+        pares = pares_aleatorios(grilla, consultas)
+        inicio = time.perf_counter()
+        costos_serie = [costo_camino(clase_algoritmo(grilla, permitir_diagonal).find_path(a, b)) for a, b in pares]
+        tiempo_serie = time.perf_counter() - inicio
+        costos_lote = [None] * len(pares)
+        inicio = time.perf_counter()
+        with ConsultorLotes(grilla, clase_algoritmo, permitir_diagonal, procesos) as consultor:
+            for resultado in consultor.consultar(pares):
+                costos_lote[resultado.indice] = costo_camino(resultado.camino)
+            usados = consultor.procesos
+        tiempo_lote = time.perf_counter() - inicio
+        aceleracion = tiempo_serie / tiempo_lote if tiempo_lote > 0 else 0.0
+        coinciden = "sí" if costos_lote == costos_serie else "NO"
+        print(f"{nombre_escenario:<24}{consultas:>10}{tiempo_serie * 1000:>10.0f}{tiempo_lote * 1000:>10.0f}{usados:>9}"
+              f"{aceleracion:>12.2f}x{coinciden:>13}")
+
+
+def reporte_eventos(escenarios, permitir_diagonal, algoritmos=ALGORITMOS):
+    """Imprime cuántos nodos extrae, inserta y actualiza cada algoritmo (contados con un oyente de eventos)."""
+    print(f"Eventos de búsqueda (diagonal: {'ON' if permitir_diagonal else 'OFF'})")
+    print(f"{'escenario':<24}{'algoritmo':<16}{'extraer':>9}{'insertar':>10}{'actualizar':>12}")
+    for nombre_escenario, grilla in escenarios:
+        for nombre_algoritmo, clase_algoritmo in algoritmos.items():
+            buscador = clase_algoritmo(grilla, permitir_diagonal)
+            contador = ContadorEventos()
+            buscador.oyente = contador
+            buscador.find_path(grilla.start_pos, grilla.end_pos)
+            print(f"{nombre_escenario:<24}{nombre_algoritmo:<16}{contador[EXTRAER]:>9}{contador[INSERTAR]:>10}{contador[ACTUALIZAR]:>12}")
+
+
+def costo_camino(camino):
+    """Costo total de un camino (1 por paso recto, √2 por paso diagonal), redondeado."""
+    if not camino:
+        return None
+    return round(sum(math.hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(camino, camino[1:])), 6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tasa de expansión de los algoritmos.")
+    parser.add_argument("--tamanos", type=int, nargs="*", default=[64, 128], help="Lados de las cuadrículas generadas")
+    parser.add_argument("--densidad", type=float, default=0.25, help="Proporción de obstáculos en las cuadrículas generadas")
+    parser.add_argument("--diagonal", action="store_true", help="Permitir movimiento diagonal")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    parser.add_argument("--sin-mapas", action="store_true", help="No incluir los mapas de assets/maps/")
+    parser.add_argument("--heuristica-exacta", action="store_true",
+                        help="Agregar A* con heurística perfecta (el campo de distancias se calcula en la primera repetición)")
+    parser.add_argument("--heuristicas", action="store_true",
+                        help="Agregar A* con cada heurística de algorithms/heuristics.py")
+    parser.add_argument("--peso", type=float, default=1.0,
+                        help="Peso de las heurísticas de --heuristicas (> 1: A* ponderado)")
+    parser.add_argument("--alt", action="store_true",
+                        help="En lugar de la tabla general, comparar las expansiones de A* con y sin heurística ALT")
+    parser.add_argument("--memoria", action="store_true",
+                        help="En lugar de la tabla general, comparar el pico de memoria de A*, IDA* y Fringe Search")
+    parser.add_argument("--eventos", action="store_true",
+                        help="En lugar de la tabla general, contar los eventos (extraer/insertar/actualizar) de cada algoritmo")
+    parser.add_argument("--dial", action="store_true",
+                        help="En lugar de la tabla general, comparar Dijkstra y A* con sus versiones de cubetas de Dial (costos enteros)")
+    parser.add_argument("--auto", action="store_true",
+                        help="En lugar de la tabla general, comparar el motor que elige Auto con el más rápido de los óptimos")
+    parser.add_argument("--sma", action="store_true",
+                        help="En lugar de la tabla general, comparar SMA* con distintos límites de nodos contra A*")
+    parser.add_argument("--limites", type=int, nargs="*", default=[500, 2000, 10000],
+                        help="Límites de nodos en memoria que prueba --sma")
+    parser.add_argument("--cooperativo", type=int, nargs="*", metavar="AGENTES",
+                        help="En lugar de la tabla general, mover esas cantidades de agentes sin choques (WHCA*), p. ej. 12 24 48")
+    parser.add_argument("--lote", type=int, metavar="CONSULTAS",
+                        help="En lugar de la tabla general, resolver esa cantidad de pares aleatorios en serie y repartidos entre procesos")
+    parser.add_argument("--replanificacion", type=int, metavar="CAMBIOS",
+                        help="En lugar de la tabla general, alternar esa cantidad de celdas al azar y verificar que D* Lite repare el camino con el costo de Dijkstra")
+    parser.add_argument("--procesos", type=int, default=config.BATCH_WORKERS,
+                        help="Procesos de trabajo de --lote (por defecto, uno por núcleo)")
+    parser.add_argument("--algoritmo", default="A*", choices=list(ALGORITMOS),
+                        help="Algoritmo que usa --lote")
+    args = parser.parse_args()
+
+    escenarios = []
+    if not args.sin_mapas:
+        for ruta in sorted(glob.glob(os.path.join("assets", "maps", "*.json"))):
+            escenarios.append((os.path.basename(ruta), cargar_cuadricula(ruta)))
+    for tamano in args.tamanos:
+        escenarios.append((f"generado {tamano}x{tamano}", generar_cuadricula(tamano, args.densidad)))
+
+    if args.alt:
+        reporte_alt(escenarios, args.diagonal)
+        return
+    if args.memoria:
+        reporte_memoria(escenarios, args.diagonal)
+        return
+    if args.eventos:
+        reporte_eventos(escenarios, args.diagonal)
+        return
+    if args.dial:
+        reporte_dial(escenarios, args.diagonal, args.repeticiones)
+        return
+    if args.auto:
+        reporte_auto(escenarios, args.diagonal, args.repeticiones)
+        return
+    if args.sma:
+        reporte_sma(escenarios, args.diagonal, args.limites, args.repeticiones)
+        return
+    if args.cooperativo:
+        reporte_cooperativo(escenarios, args.diagonal, args.cooperativo)
+        return
+    if args.replanificacion:
+        reporte_replanificacion(escenarios, args.diagonal, args.replanificacion)
+        return
+    if args.lote:
+        reporte_lote(escenarios, args.diagonal, args.lote, args.procesos, args.algoritmo)
+        return
+
+    algoritmos = dict(ALGORITMOS)
+    if args.heuristica_exacta:
+        algoritmos["A* h*"] = a_estrella_exacta
+    if args.heuristicas:
+        for nombre in HEURISTICAS:
+            algoritmos[f"A* {nombre}"] = a_estrella_con_heuristica(nombre, args.peso)
+    ejecutar(escenarios, args.diagonal, args.repeticiones, algoritmos)
+
+
+if __name__ == "__main__":
+    main()
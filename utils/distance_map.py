@@ -0,0 +1,62 @@
+"""
+Análisis masivo de distancias con la transformada vectorizada (NumPy).
+
+Calcula, para cada escenario, la distancia desde el inicio a todas las celdas del
+mapa y resume cuántas son alcanzables, la distancia máxima y la media. Con
+--comparar mide también el campo de distancias en Python puro (celda por celda).
+
+Uso (desde la raíz del proyecto):
+    python -m utils.distance_map --tamanos 1000 --sin-mapas --comparar
+    python -m utils.distance_map --tamanos 256 512 --densidad 0.3 --diagonal
+"""
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+
+from algorithms.distance_field import CampoDistancias
+from algorithms.wavefront import transformada_distancias
+from utils.benchmark import generar_cuadricula, cargar_cuadricula
+
+
+def analizar(grilla, origen, permitir_diagonal=False):
+    """Devuelve (alcanzables, distancia máxima, distancia media, segundos) desde `origen`."""
+    inicio = time.perf_counter()
+    distancias, _ = transformada_distancias(grilla, origen, permitir_diagonal)
+    transcurrido = time.perf_counter() - inicio
+    finitas = distancias[np.isfinite(distancias)]
+    return int(finitas.size), float(finitas.max()), float(finitas.mean()), transcurrido
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mapa de distancias completo con NumPy.")
+    parser.add_argument("--tamanos", type=int, nargs="*", default=[256, 1000], help="Lados de las cuadrículas generadas")
+    parser.add_argument("--densidad", type=float, default=0.25, help="Proporción de obstáculos en las cuadrículas generadas")
+    parser.add_argument("--diagonal", action="store_true", help="Permitir movimiento diagonal (distancia octil)")
+    parser.add_argument("--sin-mapas", action="store_true", help="No incluir los mapas de assets/maps/")
+    parser.add_argument("--comparar", action="store_true", help="Medir también el campo de distancias en Python puro")
+    args = parser.parse_args()
+
+    escenarios = []
+    if not args.sin_mapas:
+        for ruta in sorted(glob.glob(os.path.join("assets", "maps", "*.json"))):
+            escenarios.append((os.path.basename(ruta), cargar_cuadricula(ruta)))
+    for tamano in args.tamanos:
+        escenarios.append((f"generado {tamano}x{tamano}", generar_cuadricula(tamano, args.densidad)))
+
+    print(f"Diagonal: {'ON' if args.diagonal else 'OFF'}")
+    print(f"{'escenario':<24}{'alcanzables':>12}{'max':>10}{'media':>10}{'numpy ms':>10}{'python ms':>11}")
+    for nombre, grilla in escenarios:
+        alcanzables, maxima, media, tiempo = analizar(grilla, grilla.start_pos, args.diagonal)
+        python_ms = ""
+        if args.comparar:
+            inicio = time.perf_counter()
+            CampoDistancias(grilla, grilla.start_pos, args.diagonal)
+            python_ms = f"{(time.perf_counter() - inicio) * 1000:.0f}"
+        print(f"{nombre:<24}{alcanzables:>12}{maxima:>10.1f}{media:>10.1f}{tiempo * 1000:>10.0f}{python_ms:>11}")
+
+
+if __name__ == "__main__":
+    main()